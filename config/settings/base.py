@@ -45,6 +45,7 @@ LOCAL_APPS = [
     "projecthub.tasks",
     "projecthub.comments",
     "projecthub.attachments",
+    "projecthub.notifications",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -135,6 +136,15 @@ LOGGING = {
 REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAdminUser",),
     "EXCEPTION_HANDLER": "projecthub.core.utils.custom_exception_handler",
+    "DEFAULT_RENDERER_CLASSES": (
+        "projecthub.core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "projecthub.core.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 
@@ -191,3 +201,70 @@ EMAIL_USE_TLS = env("EMAIL_USE_TLS", default=True)
 EMAIL_HOST_USER = env("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL")
+
+
+# tenant resolution cache used by `TenantMiddleware`
+TENANT_CACHE_MAX_SIZE = env.int("TENANT_CACHE_MAX_SIZE", default=1024)
+TENANT_CACHE_TIMEOUT = env.int("TENANT_CACHE_TIMEOUT", default=30)
+TENANT_CACHE_SHARED_TIMEOUT = env.int("TENANT_CACHE_SHARED_TIMEOUT", default=300)
+TENANT_CACHE_ALIAS = env("TENANT_CACHE_ALIAS", default=None)
+
+# per-user index of tenant and project roles used by policies and visibility
+# filters; cached in the shared tier only (loaded on every request without it)
+ROLE_INDEX_CACHE_SHARED_TIMEOUT = env.int(
+    "ROLE_INDEX_CACHE_SHARED_TIMEOUT", default=300
+)
+ROLE_INDEX_CACHE_ALIAS = env("ROLE_INDEX_CACHE_ALIAS", default=None)
+
+# versioned cache of project and task list responses: in-process tier
+# (entries, TTL) and shared tier (alias of a `CACHES` entry, e.g. one with
+# `django.core.cache.backends.redis.RedisCache`; responses aren't cached
+# without it), plus how long a lock of missing entry is held and how long
+# others wait for it
+RESPONSE_CACHE_MAX_SIZE = env.int("RESPONSE_CACHE_MAX_SIZE", default=512)
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=30)
+RESPONSE_CACHE_SHARED_TIMEOUT = env.int("RESPONSE_CACHE_SHARED_TIMEOUT", default=300)
+RESPONSE_CACHE_ALIAS = env("RESPONSE_CACHE_ALIAS", default=None)
+RESPONSE_CACHE_LOCK_TIMEOUT = env.int("RESPONSE_CACHE_LOCK_TIMEOUT", default=10)
+RESPONSE_CACHE_LOCK_WAIT = env.float("RESPONSE_CACHE_LOCK_WAIT", default=2)
+
+# notification outbox: notifications sent per batch (one mail connection),
+# batches per dispatcher run, attempts before giving up, base retry delay
+# (in seconds, doubled with every failed attempt) and how long claimed
+# notifications are hidden from other dispatchers while being sent
+NOTIFICATION_BATCH_SIZE = env.int("NOTIFICATION_BATCH_SIZE", default=200)
+NOTIFICATION_MAX_BATCHES = env.int("NOTIFICATION_MAX_BATCHES", default=50)
+NOTIFICATION_MAX_ATTEMPTS = env.int("NOTIFICATION_MAX_ATTEMPTS", default=5)
+NOTIFICATION_RETRY_DELAY = env.int("NOTIFICATION_RETRY_DELAY", default=60)
+NOTIFICATION_CLAIM_TIMEOUT = env.int("NOTIFICATION_CLAIM_TIMEOUT", default=300)
+
+# daily reminders: rows fetched per database round trip
+# and notifications inserted per query
+TASK_REMINDERS_CHUNK_SIZE = env.int("TASK_REMINDERS_CHUNK_SIZE", default=2000)
+TASK_REMINDERS_BATCH_SIZE = env.int("TASK_REMINDERS_BATCH_SIZE", default=100)
+
+# projects archived/activated per transaction by lifecycle jobs
+PROJECT_LIFECYCLE_CHUNK_SIZE = env.int("PROJECT_LIFECYCLE_CHUNK_SIZE", default=500)
+
+# direct uploads of attachments (see `attachments.uploads`): storage whose
+# bucket files are uploaded to, largest accepted file, size from which files
+# are uploaded in parts (and size of parts) and lifetime of presigned requests
+ATTACHMENT_UPLOAD_STORAGE = env("ATTACHMENT_UPLOAD_STORAGE", default="default")
+ATTACHMENT_MAX_SIZE = env.int("ATTACHMENT_MAX_SIZE", default=100 * 1024 * 1024)
+ATTACHMENT_MULTIPART_THRESHOLD = env.int(
+    "ATTACHMENT_MULTIPART_THRESHOLD", default=32 * 1024 * 1024
+)
+ATTACHMENT_MULTIPART_PART_SIZE = env.int(
+    "ATTACHMENT_MULTIPART_PART_SIZE", default=16 * 1024 * 1024
+)
+ATTACHMENT_UPLOAD_EXPIRES = env.int("ATTACHMENT_UPLOAD_EXPIRES", default=3600)
+
+# presigned URLs of files (see `PresignedURLCache`): URLs kept in process,
+# seconds before expiration of URL it is no longer handed out, and alias of
+# cache summing stats of all processes (published every interval seconds)
+PRESIGNED_URL_CACHE_MAX_SIZE = env.int("PRESIGNED_URL_CACHE_MAX_SIZE", default=4096)
+PRESIGNED_URL_CACHE_MARGIN = env.int("PRESIGNED_URL_CACHE_MARGIN", default=300)
+PRESIGNED_URL_CACHE_ALIAS = env("PRESIGNED_URL_CACHE_ALIAS", default=None)
+PRESIGNED_URL_CACHE_STATS_INTERVAL = env.int(
+    "PRESIGNED_URL_CACHE_STATS_INTERVAL", default=60
+)
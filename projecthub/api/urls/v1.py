@@ -1,8 +1,13 @@
 from django.urls import path
 
+from projecthub.attachments.api.views import (
+    AttachmentListCreateAPIView,
+    AttachmentUploadAPIView,
+)
 from projecthub.comments.api.v1.views import (
     CommentListCreateAPIView,
     CommentDestroyAPIView,
+    CommentThreadListAPIView,
 )
 from projecthub.core.api.v1.views import (
     TenantListCreateAPIView,
@@ -21,6 +26,10 @@ from projecthub.tasks.api.v1.views import (
     TaskRetrieveUpdateDestroyAPIView,
     BoardListCreateAPIView,
     BoardRetrieveUpdateDestroyAPIView,
+    KanbanAPIView,
+    ProjectStatsAPIView,
+    TaskBulkAPIView,
+    TaskBulkMoveAPIView,
 )
 
 app_name = "v1"
@@ -62,6 +71,16 @@ urlpatterns = [
         TaskListCreateAPIView.as_view(),
         name="task_list",
     ),
+    path(
+        "projects/<uuid:project_id>/tasks/bulk/",
+        TaskBulkAPIView.as_view(),
+        name="task_bulk",
+    ),
+    path(
+        "projects/<uuid:project_id>/tasks/bulk/move/",
+        TaskBulkMoveAPIView.as_view(),
+        name="task_bulk_move",
+    ),
     path(
         "projects/<uuid:project_id>/tasks/<uuid:pk>/",
         TaskRetrieveUpdateDestroyAPIView.as_view(),
@@ -77,14 +96,39 @@ urlpatterns = [
         BoardRetrieveUpdateDestroyAPIView.as_view(),
         name="board_detail",
     ),
+    path(
+        "projects/<uuid:project_id>/kanban/",
+        KanbanAPIView.as_view(),
+        name="kanban",
+    ),
+    path(
+        "projects/<uuid:project_id>/stats/",
+        ProjectStatsAPIView.as_view(),
+        name="project_stats",
+    ),
     path(
         "tasks/<uuid:task_id>/comments/",
         CommentListCreateAPIView.as_view(),
         name="comment_list",
     ),
+    path(
+        "tasks/<uuid:task_id>/comments/threads/",
+        CommentThreadListAPIView.as_view(),
+        name="comment_thread_list",
+    ),
     path(
         "tasks/<uuid:task_id>/comments/<uuid:pk>/",
         CommentDestroyAPIView.as_view(),
         name="comment_detail",
     ),
+    path(
+        "tasks/<uuid:task_id>/attachments/",
+        AttachmentListCreateAPIView.as_view(),
+        name="attachment_list",
+    ),
+    path(
+        "tasks/<uuid:task_id>/attachments/uploads/",
+        AttachmentUploadAPIView.as_view(),
+        name="attachment_upload",
+    ),
 ]
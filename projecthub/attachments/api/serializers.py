@@ -1,25 +1,103 @@
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import SuspiciousFileOperation
+from django.utils.text import get_valid_filename
 from rest_framework import serializers
 
-from projecthub.core.api.v1.serializers.base import UserNestedSerializer
+from projecthub.comments.models import Comment
+from projecthub.core.api.v1.serializers.base import (
+    PresignedFileField,
+    UserNestedSerializer,
+)
 from ..models import Attachment
+from ..uploads import load_upload
 
 
 class AttachmentReadSerializer(serializers.Serializer):
     id = serializers.UUIDField()
-    file = serializers.FileField()
+    file = PresignedFileField()
     uploaded_by = UserNestedSerializer()
     uploaded_at = serializers.DateTimeField()
 
     # TODO: add nested serializers
-    task = serializers.UUIDField()
-    comment = serializers.UUIDField()
+    task = serializers.UUIDField(source="task_id")
+    comment = serializers.UUIDField(source="comment_id")
 
 
-class AttachmentWriteSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Attachment
-        fields = ("id", "file", "task", "comment")
+class AttachmentUploadSerializer(serializers.Serializer):
+    """File about to be uploaded, attached to task or to its `comment`."""
 
-    # TODO
-    def validate_file(self, file):
-        pass
+    filename = serializers.CharField(max_length=255)
+    size = serializers.IntegerField(min_value=1)
+    content_type = serializers.CharField(
+        max_length=255, default="application/octet-stream"
+    )
+    comment = serializers.UUIDField(required=False, allow_null=True)
+
+    def validate_filename(self, filename):
+        try:
+            get_valid_filename(filename)
+        except SuspiciousFileOperation:
+            raise serializers.ValidationError("Invalid file name.")
+        return filename
+
+    def validate_size(self, size):
+        if size > settings.ATTACHMENT_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"Ensure file has at most {settings.ATTACHMENT_MAX_SIZE} bytes."
+            )
+        return size
+
+    def validate_comment(self, comment_id):
+        task_id = self.context["view"].kwargs["task_id"]
+        if (
+            comment_id
+            and not Comment.objects.filter(pk=comment_id, task_id=task_id).exists()
+        ):
+            raise serializers.ValidationError("Comment does not exist.")
+        return comment_id
+
+
+class UploadedPartSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1)
+    etag = serializers.CharField(max_length=255)
+
+
+class AttachmentConfirmSerializer(serializers.Serializer):
+    """
+    Confirmation of finished upload by its `upload` token, with `parts`
+    uploaded to multipart uploads.
+    """
+
+    upload = serializers.CharField()
+    parts = UploadedPartSerializer(many=True, required=False)
+
+    def validate_upload(self, token):
+        try:
+            upload = load_upload(token)
+        except signing.BadSignature:
+            raise serializers.ValidationError("Invalid or expired upload.")
+
+        # bound to task and user it was started for
+        request = self.context["request"]
+        if upload["task"] != str(self.context["view"].kwargs["task_id"]) or upload[
+            "user"
+        ] != str(request.user.pk):
+            raise serializers.ValidationError("Invalid or expired upload.")
+        # concurrent confirmations are settled by unique `Attachment.file`
+        if Attachment.objects.filter(file=upload["name"]).exists():
+            raise serializers.ValidationError("Upload has already been confirmed.")
+        return upload
+
+    def validate(self, attrs):
+        upload = attrs["upload"]
+        if upload["upload_id"] and not attrs.get("parts"):
+            raise serializers.ValidationError({"parts": "Uploaded parts are required."})
+        if (
+            upload["comment"]
+            and not Comment.objects.filter(
+                pk=upload["comment"], task_id=upload["task"]
+            ).exists()
+        ):
+            raise serializers.ValidationError("Comment does not exist.")
+        return attrs
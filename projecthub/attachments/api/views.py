@@ -1,5 +1,6 @@
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, status
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
 from projecthub.permissions import (
@@ -16,6 +17,13 @@ from projecthub.policies import (
     IsProjectStaffPolicy,
     IsTaskResponsiblePolicy,
 )
+from .serializers import (
+    AttachmentConfirmSerializer,
+    AttachmentReadSerializer,
+    AttachmentUploadSerializer,
+)
+from ..models import Attachment
+from ..uploads import UploadError, confirm_upload, start_upload
 
 
 # TODO::
@@ -43,7 +51,50 @@ class BaseAttachmentAPIView(SecureGenericAPIView):
         raise NotImplementedError("Subclasses must implement this method.")
 
 
+class AttachmentUploadAPIView(BaseAttachmentAPIView):
+    """
+    First phase of upload of attachment of task or of its comment: returns
+    presigned request(s) uploading the file straight to object storage and
+    `upload` token confirming it (see `projecthub.attachments.uploads`).
+
+    Permissions:
+        - POST: admin, tenant owner, project staff and task responsible
+    """
+
+    permission_classes = [
+        permissions.IsAdminUser
+        | IsTenantOwnerPermission
+        | IsProjectStaffPermission
+        | IsTaskResponsiblePermission
+    ]
+    serializer_class = AttachmentUploadSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = start_upload(
+            task_id=self.kwargs["task_id"],
+            user_id=request.user.pk,
+            comment_id=serializer.validated_data.get("comment"),
+            filename=serializer.validated_data["filename"],
+            size=serializer.validated_data["size"],
+            content_type=serializer.validated_data["content_type"],
+        )
+        return Response(upload, status=status.HTTP_201_CREATED)
+
+    def get_project_id(self):
+        return self.request.access.task.project_id
+
+
 class AttachmentListCreateAPIView(BaseAttachmentAPIView, generics.ListCreateAPIView):
+    """
+    Attachments of task and of its comments.
+
+    Files are not uploaded here: POST is the second phase of upload started
+    by `AttachmentUploadAPIView`, registering the attachment once its file
+    has been uploaded.
+    """
+
     pagination_class = AttachmentPagination
     permission_classes = [
         permissions.IsAdminUser
@@ -53,6 +104,39 @@ class AttachmentListCreateAPIView(BaseAttachmentAPIView, generics.ListCreateAPIV
         | ReadOnlyPermission
     ]
 
+    def get_queryset(self):
+        qs = Attachment.objects.for_tenant(self.request.tenant)
+        return qs.for_task_and_comments(self.kwargs["task_id"])
+
+    def get_serializer_class(self):
+        if self.request.method == "POST":
+            return AttachmentConfirmSerializer
+        return AttachmentReadSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        parts = [
+            (part["part_number"], part["etag"])
+            for part in serializer.validated_data.get("parts", [])
+        ]
+        try:
+            attachment = confirm_upload(
+                serializer.validated_data["upload"], request.user, parts
+            )
+        except UploadError as error:
+            return Response(
+                {"upload": [str(error)]}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = AttachmentReadSerializer(
+            attachment, context=self.get_serializer_context()
+        )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def get_project_id(self):
+        return self.request.access.task.project_id
+
 
 class AttachmentRetrieveDestroyAPIView(
     BaseAttachmentAPIView, generics.RetrieveDestroyAPIView
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:05
+
+from django.db import migrations, models
+
+
+def count(queryset):
+    counts = queryset.order_by().annotate(
+        count=models.Func(
+            models.F("pk"), function="COUNT", output_field=models.IntegerField()
+        )
+    )
+    return models.Subquery(counts.values("count")[:1])
+
+
+def remove_duplicate_files(apps, schema_editor):
+    """
+    Files were stored with overwriting, so rows with the same name share one
+    object, the one uploaded last. Keep the last uploaded row of every name
+    and drop the older ones, their files were overwritten.
+    """
+    Task = apps.get_model("tasks", "Task")
+    Attachment = apps.get_model("attachments", "Attachment")
+
+    names = list(
+        Attachment.objects.order_by()
+        .values("file")
+        .annotate(rows=models.Count("pk"))
+        .filter(rows__gt=1)
+        .values_list("file", flat=True)
+    )
+    task_ids = set()
+    for name in names:
+        duplicates = (
+            Attachment.objects.filter(file=name)
+            .select_related("comment")
+            .order_by("-uploaded_at", "-pk")[1:]
+        )
+        for attachment in duplicates:
+            task_ids.add(attachment.task_id or attachment.comment.task_id)
+            attachment.delete()
+
+    # counters aren't updated by signals in migrations
+    attachments = Attachment.objects.filter(
+        models.Q(task=models.OuterRef("pk"))
+        | models.Q(comment__task=models.OuterRef("pk"))
+    )
+    Task.objects.filter(pk__in=task_ids).update(attachment_count=count(attachments))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attachments", "0003_remove_taskattachment_task_and_more"),
+        ("tasks", "0008_task_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_files, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attachments", "0004_remove_duplicate_files"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="attachment",
+            constraint=models.UniqueConstraint(
+                fields=("file",), name="unique_attachment_file"
+            ),
+        ),
+    ]
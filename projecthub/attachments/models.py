@@ -22,6 +22,12 @@ class AttachmentQuerySet(models.QuerySet):
     def for_comment(self, comment_id):
         return self.filter(comment_id=comment_id)
 
+    def for_task_and_comments(self, task_id):
+        """Attachments of task and of its comments."""
+        return self.filter(
+            models.Q(task_id=task_id) | models.Q(comment__task_id=task_id)
+        )
+
 
 class Attachment(UUIDModel):
     file = models.FileField(upload_to="attachments/")
@@ -58,7 +64,9 @@ class Attachment(UUIDModel):
                     | (models.Q(task__isnull=True) & models.Q(comment__isnull=False))
                 ),
                 name="attachment_task_xor_comment",
-            )
+            ),
+            # an uploaded file is registered (confirmed) only once
+            models.UniqueConstraint(fields=["file"], name="unique_attachment_file"),
         ]
 
     def __str__(self):
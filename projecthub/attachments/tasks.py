@@ -0,0 +1,13 @@
+from celery import shared_task
+
+from projecthub.attachments import uploads
+
+
+@shared_task
+def cleanup_expired_uploads():
+    """
+    Remove files uploaded to object storage (or parts of multipart uploads)
+    that were never confirmed before their upload tokens expired.
+    """
+    aborted, deleted = uploads.cleanup_expired_uploads()
+    return f"{aborted} multipart uploads aborted, {deleted} objects deleted"
@@ -0,0 +1,254 @@
+import pytest
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from projecthub.attachments.models import Attachment
+
+
+@pytest.fixture
+def list_url(task):
+    return reverse("api:v1:attachment_list", kwargs={"task_id": task.pk})
+
+
+@pytest.fixture
+def upload_url(task):
+    return reverse("api:v1:attachment_upload", kwargs={"task_id": task.pk})
+
+
+@pytest.fixture
+def data():
+    return {"filename": "report.pdf", "size": 17, "content_type": "application/pdf"}
+
+
+def head(bucket, name, size):
+    bucket.stubber.add_response(
+        "head_object",
+        {"ContentLength": size},
+        {"Bucket": "attachments", "Key": name},
+    )
+
+
+@pytest.mark.django_db
+class TestAttachmentUploadAPIView:
+
+    @pytest.mark.parametrize(
+        "role, expected_status_code",
+        [
+            ("project_user", status.HTTP_404_NOT_FOUND),
+            ("project_reader", status.HTTP_404_NOT_FOUND),
+            ("task_responsible", status.HTTP_201_CREATED),
+            ("project_supervisor", status.HTTP_201_CREATED),
+        ],
+    )
+    def test_permissions(
+        self,
+        request,
+        api_client,
+        upload_url,
+        upload_bucket,
+        http_host,
+        task,
+        data,
+        role,
+        expected_status_code,
+    ):
+        user = {
+            "task_responsible": lambda: task.responsible,
+            "project_supervisor": lambda: task.project.supervisor,
+        }.get(role, lambda: request.getfixturevalue(role).user)()
+        api_client.force_authenticate(user=user)
+
+        response = api_client.post(upload_url, data=data, HTTP_HOST=http_host)
+
+        assert response.status_code == expected_status_code
+
+    def test_upload_is_presigned(
+        self, api_client, upload_url, upload_bucket, http_host, task, data
+    ):
+        api_client.force_authenticate(user=task.responsible)
+
+        response = api_client.post(upload_url, data=data, HTTP_HOST=http_host)
+
+        assert response.data["method"] == "POST"
+        assert response.data["url"] == "http://s3.testserver/attachments"
+        assert response.data["fields"]["key"] == response.data["name"]
+        assert response.data["upload"]
+        assert not Attachment.objects.exists()
+
+    def test_too_large_file_is_rejected(
+        self, api_client, upload_url, upload_bucket, http_host, task, data, settings
+    ):
+        settings.ATTACHMENT_MAX_SIZE = 16
+        api_client.force_authenticate(user=task.responsible)
+
+        response = api_client.post(upload_url, data=data, HTTP_HOST=http_host)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "size" in response.data
+
+    def test_comment_of_other_task_is_rejected(
+        self,
+        api_client,
+        upload_url,
+        upload_bucket,
+        http_host,
+        task,
+        data,
+        comment_factory,
+    ):
+        api_client.force_authenticate(user=task.responsible)
+        data["comment"] = comment_factory().pk
+
+        response = api_client.post(upload_url, data=data, HTTP_HOST=http_host)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "comment" in response.data
+
+
+@pytest.mark.django_db
+class TestAttachmentListCreateAPIView:
+
+    @pytest.fixture
+    def start_upload(self, api_client, upload_url, upload_bucket, http_host, data):
+        def start_upload(user, **extra):
+            api_client.force_authenticate(user=user)
+            response = api_client.post(
+                upload_url, data={**data, **extra}, HTTP_HOST=http_host
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+            return response.data
+
+        return start_upload
+
+    def test_uploaded_file_is_registered(
+        self, api_client, list_url, upload_bucket, http_host, task, start_upload
+    ):
+        upload = start_upload(task.responsible)
+        head(upload_bucket, upload["name"], 17)
+
+        response = api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        attachment = Attachment.objects.get()
+        assert attachment.file.name == upload["name"]
+        assert attachment.task == task
+        assert attachment.uploaded_by == task.responsible
+        assert response.data["id"] == str(attachment.pk)
+        assert response.data["file"].endswith(upload["name"])
+        task.refresh_from_db()
+        assert task.attachment_count == 1
+
+    def test_comment_attachment_is_registered(
+        self,
+        api_client,
+        list_url,
+        upload_bucket,
+        http_host,
+        task,
+        comment_factory,
+        start_upload,
+    ):
+        comment = comment_factory(task=task)
+        upload = start_upload(task.responsible, comment=str(comment.pk))
+        head(upload_bucket, upload["name"], 17)
+
+        response = api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["comment"] == str(comment.pk)
+        assert response.data["task"] is None
+
+    def test_missing_file_is_rejected(
+        self, api_client, list_url, upload_bucket, http_host, task, start_upload
+    ):
+        upload = start_upload(task.responsible)
+        upload_bucket.stubber.add_client_error(
+            "head_object", service_error_code="404", http_status_code=404
+        )
+
+        response = api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Attachment.objects.exists()
+
+    def test_upload_is_confirmed_once(
+        self, api_client, list_url, upload_bucket, http_host, task, start_upload
+    ):
+        upload = start_upload(task.responsible)
+        head(upload_bucket, upload["name"], 17)
+        api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        response = api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Attachment.objects.count() == 1
+
+    def test_upload_of_other_user_is_rejected(
+        self, api_client, list_url, upload_bucket, http_host, task, start_upload
+    ):
+        upload = start_upload(task.project.supervisor)
+        api_client.force_authenticate(user=task.responsible)
+
+        response = api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "upload" in response.data
+
+    def test_multipart_upload_requires_parts(
+        self,
+        api_client,
+        list_url,
+        upload_bucket,
+        http_host,
+        task,
+        start_upload,
+        settings,
+    ):
+        settings.ATTACHMENT_MULTIPART_THRESHOLD = 10
+        upload_bucket.stubber.add_response(
+            "create_multipart_upload", {"UploadId": "upload-1"}
+        )
+        upload = start_upload(task.responsible)
+
+        response = api_client.post(
+            list_url, data={"upload": upload["upload"]}, HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "parts" in response.data
+
+    def test_list_attachments_of_task_and_comments(
+        self,
+        api_client,
+        list_url,
+        http_host,
+        task,
+        task_factory,
+        comment_factory,
+        django_assert_num_queries,
+    ):
+        Attachment.objects.create(file="attachments/a.txt", task=task)
+        Attachment.objects.create(
+            file="attachments/b.txt", comment=comment_factory(task=task)
+        )
+        Attachment.objects.create(file="attachments/c.txt", task=task_factory())
+        api_client.force_authenticate(user=task.responsible)
+
+        # tenant, role index, task, count and page
+        with django_assert_num_queries(5):
+            response = api_client.get(list_url, HTTP_HOST=http_host)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
@@ -3,6 +3,7 @@ from django.utils import timezone
 from faker import Faker
 
 from projecthub.users.tests.factories import UserFactory
+from ..models import Attachment
 
 faker = Faker()
 
@@ -15,3 +16,6 @@ class AttachmentFactory(factory.django.DjangoModelFactory):
     )
     task = None
     comment = None
+
+    class Meta:
+        model = Attachment
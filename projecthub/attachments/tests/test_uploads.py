@@ -0,0 +1,251 @@
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from botocore.stub import ANY
+from django.core import signing
+from django.utils import timezone
+
+from projecthub.attachments.models import Attachment
+from projecthub.attachments.tasks import cleanup_expired_uploads
+from projecthub.attachments.uploads import (
+    UploadError,
+    confirm_upload,
+    generate_name,
+    get_part_size,
+    load_upload,
+    start_upload,
+)
+
+MiB = 1024 * 1024
+
+
+def head(bucket, name, size):
+    bucket.stubber.add_response(
+        "head_object",
+        {"ContentLength": size},
+        {"Bucket": "attachments", "Key": name},
+    )
+
+
+@pytest.mark.django_db
+class TestUploads:
+
+    @pytest.fixture
+    def start(self, task, user):
+        def start(size, filename="report.pdf", comment_id=None):
+            return start_upload(
+                filename, size, "application/pdf", task.pk, comment_id, user.pk
+            )
+
+        return start
+
+    def test_small_file_is_posted(self, upload_bucket, start):
+        upload = start(100)
+
+        assert upload["method"] == "POST"
+        assert upload["url"] == "http://s3.testserver/attachments"
+        assert upload["fields"]["key"] == upload["name"]
+        assert upload["fields"]["Content-Type"] == "application/pdf"
+        assert load_upload(upload["upload"])["upload_id"] is None
+
+    def test_large_file_is_uploaded_in_parts(
+        self, upload_bucket, start, settings, task, user
+    ):
+        settings.ATTACHMENT_MULTIPART_THRESHOLD = 10 * MiB
+        settings.ATTACHMENT_MULTIPART_PART_SIZE = 5 * MiB
+        upload_bucket.stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "upload-1"},
+            {"Bucket": "attachments", "Key": ANY, "ContentType": "application/pdf"},
+        )
+        upload = start(12 * MiB)
+
+        assert upload["method"] == "PUT"
+        assert upload["part_size"] == 5 * MiB
+        assert [part["part_number"] for part in upload["parts"]] == [1, 2, 3]
+        query = parse_qs(urlsplit(upload["parts"][2]["url"]).query)
+        assert query["uploadId"] == ["upload-1"]
+        assert query["partNumber"] == ["3"]
+
+        upload_bucket.stubber.add_response(
+            "complete_multipart_upload",
+            {},
+            {
+                "Bucket": "attachments",
+                "Key": upload["name"],
+                "UploadId": "upload-1",
+                "MultipartUpload": {
+                    "Parts": [
+                        {"PartNumber": 1, "ETag": "a"},
+                        {"PartNumber": 2, "ETag": "b"},
+                        {"PartNumber": 3, "ETag": "c"},
+                    ]
+                },
+            },
+        )
+        head(upload_bucket, upload["name"], 12 * MiB)
+
+        attachment = confirm_upload(
+            load_upload(upload["upload"]), user, [(3, "c"), (1, "a"), (2, "b")]
+        )
+
+        assert attachment.file.name == upload["name"]
+        assert attachment.task == task
+        assert attachment.comment is None
+
+    def test_failed_multipart_upload_is_aborted(
+        self, upload_bucket, start, settings, user
+    ):
+        settings.ATTACHMENT_MULTIPART_THRESHOLD = 10
+        upload_bucket.stubber.add_response(
+            "create_multipart_upload", {"UploadId": "upload-1"}
+        )
+        upload = start(100)
+        upload_bucket.stubber.add_client_error(
+            "complete_multipart_upload", service_error_code="InvalidPart"
+        )
+        upload_bucket.stubber.add_response(
+            "abort_multipart_upload",
+            {},
+            {"Bucket": "attachments", "Key": upload["name"], "UploadId": "upload-1"},
+        )
+
+        with pytest.raises(UploadError, match="couldn't be completed"):
+            confirm_upload(load_upload(upload["upload"]), user, [(1, "a")])
+
+    def test_upload_is_registered_once(self, upload_bucket, start, user):
+        upload = start(100)
+        head(upload_bucket, upload["name"], 100)
+        head(upload_bucket, upload["name"], 100)
+        confirm_upload(load_upload(upload["upload"]), user)
+
+        # confirmed concurrently, past the check of serializer
+        with pytest.raises(UploadError, match="already been confirmed"):
+            confirm_upload(load_upload(upload["upload"]), user)
+        assert Attachment.objects.count() == 1
+
+    def test_comment_attachment_is_not_attached_to_task(
+        self, upload_bucket, start, comment, user
+    ):
+        upload = start(100, comment_id=comment.pk)
+        head(upload_bucket, upload["name"], 100)
+
+        attachment = confirm_upload(load_upload(upload["upload"]), user)
+
+        assert attachment.comment == comment
+        assert attachment.task is None
+
+    def test_missing_file_is_not_registered(self, upload_bucket, start, user):
+        upload = start(100)
+        upload_bucket.stubber.add_client_error(
+            "head_object", service_error_code="404", http_status_code=404
+        )
+
+        with pytest.raises(UploadError, match="not been uploaded"):
+            confirm_upload(load_upload(upload["upload"]), user)
+
+    def test_file_of_other_size_is_removed(self, upload_bucket, start, user):
+        upload = start(100)
+        head(upload_bucket, upload["name"], 101)
+        upload_bucket.stubber.add_response(
+            "delete_object", {}, {"Bucket": "attachments", "Key": upload["name"]}
+        )
+
+        with pytest.raises(UploadError, match="101 bytes instead of 100"):
+            confirm_upload(load_upload(upload["upload"]), user)
+
+    def test_expired_upload_is_rejected(self, upload_bucket, start, settings):
+        upload = start(100)
+        settings.ATTACHMENT_UPLOAD_EXPIRES = -1
+
+        with pytest.raises(signing.SignatureExpired):
+            load_upload(upload["upload"])
+
+
+@pytest.mark.django_db
+class TestCleanupExpiredUploads:
+
+    def test_unconfirmed_uploads_are_removed(self, upload_bucket, task):
+        expired = timezone.now() - timedelta(hours=2)
+        fresh = timezone.now()
+        Attachment.objects.create(file="attachments/1/registered.pdf", task=task)
+        upload_bucket.stubber.add_response(
+            "list_multipart_uploads",
+            {
+                "Uploads": [
+                    {
+                        "Key": "attachments/2/expired.pdf",
+                        "UploadId": "u-2",
+                        "Initiated": expired,
+                    },
+                    {
+                        "Key": "attachments/3/fresh.pdf",
+                        "UploadId": "u-3",
+                        "Initiated": fresh,
+                    },
+                ]
+            },
+            {"Bucket": "attachments", "Prefix": "attachments/"},
+        )
+        upload_bucket.stubber.add_response(
+            "abort_multipart_upload",
+            {},
+            {
+                "Bucket": "attachments",
+                "Key": "attachments/2/expired.pdf",
+                "UploadId": "u-2",
+            },
+        )
+        upload_bucket.stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [
+                    {"Key": "attachments/1/registered.pdf", "LastModified": expired},
+                    {"Key": "attachments/4/orphaned.pdf", "LastModified": expired},
+                    {"Key": "attachments/5/uploading.pdf", "LastModified": fresh},
+                ]
+            },
+            {"Bucket": "attachments", "Prefix": "attachments/"},
+        )
+        upload_bucket.stubber.add_response(
+            "delete_objects",
+            {},
+            {
+                "Bucket": "attachments",
+                "Delete": {
+                    "Objects": [{"Key": "attachments/4/orphaned.pdf"}],
+                    "Quiet": True,
+                },
+            },
+        )
+
+        assert cleanup_expired_uploads() == (
+            "1 multipart uploads aborted, 1 objects deleted"
+        )
+
+
+@pytest.mark.django_db
+class TestGenerateName:
+
+    def test_name_is_unique_and_valid(self):
+        first, second = generate_name("../my report.pdf"), generate_name(
+            "my report.pdf"
+        )
+
+        assert first.startswith("attachments/")
+        assert first.endswith("/my_report.pdf")
+        assert first != second
+
+    def test_long_name_fits_field_keeping_extension(self):
+        name = generate_name("a" * 200 + ".pdf")
+
+        assert len(name) == 100
+        assert name.endswith("a.pdf")
+
+
+@pytest.mark.django_db
+def test_part_size_keeps_number_of_parts_in_limit(settings):
+    settings.ATTACHMENT_MULTIPART_PART_SIZE = 1 * MiB
+    assert get_part_size(100 * MiB) == 5 * MiB
+    assert get_part_size(100_000 * MiB) == 10 * MiB
@@ -0,0 +1,378 @@
+"""
+Direct uploads of attachment files to object storage.
+
+Files of attachments are not streamed through Django workers. Instead
+`start_upload()` presigns a POST of the file to the bucket (or, for files of
+`ATTACHMENT_MULTIPART_THRESHOLD` bytes and more, starts a multipart upload
+and presigns PUTs of its parts) and signs an upload token describing it.
+Client uploads the file straight to the bucket and hands the token back to
+`confirm_upload()`, which completes the multipart upload and registers the
+`Attachment` once the object exists with the announced size.
+
+Requests are signed with a botocore client built from options of the
+`ATTACHMENT_UPLOAD_STORAGE` storage, so any S3-compatible service (e.g.
+MinIO running locally) stands in for the bucket by its `endpoint_url`.
+"""
+
+import math
+import posixpath
+import uuid
+from datetime import timedelta
+from functools import cache
+
+import botocore.session
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.db import IntegrityError, transaction
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from projecthub.attachments.models import Attachment
+
+UPLOAD_TOKEN_SALT = "projecthub.attachments.upload"
+
+# most keys S3 deletes with one request
+MAX_DELETE_KEYS = 1000
+
+# limits of S3 multipart uploads: every part but the last one
+# must have at least 5 MiB and there may be at most 10000 parts
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10000
+
+
+class UploadError(Exception):
+    """Uploaded object is missing or doesn't match its upload."""
+
+
+class UploadBucket:
+    """Bucket files of attachments are uploaded to."""
+
+    def __init__(self, client, bucket_name, location=""):
+        self.client = client
+        self.bucket_name = bucket_name
+        self.location = location
+
+    @classmethod
+    def from_storage(cls, alias):
+        """Create bucket from options of `S3Storage` configured in `STORAGES`."""
+        options = settings.STORAGES[alias].get("OPTIONS", {})
+        if not options.get("bucket_name"):
+            raise ImproperlyConfigured(
+                f"Storage {alias!r} has no bucket to upload attachments to."
+            )
+
+        config = {
+            "s3": {"addressing_style": options.get("addressing_style")},
+            "signature_version": options.get("signature_version"),
+        }
+        config = Config(**{key: value for key, value in config.items() if value})
+        if options.get("client_config"):
+            config = options["client_config"].merge(config)
+
+        client = botocore.session.get_session().create_client(
+            "s3",
+            region_name=options.get("region_name"),
+            endpoint_url=options.get("endpoint_url"),
+            aws_access_key_id=options.get("access_key"),
+            aws_secret_access_key=options.get("secret_key"),
+            aws_session_token=options.get("security_token"),
+            use_ssl=options.get("use_ssl", True),
+            verify=options.get("verify"),
+            config=config,
+        )
+        return cls(client, options["bucket_name"], options.get("location", ""))
+
+    def get_key(self, name):
+        """Return key of object storing file of given name."""
+        return posixpath.join(self.location, name) if self.location else name
+
+    def presign_post(self, name, size, content_type, expires):
+        """Return URL and form fields of POST uploading file of exact size."""
+        return self.client.generate_presigned_post(
+            self.bucket_name,
+            self.get_key(name),
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", size, size],
+            ],
+            ExpiresIn=expires,
+        )
+
+    def create_multipart_upload(self, name, content_type):
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=self.get_key(name), ContentType=content_type
+        )
+        return response["UploadId"]
+
+    def presign_part(self, name, upload_id, part_number, expires):
+        return self.client.generate_presigned_url(
+            "upload_part",
+            Params={
+                "Bucket": self.bucket_name,
+                "Key": self.get_key(name),
+                "UploadId": upload_id,
+                "PartNumber": part_number,
+            },
+            ExpiresIn=expires,
+        )
+
+    def complete_multipart_upload(self, name, upload_id, parts):
+        """Join uploaded parts (`[(part_number, etag)]`) into object."""
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self.get_key(name),
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": etag}
+                    for part_number, etag in sorted(parts)
+                ]
+            },
+        )
+
+    def abort_multipart_upload(self, name, upload_id):
+        """Abort multipart upload, removing its parts (if it still exists)."""
+        try:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=self.get_key(name), UploadId=upload_id
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] != "NoSuchUpload":
+                raise
+
+    def iter_multipart_uploads(self, prefix):
+        """Yield `(name, upload_id, initiated)` of unfinished multipart uploads."""
+        paginator = self.client.get_paginator("list_multipart_uploads")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=self.get_key(prefix)
+        ):
+            for upload in page.get("Uploads", []):
+                yield self.get_name(upload["Key"]), upload["UploadId"], upload[
+                    "Initiated"
+                ]
+
+    def iter_objects(self, prefix):
+        """Yield `(name, last_modified)` of objects."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket_name, Prefix=self.get_key(prefix)
+        ):
+            for obj in page.get("Contents", []):
+                yield self.get_name(obj["Key"]), obj["LastModified"]
+
+    def get_name(self, key):
+        """Return name of file stored in object of given key."""
+        return posixpath.relpath(key, self.location) if self.location else key
+
+    def get_size(self, name):
+        """Return size of object storing file, or None if it doesn't exist."""
+        try:
+            response = self.client.head_object(
+                Bucket=self.bucket_name, Key=self.get_key(name)
+            )
+        except ClientError as error:
+            if error.response["Error"]["Code"] in {"404", "NoSuchKey"}:
+                return None
+            raise
+        return response["ContentLength"]
+
+    def delete(self, name):
+        self.client.delete_object(Bucket=self.bucket_name, Key=self.get_key(name))
+
+    def delete_many(self, names):
+        """Delete objects of files (at most `MAX_DELETE_KEYS`)."""
+        self.client.delete_objects(
+            Bucket=self.bucket_name,
+            Delete={
+                "Objects": [{"Key": self.get_key(name)} for name in names],
+                "Quiet": True,
+            },
+        )
+
+
+@cache
+def _get_upload_bucket(alias):
+    return UploadBucket.from_storage(alias)
+
+
+def get_upload_bucket():
+    # clients are thread-safe and expensive to create, so they're shared
+    return _get_upload_bucket(settings.ATTACHMENT_UPLOAD_STORAGE)
+
+
+@receiver(setting_changed)
+def _reset_upload_bucket(setting, **kwargs):
+    if setting in {"STORAGES", "ATTACHMENT_UPLOAD_STORAGE"}:
+        _get_upload_bucket.cache_clear()
+
+
+def generate_name(filename):
+    """
+    Return name of file uploaded under given filename. Every upload gets its
+    own directory, so concurrent uploads of the same file don't collide.
+    """
+    field = Attachment._meta.get_field("file")
+    directory = posixpath.join(field.upload_to, uuid.uuid4().hex)
+    filename = get_valid_filename(posixpath.basename(filename.replace("\\", "/")))
+
+    # fits to the field, keeping the extension
+    max_length = field.max_length - len(directory) - 1
+    if len(filename) > max_length:
+        stem, ext = posixpath.splitext(filename)
+        ext = ext[: max_length // 2]
+        filename = stem[: max_length - len(ext)] + ext
+    return posixpath.join(directory, filename)
+
+
+def get_part_size(size):
+    part_size = max(settings.ATTACHMENT_MULTIPART_PART_SIZE, MIN_PART_SIZE)
+    return max(part_size, math.ceil(size / MAX_PARTS))
+
+
+def start_upload(filename, size, content_type, task_id, comment_id, user_id):
+    """
+    Prepare upload of file attached to task or to its comment and return
+    `upload` token for `confirm_upload()` together with instructions of
+    uploading the file: `url` and form `fields` of POST, or `part_size` and
+    `parts` (`part_number` and `url` of PUT of each part) for multipart ones.
+    """
+    bucket = get_upload_bucket()
+    name = generate_name(filename)
+    expires = settings.ATTACHMENT_UPLOAD_EXPIRES
+    upload = {
+        "name": name,
+        "size": size,
+        "task": str(task_id),
+        "comment": str(comment_id) if comment_id else None,
+        "user": str(user_id),
+        "upload_id": None,
+    }
+
+    if size < settings.ATTACHMENT_MULTIPART_THRESHOLD:
+        instructions = {
+            "method": "POST",
+            **bucket.presign_post(name, size, content_type, expires),
+        }
+    else:
+        upload_id = bucket.create_multipart_upload(name, content_type)
+        upload["upload_id"] = upload_id
+        part_size = get_part_size(size)
+        instructions = {
+            "method": "PUT",
+            "part_size": part_size,
+            "parts": [
+                {
+                    "part_number": part_number,
+                    "url": bucket.presign_part(name, upload_id, part_number, expires),
+                }
+                for part_number in range(1, math.ceil(size / part_size) + 1)
+            ],
+        }
+
+    return {
+        "upload": signing.dumps(upload, salt=UPLOAD_TOKEN_SALT),
+        "name": name,
+        **instructions,
+    }
+
+
+def load_upload(token):
+    """
+    Return upload signed by `start_upload()`. Raises `signing.BadSignature`
+    if token is not valid or has expired.
+    """
+    return signing.loads(
+        token, salt=UPLOAD_TOKEN_SALT, max_age=settings.ATTACHMENT_UPLOAD_EXPIRES
+    )
+
+
+def confirm_upload(upload, uploaded_by, parts=None):
+    """
+    Register attachment of uploaded file once its object exists with the
+    announced size. Multipart uploads are completed from `parts`
+    (`[(part_number, etag)]`) first. Raises `UploadError` if it is missing
+    or doesn't match, in which case the object (or parts of multipart upload)
+    is removed, or if it has already been confirmed.
+    """
+    bucket = get_upload_bucket()
+    name = upload["name"]
+
+    if upload["upload_id"]:
+        try:
+            bucket.complete_multipart_upload(name, upload["upload_id"], parts or [])
+        except ClientError as error:
+            # uploaded parts are stored (and billed) until upload is aborted
+            bucket.abort_multipart_upload(name, upload["upload_id"])
+            raise UploadError(f"Upload couldn't be completed: {error}") from error
+
+    size = bucket.get_size(name)
+    if size is None:
+        raise UploadError("File has not been uploaded.")
+    if size != upload["size"]:
+        bucket.delete(name)
+        raise UploadError(
+            f"Uploaded file has {size} bytes instead of {upload['size']}."
+        )
+
+    # attached either to the comment or to the task, never to both
+    comment_id = upload["comment"]
+    try:
+        with transaction.atomic():
+            return Attachment.objects.create(
+                file=name,
+                task_id=None if comment_id else upload["task"],
+                comment_id=comment_id,
+                uploaded_by=uploaded_by,
+            )
+    except IntegrityError as error:
+        # concurrent confirmation registered it first (files are unique)
+        raise UploadError("Upload has already been confirmed.") from error
+
+
+def cleanup_expired_uploads():
+    """
+    Remove uploads whose tokens have expired without being confirmed: abort
+    unfinished multipart uploads and delete objects no attachment refers to.
+    Returns number of aborted uploads and number of deleted objects.
+    """
+    bucket = get_upload_bucket()
+    prefix = Attachment._meta.get_field("file").upload_to
+    # tokens are issued before uploads start, so uploads started before
+    # token lifetime can't be confirmed anymore
+    expired_before = timezone.now() - timedelta(
+        seconds=settings.ATTACHMENT_UPLOAD_EXPIRES
+    )
+
+    aborted = 0
+    for name, upload_id, initiated in bucket.iter_multipart_uploads(prefix):
+        if initiated < expired_before:
+            bucket.abort_multipart_upload(name, upload_id)
+            aborted += 1
+
+    deleted = 0
+    names = []
+    for name, last_modified in bucket.iter_objects(prefix):
+        if last_modified < expired_before:
+            names.append(name)
+        if len(names) == MAX_DELETE_KEYS:
+            deleted += _delete_orphaned_objects(bucket, names)
+            names = []
+    deleted += _delete_orphaned_objects(bucket, names)
+
+    return aborted, deleted
+
+
+def _delete_orphaned_objects(bucket, names):
+    registered = set(
+        Attachment.objects.filter(file__in=names).values_list("file", flat=True)
+    )
+    orphaned = [name for name in names if name not in registered]
+    if orphaned:
+        bucket.delete_many(orphaned)
+    return len(orphaned)
@@ -42,6 +42,11 @@ class CommentAdmin(BaseAdmin):
         )
     ]
 
+    def delete_queryset(self, request, queryset):
+        # one by one, so replies of deleted comments start their own threads
+        for obj in queryset:
+            obj.delete()
+
     @admin.display(description="Body")
     def body_short(self, obj):
         return textwrap.shorten(obj.body, 50)
@@ -1,13 +1,13 @@
 from django_filters import rest_framework as filters
 
+from projecthub.core.filters import UsernameFilter
 from ...models import Comment
 
 
 class CommentFilterSet(filters.FilterSet):
     parent = filters.NumberFilter(field_name="parent__id")
-    author = filters.CharFilter(
-        field_name="created_by__username", lookup_expr="icontains"
-    )
+    author = UsernameFilter(field_name="created_by")
+    author_id = filters.UUIDFilter(field_name="created_by")
     created_after = filters.IsoDateTimeFilter(
         field_name="created_at", lookup_expr="gte"
     )
@@ -17,4 +17,4 @@ class CommentFilterSet(filters.FilterSet):
 
     class Meta:
         model = Comment
-        fields = ("parent", "author", "created_after", "created_before")
+        fields = ("parent", "author", "author_id", "created_after", "created_before")
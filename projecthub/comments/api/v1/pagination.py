@@ -1,7 +1,18 @@
-from rest_framework import pagination
+from projecthub.core.pagination import (
+    PageNumberOrKeysetPagination,
+    PageNumberPagination,
+)
 
 
-class CommentPagination(pagination.PageNumberPagination):
+class CommentPagination(PageNumberOrKeysetPagination):
     page_size = 30
     max_page_size = 200
-    page_size_query_param = "page_size"
\ No newline at end of file
+    page_size_query_param = "page_size"
+    keyset_ordering = ("-created_at",)
+    keyset_ordering_fields = ("created_at",)
+
+
+class CommentThreadPagination(PageNumberPagination):
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
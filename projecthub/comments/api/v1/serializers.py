@@ -17,4 +17,21 @@ class CommentCreateSerializer(serializers.ModelSerializer):
         fields = ("body", "parent")
 
     def to_representation(self, instance):
-        return CommentListSerializer(instance, context=self.context).data
\ No newline at end of file
+        return CommentListSerializer(instance, context=self.context).data
+
+
+class CommentReplySerializer(CommentListSerializer):
+    created_at = serializers.DateTimeField()
+    depth = serializers.IntegerField()
+    # loaded replies (see `CommentThreadListAPIView`), deeper ones are cut
+    replies = serializers.SerializerMethodField()
+
+    def get_replies(self, obj):
+        return CommentReplySerializer(
+            obj.thread_replies, many=True, context=self.context
+        ).data
+
+
+class CommentThreadSerializer(CommentReplySerializer):
+    # all replies in thread, including those deeper than loaded ones
+    reply_count = serializers.IntegerField()
@@ -1,8 +1,12 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, permissions, filters
-from rest_framework.generics import get_object_or_404
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.core.api.v1.views.mixins import ProjectionListMixin
+from projecthub.core.eager_loading import get_eager_loading
+from projecthub.core.filters import RankedSearchFilter
 from projecthub.permissions import (
     IsTenantOwnerPermission,
     IsProjectOwnerPermission,
@@ -15,14 +19,20 @@ from projecthub.policies import (
     IsProjectStaffPolicy,
     IsTaskResponsiblePolicy,
 )
-from projecthub.tasks.models import Task
 from .filters import CommentFilterSet
-from .pagination import CommentPagination
-from .serializers import CommentListSerializer, CommentCreateSerializer
+from .pagination import CommentPagination, CommentThreadPagination
+from .serializers import (
+    CommentListSerializer,
+    CommentCreateSerializer,
+    CommentReplySerializer,
+    CommentThreadSerializer,
+)
 from ...models import Comment
 
 
-class CommentListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
+class CommentListCreateAPIView(
+    SecureGenericAPIView, ProjectionListMixin, generics.ListCreateAPIView
+):
     policy_classes = [
         IsAuthenticatedPolicy
         & (
@@ -36,7 +46,7 @@ class CommentListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView)
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        RankedSearchFilter,
         filters.OrderingFilter
     ]
     filterset_class = CommentFilterSet
@@ -57,10 +67,7 @@ class CommentListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView)
         serializer.save(task_id=self.kwargs["task_id"], created_by=self.request.user)
 
     def get_project_id(self):
-        task = get_object_or_404(
-            Task, project__tenant=self.request.tenant, pk=self.kwargs["task_id"]
-        )
-        return task.project_id
+        return self.request.access.task.project_id
 
 
 class CommentDestroyAPIView(SecureGenericAPIView, generics.DestroyAPIView):
@@ -89,7 +96,77 @@ class CommentDestroyAPIView(SecureGenericAPIView, generics.DestroyAPIView):
         return qs
 
     def get_project_id(self):
-        task = get_object_or_404(
-            Task, project__tenant=self.request.tenant, pk=self.kwargs["task_id"]
+        return self.request.access.task.project_id
+
+
+class CommentThreadListAPIView(SecureGenericAPIView, generics.ListAPIView):
+    """
+    Pages of top-level comments of task, each with its replies nested up to
+    `depth` levels. Replies of whole page are loaded by one query using
+    `Comment.thread` and `Comment.depth`.
+    """
+
+    policy_classes = [
+        IsAuthenticatedPolicy
+        & (
+            IsAdminUserPolicy
+            | IsTenantOwnerPolicy
+            | IsProjectStaffPolicy
+            | IsTaskResponsiblePolicy
         )
-        return task.project_id
+    ]
+    pagination_class = CommentThreadPagination
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = CommentThreadSerializer
+    depth_query_param = "depth"
+    default_depth = 3
+    max_depth = 10
+    # validators of top-level comments don't change when replies do
+    conditional_requests = False
+
+    def get_queryset(self):
+        reply_counts = (
+            Comment.objects.filter(thread=OuterRef("pk"), depth__gt=0)
+            .order_by()
+            .values("thread")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        qs = Comment.objects.for_tenant(self.request.tenant)
+        qs = qs.for_task(self.kwargs["task_id"]).top_level()
+        return qs.annotate(reply_count=Coalesce(Subquery(reply_counts), 0))
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        return self.load_replies(page if page is not None else queryset)
+
+    def load_replies(self, comments):
+        comments = list(comments)
+        loaded = {comment.pk: comment for comment in comments}
+        for comment in comments:
+            comment.thread_replies = []
+
+        depth = self.get_depth()
+        if not comments or not depth:
+            return comments
+
+        replies = Comment.objects.filter(
+            thread_id__in=loaded, depth__gt=0, depth__lte=depth
+        ).order_by("depth", "created_at", "id")
+        replies = get_eager_loading(CommentReplySerializer, Comment).apply(replies)
+        # parents are loaded before their replies, as they are less deep
+        for reply in replies:
+            reply.thread_replies = []
+            loaded[reply.parent_id].thread_replies.append(reply)
+            loaded[reply.pk] = reply
+        return comments
+
+    def get_depth(self):
+        try:
+            depth = int(self.request.query_params[self.depth_query_param])
+        except (KeyError, ValueError):
+            return self.default_depth
+        return min(max(depth, 0), self.max_depth)
+
+    def get_project_id(self):
+        return self.request.access.task.project_id
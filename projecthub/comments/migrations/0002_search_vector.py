@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+from projecthub.core import operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0001_initial"),
+        ("tasks", "0005_remove_board_unique_border_type_for_project_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        operations.PostgresAddIndex(
+            model_name="comment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="comment_search_vector_gin"
+            ),
+        ),
+        operations.PostgresRunSQL(
+            sql="""
+            CREATE FUNCTION comments_comment_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('simple', coalesce(NEW.body, '')), 'A');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER comments_comment_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF body ON comments_comment
+            FOR EACH ROW EXECUTE FUNCTION comments_comment_search_vector_update();
+
+            -- fill vectors of existing rows through the trigger
+            UPDATE comments_comment SET body = body;
+            """,
+            reverse_sql="""
+            DROP TRIGGER IF EXISTS comments_comment_search_vector_trigger ON comments_comment;
+            DROP FUNCTION IF EXISTS comments_comment_search_vector_update();
+            """,
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0002_search_vector"),
+        ("tasks", "0007_hot_query_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # new indexes are created before the ones they replace are dropped
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["task", "created_at", "id"], name="comment_task_created_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="comment",
+            name="task",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Task that owns this comment.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="comments",
+                to="tasks.task",
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def set_comment_threads(apps, schema_editor):
+    Comment = apps.get_model("comments", "Comment")
+    Comment.objects.filter(parent__isnull=True).update(
+        thread_id=models.F("id"), depth=0
+    )
+    # one level of replies per update
+    while True:
+        parents = Comment.objects.filter(pk=models.OuterRef("parent_id"))
+        updated = Comment.objects.filter(
+            thread__isnull=True, parent__thread__isnull=False
+        ).update(
+            thread_id=models.Subquery(parents.values("thread_id")[:1]),
+            depth=models.Subquery(parents.values("depth")[:1]) + 1,
+        )
+        if not updated:
+            break
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("comments", "0003_task_created_index"),
+        ("tasks", "0007_hot_query_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="depth",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, help_text="Number of ancestors of comment."
+            ),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="thread",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                editable=False,
+                help_text="Top-level comment of thread.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="thread_comments",
+                to="comments.comment",
+            ),
+        ),
+        migrations.RunPython(set_comment_threads, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                condition=models.Q(("parent__isnull", True)),
+                fields=["task", "created_at", "id"],
+                name="comment_task_top_level_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["thread", "depth", "created_at"],
+                name="comment_thread_depth_idx",
+            ),
+        ),
+    ]
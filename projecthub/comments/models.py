@@ -1,10 +1,12 @@
 import textwrap
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from projecthub.core.models.base import UUIDModel, TimestampedModel
+from projecthub.core.models.base import UUIDModel, TimestampedModel, TrackedModel
 from projecthub.tasks.models import Task
 
 
@@ -16,12 +18,16 @@ class CommentQuerySet(models.QuerySet):
     def for_task(self, task_id):
         return self.filter(task_id=task_id)
 
+    def top_level(self):
+        return self.filter(parent__isnull=True)
 
-class Comment(UUIDModel, TimestampedModel):
+
+class Comment(UUIDModel, TimestampedModel, TrackedModel):
     task = models.ForeignKey(
         Task,
         on_delete=models.CASCADE,
         related_name="comments",
+        db_index=False,  # covered by `comment_task_created_idx`
         help_text=_("Task that owns this comment."),
     )
     parent = models.ForeignKey(
@@ -32,6 +38,21 @@ class Comment(UUIDModel, TimestampedModel):
         related_name="replies",
         help_text=_("Parent comment."),
     )
+    # top-level comment and depth of comment in its thread, maintained on
+    # save and delete, so whole threads are loaded by one indexed query
+    thread = models.ForeignKey(
+        "Comment",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="thread_comments",
+        db_index=False,  # covered by `comment_thread_depth_idx`
+        help_text=_("Top-level comment of thread."),
+    )
+    depth = models.PositiveSmallIntegerField(
+        default=0, editable=False, help_text=_("Number of ancestors of comment.")
+    )
     body = models.CharField(max_length=2000, help_text=_("Body of comment."))
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -41,23 +62,14 @@ class Comment(UUIDModel, TimestampedModel):
         help_text=_("Author of comment"),
     )
 
-    #TODO:
-    # add search vector: `search_vector = SearchVectorField(null=True)`
-    # create index for it `GinIndex(fields=["search_vector"]`
-    # override save method: `self.search_vector = SearchVector("body")
-    # in views:
-    # def get_queryset(self):
-    #   queryset = super().get_queryset()
-    #   query = self.request.query_params.get('search')
-    #   if query:
-    #       search_query = SearchQuery(query)
-    #       queryset = queryset.annotate(
-    #           rank=SearchRank(F('search_vector'), search_query)
-    #       ).filter(search_vector=search_query).order_by('-rank')
-    #   return queryset
+    # maintained by database trigger (PostgreSQL only), see `projecthub.core.search`
+    search_vector = SearchVectorField(null=True, editable=False)
+    search_vector_fields = (("body", "A"),)
 
     objects = CommentQuerySet.as_manager()
 
+    tracked_fields = ("parent",)
+
     class Meta:
         ordering = ["-created_at"]
         constraints = [
@@ -66,11 +78,77 @@ class Comment(UUIDModel, TimestampedModel):
                 name="prevent_self_parent",
             )
         ]
+        indexes = [
+            # created on PostgreSQL only
+            GinIndex(fields=["search_vector"], name="comment_search_vector_gin"),
+            # comments of task, in default ordering
+            models.Index(
+                fields=["task", "created_at", "id"], name="comment_task_created_idx"
+            ),
+            # top-level comments of task (pages of threads)
+            models.Index(
+                fields=["task", "created_at", "id"],
+                condition=models.Q(parent__isnull=True),
+                name="comment_task_top_level_idx",
+            ),
+            # replies of threads up to depth
+            models.Index(
+                fields=["thread", "depth", "created_at"],
+                name="comment_thread_depth_idx",
+            ),
+        ]
 
     def __str__(self):
         body = textwrap.shorten(self.body, 20)
         return f"{self.created_by.username}: {body} in {self.task.name}"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        parent_changed = self.has_changed("parent") and (
+            update_fields is None or {"parent", "parent_id"} & set(update_fields)
+        )
+        adding = self._state.adding
+        if parent_changed:
+            self.set_thread()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "thread", "depth"}
+        super().save(*args, **kwargs)
+        if parent_changed and not adding:
+            self.update_reply_threads()
+
+    def delete(self, *args, **kwargs):
+        # replies become top-level comments (`parent` is SET_NULL),
+        # so each of them starts its own thread
+        replies = list(self.replies.all())
+        result = super().delete(*args, **kwargs)
+        for reply in replies:
+            reply.parent = None
+            reply.save(update_fields=["parent"])
+        return result
+
+    def set_thread(self):
+        """Set `thread` and `depth` from parent."""
+        if self.parent_id is None:
+            self.thread_id, self.depth = self.pk, 0
+        else:
+            self.thread_id, self.depth = self.parent.thread_id, self.parent.depth + 1
+
+    def update_reply_threads(self):
+        """Set `thread` and `depth` of all replies (recursively) from this comment."""
+        parent_ids, depth, seen = [self.pk], self.depth, {self.pk}
+        while parent_ids:
+            depth += 1
+            parent_ids = list(
+                Comment.objects.filter(parent_id__in=parent_ids)
+                .exclude(pk__in=seen)
+                .values_list("pk", flat=True)
+            )
+            if parent_ids:
+                Comment.objects.filter(pk__in=parent_ids).update(
+                    thread_id=self.thread_id, depth=depth
+                )
+            seen.update(parent_ids)
+
     @property
     def is_reply(self):
         return self.parent is not None
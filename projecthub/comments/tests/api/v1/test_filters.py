@@ -15,4 +15,13 @@ class TestCommentFilterSet:
         filtered = CommentFilterSet({"author": "jo"}, queryset=queryset).qs
 
         assert filtered.count() == 1
-        assert filtered.first().pk == john_comment.pk
\ No newline at end of file
+        assert filtered.first().pk == john_comment.pk
+
+    def test_by_author_id(self, comment_factory, john, alice):
+        john_comment = comment_factory(created_by=john)
+        alice_comment = comment_factory(created_by=alice)
+
+        queryset = Comment.objects.all()
+        filtered = CommentFilterSet({"author_id": john.pk}, queryset=queryset).qs
+
+        assert list(filtered) == [john_comment]
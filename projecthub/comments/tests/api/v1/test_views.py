@@ -13,6 +13,11 @@ def list_url(task):
     return reverse("api:v1:comment_list", kwargs={"task_id": task.pk})
 
 
+@pytest.fixture
+def thread_list_url(task):
+    return reverse("api:v1:comment_thread_list", kwargs={"task_id": task.pk})
+
+
 @pytest.fixture
 def detail_url(comment):
     return reverse(
@@ -272,6 +277,24 @@ class TestCommentListCreateAPIView:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
+    def test_cursor_pagination_keeps_created_at_order(
+        self, admin_client, list_url, task, http_host, comment_factory
+    ):
+        comments = comment_factory.create_batch(5, task=task)
+        expected = [
+            str(c.pk) for c in sorted(comments, key=lambda c: (c.created_at, c.pk))
+        ][::-1]
+
+        ids = []
+        url, params = list_url, {"pagination": "cursor", "page_size": 2}
+        while url:
+            response = admin_client.get(url, params, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+            ids += [c["id"] for c in response.data["results"]]
+            url, params = response.data["next"], None
+
+        assert ids == expected
+
     def test_lists_comments_of_specific_task(
         self,
         admin_client,
@@ -335,6 +358,123 @@ class TestCommentListCreateAPIView:
         expected_ids = [str(old_comment.pk), str(new_comment.pk)]
         assert [c["id"] for c in response.data["results"]] == expected_ids
 
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self,
+            api_client,
+            list_url,
+            http_host,
+            task,
+            comment,
+            django_assert_num_queries,
+        ):
+            api_client.force_authenticate(user=task.project.owner)
+
+            with django_assert_num_queries(5):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+        @pytest.mark.parametrize("count", [1, 20])
+        def test_does_not_depend_on_number_of_comments(
+            self,
+            api_client,
+            list_url,
+            http_host,
+            task,
+            comment_factory,
+            django_assert_num_queries,
+            count,
+        ):
+            comment_factory.create_batch(count, task=task)
+            api_client.force_authenticate(user=task.project.owner)
+
+            with django_assert_num_queries(5):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["results"]) == count
+
+
+@pytest.mark.django_db
+class TestCommentThreadListAPIView:
+
+    @pytest.fixture
+    def thread(self, task, comment_factory):
+        root = comment_factory(task=task)
+        reply = comment_factory(task=task, parent=root)
+        nested_reply = comment_factory(task=task, parent=reply)
+        return root, reply, nested_reply
+
+    def test_not_project_member(
+        self, api_client, thread_list_url, http_host, tenant_user
+    ):
+        api_client.force_authenticate(user=tenant_user.user)
+        response = api_client.get(thread_list_url, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_replies_are_nested(self, admin_client, thread_list_url, http_host, thread):
+        root, reply, nested_reply = thread
+
+        response = admin_client.get(thread_list_url, HTTP_HOST=http_host)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        [data] = response.data["results"]
+        assert data["id"] == str(root.pk)
+        assert data["reply_count"] == 2
+        [reply_data] = data["replies"]
+        assert reply_data["id"] == str(reply.pk)
+        assert reply_data["depth"] == 1
+        [nested_data] = reply_data["replies"]
+        assert nested_data["id"] == str(nested_reply.pk)
+        assert nested_data["replies"] == []
+
+    def test_replies_are_cut_at_depth(
+        self, admin_client, thread_list_url, http_host, thread
+    ):
+        response = admin_client.get(thread_list_url, {"depth": 1}, HTTP_HOST=http_host)
+
+        [data] = response.data["results"]
+        assert data["reply_count"] == 2
+        [reply_data] = data["replies"]
+        assert reply_data["replies"] == []
+
+    def test_pages_by_top_level_comments(
+        self, admin_client, thread_list_url, http_host, task, comment_factory
+    ):
+        for root in comment_factory.create_batch(3, task=task):
+            comment_factory.create_batch(2, task=task, parent=root)
+
+        response = admin_client.get(
+            thread_list_url, {"page_size": 2}, HTTP_HOST=http_host
+        )
+
+        assert response.data["count"] == 3
+        assert len(response.data["results"]) == 2
+        assert all(len(data["replies"]) == 2 for data in response.data["results"])
+
+    @pytest.mark.parametrize("count", [1, 10])
+    def test_num_queries_does_not_depend_on_size_of_threads(
+        self,
+        api_client,
+        thread_list_url,
+        http_host,
+        task,
+        comment_factory,
+        django_assert_num_queries,
+        count,
+    ):
+        parents = comment_factory.create_batch(count, task=task)
+        for depth in range(3):
+            parents = [comment_factory(task=task, parent=p) for p in parents]
+        api_client.force_authenticate(user=task.project.owner)
+
+        # tenant, task, project, count, page and replies
+        with django_assert_num_queries(6):
+            response = api_client.get(thread_list_url, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == count
+
 
 @pytest.mark.django_db
 class TestCommentDestroyAPIView:
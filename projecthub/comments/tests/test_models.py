@@ -19,6 +19,40 @@ class TestComment:
         assert not parent.is_reply
         assert reply.is_reply
 
+    def test_thread_and_depth_are_set_from_parent(self, comment_factory, task):
+        root = comment_factory(task=task)
+        reply = comment_factory(task=task, parent=root)
+        nested_reply = comment_factory(task=task, parent=reply)
+
+        assert (root.thread_id, root.depth) == (root.pk, 0)
+        assert (reply.thread_id, reply.depth) == (root.pk, 1)
+        assert (nested_reply.thread_id, nested_reply.depth) == (root.pk, 2)
+
+    def test_parent_change_moves_replies_to_new_thread(self, comment_factory, task):
+        root = comment_factory(task=task)
+        other_root = comment_factory(task=task)
+        reply = comment_factory(task=task, parent=root)
+        nested_reply = comment_factory(task=task, parent=reply)
+
+        reply.parent = other_root
+        reply.save()
+
+        nested_reply.refresh_from_db()
+        assert (reply.thread_id, reply.depth) == (other_root.pk, 1)
+        assert (nested_reply.thread_id, nested_reply.depth) == (other_root.pk, 2)
+
+    def test_replies_of_deleted_comment_start_own_threads(self, comment_factory, task):
+        root = comment_factory(task=task)
+        reply = comment_factory(task=task, parent=root)
+        nested_reply = comment_factory(task=task, parent=reply)
+
+        root.delete()
+
+        reply.refresh_from_db()
+        nested_reply.refresh_from_db()
+        assert (reply.parent_id, reply.thread_id, reply.depth) == (None, reply.pk, 0)
+        assert (nested_reply.thread_id, nested_reply.depth) == (reply.pk, 1)
+
 
 @pytest.mark.django_db
 class TestCommentQuerySet:
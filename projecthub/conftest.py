@@ -1,8 +1,17 @@
 import pytest
+from botocore.stub import Stubber
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APIClient
 
+from projecthub.attachments.uploads import get_upload_bucket
 from projecthub.comments.tests.factories import CommentFactory
+from projecthub.core.cache import (
+    presigned_url_cache,
+    response_cache,
+    role_index_cache,
+    tenant_cache,
+)
 from projecthub.core.models import TenantMembership
 from projecthub.core.tests.factories import TenantFactory, TenantMembershipFactory
 from projecthub.projects.models import ProjectMembership
@@ -191,6 +200,46 @@ def file():
     )
 
 
+@pytest.fixture
+def upload_bucket(settings):
+    """
+    Bucket of direct uploads of attachments with stubbed client; requests
+    it is expected to send are added with `upload_bucket.stubber`.
+    """
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "attachment_uploads": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "access_key": "access-key",
+                "secret_key": "secret-key",
+                "bucket_name": "attachments",
+                "region_name": "us-east-1",
+                "endpoint_url": "http://s3.testserver",
+                "addressing_style": "path",
+                "signature_version": "s3v4",
+            },
+        },
+    }
+    settings.ATTACHMENT_UPLOAD_STORAGE = "attachment_uploads"
+    bucket = get_upload_bucket()
+    with Stubber(bucket.client) as bucket.stubber:
+        yield bucket
+        bucket.stubber.assert_no_pending_responses()
+
+
+@pytest.fixture
+def shared_response_cache(settings):
+    """Enable response cache with local memory cache as its shared tier."""
+    settings.RESPONSE_CACHE_ALIAS = "default"
+
+
+@pytest.fixture
+def shared_role_index_cache(settings):
+    """Cache role indexes in local memory cache as their shared tier."""
+    settings.ROLE_INDEX_CACHE_ALIAS = "default"
+
+
 @pytest.fixture(autouse=True)
 def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
@@ -199,3 +248,23 @@ def _media_storage(settings, tmpdir) -> None:
 @pytest.fixture(autouse=True)
 def superuser():
     return UserFactory(is_superuser=True)
+
+
+@pytest.fixture(autouse=True)
+def _clear_tenant_cache():
+    tenant_cache.clear()
+    yield
+    tenant_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    response_cache.clear()
+    role_index_cache.clear()
+    presigned_url_cache.clear()
+    yield
+    cache.clear()
+    response_cache.clear()
+    role_index_cache.clear()
+    presigned_url_cache.clear()
@@ -0,0 +1,152 @@
+import logging
+from functools import cached_property
+
+from rest_framework.generics import get_object_or_404
+
+from projecthub.comments.models import Comment
+from projecthub.core.roles import get_role_index
+from projecthub.core.utils import (
+    get_project_id_from_obj,
+    get_project_id_from_view,
+    get_task_id_from_view,
+)
+from projecthub.projects.models import Project
+from projecthub.tasks.models import Task
+
+logger = logging.getLogger(__name__)
+
+
+class AccessContext:
+    """
+    Request-scoped cache of the facts policies and permissions are based on.
+
+    Project, task, tenant ownership and the caller's membership role are
+    loaded at most once per request, no matter how many policies and
+    permissions ask for them.
+    """
+
+    def __init__(self, request, view):
+        self.request = request
+        self.view = view
+        self._projects = {}
+        self._tasks = {}
+        # memoized `has_access` results of leaf policies, keyed by policy class
+        self.policy_results = {}
+        # (policy, method, result, cached) for every evaluated leaf policy
+        self.policy_trace = []
+
+    @property
+    def user(self):
+        return self.request.user
+
+    @property
+    def tenant(self):
+        return self.request.tenant
+
+    @cached_property
+    def roles(self):
+        """Role index of user (see `core.roles`)."""
+        return get_role_index(self.user)
+
+    @cached_property
+    def is_tenant_owner(self):
+        return self.tenant.owner_id == self.user.id
+
+    @cached_property
+    def is_tenant_member(self):
+        if self.is_tenant_owner:
+            return True
+
+        return self.roles.is_tenant_member(self.tenant.pk)
+
+    @cached_property
+    def project_id(self):
+        return get_project_id_from_view(self.view)
+
+    @property
+    def project(self):
+        return self.get_project(self.project_id)
+
+    @property
+    def project_role(self):
+        return self.get_project_role(self.project)
+
+    @cached_property
+    def task_id(self):
+        return get_task_id_from_view(self.view)
+
+    @property
+    def task(self):
+        return self.get_task(self.task_id)
+
+    def get_project(self, project_id):
+        if project_id not in self._projects:
+            self._projects[project_id] = get_object_or_404(Project, pk=project_id)
+        return self._projects[project_id]
+
+    def get_project_for_obj(self, obj):
+        if isinstance(obj, Project):
+            self._projects.setdefault(obj.pk, obj)
+            return obj
+
+        if isinstance(obj, Comment):
+            return self.get_project(self.get_task(obj.task_id).project_id)
+
+        return self.get_project(get_project_id_from_obj(obj))
+
+    def get_project_role(self, project):
+        """
+        Return role of current user in given project
+        or None if user is not member of it.
+        """
+        if project.tenant_id != self.tenant.pk:
+            return None
+        return self.roles.get_project_role(project.pk)
+
+    def get_task(self, task_id):
+        if task_id not in self._tasks:
+            self._tasks[task_id] = get_object_or_404(
+                Task, project__tenant=self.tenant, pk=task_id
+            )
+        return self._tasks[task_id]
+
+    def trace_policy(self, policy, method, result, cached):
+        name = type(policy).__name__
+        self.policy_trace.append((name, method, result, cached))
+        logger.debug(
+            "%s.%s -> %s%s", name, method, result, " (cached)" if cached else ""
+        )
+
+    @property
+    def deciding_policy(self):
+        """
+        Name of the leaf policy that decided the outcome, which (because of
+        short-circuiting) is the last evaluated one.
+        """
+        return self.policy_trace[-1][0] if self.policy_trace else None
+
+    def is_project_staff(self, project=None):
+        project = project or self.project
+        return self.user.id in {project.owner_id, project.supervisor_id}
+
+    def is_project_member(self, project=None):
+        project = project or self.project
+        return (
+            self.is_project_staff(project) or self.get_project_role(project) is not None
+        )
+
+    def is_task_responsible(self, task=None):
+        task = task or self.task
+        return task.responsible_id == self.user.id
+
+
+def get_access_context(request, view):
+    """
+    Return access context attached to request,
+    creating it for views that do not attach one themselves.
+    """
+    access = getattr(request, "access", None)
+    if access is None:
+        access = AccessContext(request, view)
+        request.access = access
+    return access
@@ -1,6 +1,63 @@
+import uuid
+
 from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from projecthub.core.cache import presigned_url_cache
 
 
 class UserNestedSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     username = serializers.CharField()
+
+
+class PreloadedRelatedField(serializers.Field):
+    """
+    Primary key related field that resolves objects from dict of preloaded
+    objects keyed by pk (`context[context_key]`) instead of querying
+    the database for every value, e.g. when validating items in bulk.
+    """
+
+    default_error_messages = serializers.PrimaryKeyRelatedField.default_error_messages
+
+    def __init__(self, context_key, **kwargs):
+        self.context_key = context_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        try:
+            pk = uuid.UUID(str(data))
+        except (TypeError, ValueError, AttributeError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+        try:
+            return self.context[self.context_key][pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+    def to_representation(self, value):
+        return value.pk
+
+
+class PresignedFileField(serializers.FileField):
+    """
+    File field rendering URLs of files through `presigned_url_cache`, so URLs
+    presigned by storage are reused instead of being signed for every file
+    of every response.
+    """
+
+    def to_representation(self, value):
+        if not value:
+            return None
+
+        if not getattr(self, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+            return value.name
+
+        try:
+            url = presigned_url_cache.get_url(value)
+        except AttributeError:
+            return None
+        request = self.context.get("request", None)
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
@@ -1,19 +1,52 @@
-from rest_framework import exceptions, generics
+from django.utils.http import http_date
+from rest_framework import exceptions, generics, permissions
+from rest_framework.response import Response
+
+from projecthub.core.access import AccessContext
+from projecthub.core.conditional import (
+    NotModified,
+    check_preconditions,
+    get_collection_validators,
+    get_object_validators,
+    get_queryset_stats,
+    has_validators,
+)
+from projecthub.core.eager_loading import get_eager_loading
+from projecthub.core.pagination import (
+    PageNumberOrKeysetPagination,
+    PageNumberPagination,
+)
+from projecthub.policies.base import check_access, check_object_access
+from projecthub.policies.filters import filter_by_policies
 
 
 # not final version
 class SecureGenericAPIView(generics.GenericAPIView):
     policy_classes = []
+    # policies compiled into single queryset filter (see `policies.filters`)
+    filter_policy_classes = []
+    # lookup paths from queryset model to relations policies filter by,
+    # e.g. {"project": "project"} for tasks or {"project": ""} for projects
+    policy_lookups = {}
+    # derive select_related/prefetch_related/only() of querysets of safe
+    # requests from their serializer (see `core.eager_loading`)
+    eager_loading = True
+    # answer conditional requests (`If-None-Match`, `If-Match`, ...) with
+    # validators computed from `updated_at` (see `core.conditional`)
+    conditional_requests = True
 
     def not_found(self, request, message=None, code=None):
         raise exceptions.NotFound(detail=message, code=code)
 
+    def get_access_context(self, request):
+        return AccessContext(request, self)
+
     def get_policies(self):
         return [policy() for policy in self.policy_classes]
 
     def check_policies(self, request):
         for policy in self.get_policies():
-            if not policy.has_access(request, self):
+            if not check_access(policy, request, self):
                 self.not_found(
                     request,
                     message=getattr(policy, "message", None),
@@ -22,18 +55,111 @@ class SecureGenericAPIView(generics.GenericAPIView):
 
     def check_object_policies(self, request, obj):
         for policy in self.get_policies():
-            if not policy.has_object_access(request, self, obj):
+            if not check_object_access(policy, request, self, obj):
                 self.not_found(
                     request,
                     message=getattr(policy, "message", None),
                     code=getattr(policy, "code", None)
                 )
 
+    def get_filter_policies(self):
+        return [policy() for policy in self.filter_policy_classes]
+
+    def filter_queryset(self, queryset):
+        queryset = filter_by_policies(
+            queryset, self.get_filter_policies(), self.request, self
+        )
+        queryset = super().filter_queryset(queryset)
+        return self.eager_load(queryset)
+
+    def eager_load(self, queryset):
+        if (
+            not self.eager_loading
+            or self.request.method not in permissions.SAFE_METHODS
+        ):
+            return queryset
+
+        loading = get_eager_loading(self.get_serializer_class(), queryset.model)
+        # single objects go through object permission checks,
+        # which may read any of their fields
+        is_list = (self.lookup_url_kwarg or self.lookup_field) not in self.kwargs
+        return loading.apply(queryset, only=is_list)
+
     def get_object(self):
         obj = super().get_object()
         self.check_object_policies(self.request, obj)
+        self.check_object_preconditions(obj)
         return obj
 
+    def paginate_queryset(self, queryset):
+        self.check_collection_preconditions(queryset)
+        return super().paginate_queryset(queryset)
+
+    def has_validators(self, model):
+        return self.conditional_requests and has_validators(model)
+
+    def check_object_preconditions(self, obj):
+        if not self.has_validators(type(obj)):
+            return
+        # validators are computed again from object when response is
+        # finalized, as it may have been updated by then (first loaded
+        # object is the one updated, views may load it more times)
+        if getattr(self, "conditional_object", None) is None:
+            self.conditional_object = obj
+        check_preconditions(
+            self.request,
+            *get_object_validators(obj, self.request.accepted_media_type),
+        )
+
+    def check_collection_preconditions(self, queryset):
+        if (
+            not self.has_validators(queryset.model)
+            or self.request.method not in permissions.SAFE_METHODS
+            or self.is_keyset_request()
+        ):
+            return
+        last_modified, count = get_queryset_stats(queryset)
+        if isinstance(self.paginator, PageNumberPagination):
+            self.paginator.known_count = count
+        self.collection_validators = get_collection_validators(
+            queryset.model,
+            last_modified,
+            count,
+            self.request.get_full_path(),
+            self.request.user.pk,
+            self.request.accepted_media_type,
+        )
+        check_preconditions(self.request, *self.collection_validators)
+
+    def is_keyset_request(self):
+        # keyset pages don't scan whole collection,
+        # which its validators would have to
+        return isinstance(
+            self.paginator, PageNumberOrKeysetPagination
+        ) and self.paginator.is_keyset_request(self.request)
+
+    def get_validators(self):
+        obj = getattr(self, "conditional_object", None)
+        if obj is not None:
+            return get_object_validators(obj, self.request.accepted_media_type)
+        return getattr(self, "collection_validators", (None, None))
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=exc.status_code)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        is_successful = 200 <= response.status_code < 300 or response.status_code == 304
+        if is_successful and request.method != "DELETE":
+            etag, last_modified = self.get_validators()
+            if etag:
+                response["ETag"] = etag
+            if last_modified:
+                response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
     def initial(self, request, *args, **kwargs):
         """
         Runs anything that needs to occur prior to calling the method handler.
@@ -50,6 +176,7 @@ class SecureGenericAPIView(generics.GenericAPIView):
 
         # Ensure that the incoming request is permitted
         self.perform_authentication(request)
+        request.access = self.get_access_context(request)
         self.check_policies(request)
         self.check_permissions(request)
         self.check_throttles(request)
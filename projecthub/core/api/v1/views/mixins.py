@@ -0,0 +1,95 @@
+from urllib.parse import urlencode
+
+from rest_framework.response import Response
+
+from projecthub.core.cache import response_cache
+from projecthub.core.conditional import check_preconditions
+from projecthub.core.projection import get_projection
+
+
+class ProjectionListMixin:
+    """
+    Serve list requests from `values()` rows through projection of the list
+    serializer (see `core.projection`) instead of model instances. Response
+    is the same as with the serializer.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        projection = get_projection(self.get_serializer_class(), queryset.model)
+        queryset = projection.apply(
+            queryset, extra=self.get_projection_extra_paths(queryset)
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(projection.to_representation(page))
+        return Response(projection.to_representation(queryset))
+
+    def get_projection_extra_paths(self, queryset):
+        """
+        Return paths read besides the serialized ones: primary key and fields
+        (or annotations) rows are ordered by, which keyset pagination encodes
+        into cursors.
+        """
+        paths = [queryset.model._meta.pk.attname]
+        ordering = [*queryset.query.order_by, *queryset.model._meta.ordering]
+        ordering += getattr(self.paginator, "keyset_ordering_fields", ())
+
+        for item in ordering:
+            if not isinstance(item, str):
+                continue
+            name = item.lstrip("-")
+            if name != "pk" and name.isidentifier():
+                paths.append(name)
+        return paths
+
+
+class CachedListMixin:
+    """
+    Serve list requests from `response_cache` (see `core.cache`).
+
+    Views define `get_response_cache_scope()`, the scope whose version
+    changes with any write that can change the list, and
+    `get_response_cache_role()`, the class of users that see the same rows
+    (e.g. everyone who sees all rows, or a single user). Entries are keyed
+    by both, absolute URL and normalized query parameters. Lists are not
+    cached unless the cache is enabled (has its shared tier).
+    """
+
+    response_cache_header = "X-Cache"
+
+    def list(self, request, *args, **kwargs):
+        if not response_cache.enabled:
+            return super().list(request, *args, **kwargs)
+
+        parts = [
+            self.get_response_cache_role(),
+            request.build_absolute_uri(request.path),
+            urlencode(sorted(request.query_params.lists()), doseq=True),
+        ]
+        (data, etag), source = response_cache.get_or_set(
+            self.get_response_cache_scope(),
+            parts,
+            lambda: self.compute_list(request, *args, **kwargs),
+        )
+
+        if etag is not None:
+            # collection validators of cached page (see `SecureGenericAPIView`)
+            self.collection_validators = (etag, None)
+            check_preconditions(request, etag)
+
+        response = Response(data)
+        response[self.response_cache_header] = source.upper()
+        return response
+
+    def compute_list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        etag, _ = getattr(self, "collection_validators", (None, None))
+        return response.data, etag
+
+    def get_response_cache_scope(self):
+        raise NotImplementedError
+
+    def get_response_cache_role(self):
+        raise NotImplementedError
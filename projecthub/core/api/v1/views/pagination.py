@@ -1,13 +1,13 @@
-from rest_framework import pagination
+from projecthub.core.pagination import PageNumberPagination
 
 
-class TenantPagination(pagination.PageNumberPagination):
+class TenantPagination(PageNumberPagination):
     page_size = 30
     max_page_size = 200
     page_size_query_param = "page_size"
 
 
-class TenantMembershipPagination(pagination.PageNumberPagination):
+class TenantMembershipPagination(PageNumberPagination):
     page_size = 30
     max_page_size = 200
     page_size_query_param = "page_size"
\ No newline at end of file
@@ -2,6 +2,7 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, filters, permissions
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.core.api.v1.views.mixins import ProjectionListMixin
 from projecthub.core.api.v1.views.pagination import TenantMembershipPagination
 from projecthub.core.models import TenantMembership
 from projecthub.permissions import (
@@ -24,7 +25,7 @@ from ..serializers import (
 
 
 class TenantMembershipListCreateAPIView(
-    SecureGenericAPIView, generics.ListCreateAPIView
+    SecureGenericAPIView, ProjectionListMixin, generics.ListCreateAPIView
 ):
     policy_classes = [
         IsAuthenticatedPolicy & (IsAdminUserPolicy | IsTenantMemberPolicy)
@@ -0,0 +1,660 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .roles import load_role_index
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache with per-entry TTL.
+
+    Entries are evicted in least-recently-used order once `maxsize` is
+    reached and treated as missing once they are older than `ttl` seconds.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires_at = self._data[key]
+            except KeyError:
+                return default
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=_MISSING):
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class TwoTierCache:
+    """
+    Two-tier cache of values `_load()`-ed by key.
+
+    The first tier is an in-process LRU with a short TTL, the second one is an
+    optional shared Django cache (`<settings_prefix>_ALIAS`). Missing values
+    (None) are cached as well, so the invalidation must run on every write
+    the values depend on. Tiers are configured with `<settings_prefix>_MAX_SIZE`,
+    `_TIMEOUT` and `_SHARED_TIMEOUT` settings.
+    """
+
+    key_prefix = None
+    settings_prefix = None
+    default_timeout = 30
+
+    def __init__(self):
+        self._local = LRUCache(maxsize=self.max_size, ttl=self.timeout)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def get_setting(self, name, default):
+        return getattr(settings, f"{self.settings_prefix}_{name}", default)
+
+    @property
+    def max_size(self):
+        return self.get_setting("MAX_SIZE", 1024)
+
+    @property
+    def timeout(self):
+        return self.get_setting("TIMEOUT", self.default_timeout)
+
+    @property
+    def shared_timeout(self):
+        return self.get_setting("SHARED_TIMEOUT", 300)
+
+    @property
+    def shared_cache(self):
+        alias = self.get_setting("ALIAS", None)
+        return caches[alias] if alias else None
+
+    def get(self, key):
+        """
+        Return value of key. Loads it only if neither tier knows the key.
+        """
+        value = self._local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._incr("local_hits")
+            return self._prepare(value)
+
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            value = shared_cache.get(self._make_key(key), _MISSING)
+            if value is not _MISSING:
+                self._incr("shared_hits")
+                self._local.set(key, value)
+                return self._prepare(value)
+
+        self._incr("misses")
+        value = self._load(key)
+
+        self._local.set(key, value)
+        if shared_cache is not None:
+            shared_cache.set(self._make_key(key), value, timeout=self.shared_timeout)
+        return self._prepare(value)
+
+    def invalidate(self, *keys):
+        shared_cache = self.shared_cache
+        for key in filter(None, keys):
+            self._local.delete(key)
+            if shared_cache is not None:
+                shared_cache.delete(self._make_key(key))
+        self._incr("invalidations")
+
+    def clear(self):
+        self._local = LRUCache(maxsize=self.max_size, ttl=self.timeout)
+        self.reset_stats()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["hits"] = stats["local_hits"] + stats["shared_hits"]
+        stats["size"] = len(self._local)
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {
+                "local_hits": 0,
+                "shared_hits": 0,
+                "misses": 0,
+                "invalidations": 0,
+            }
+
+    def _incr(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _make_key(self, key):
+        return f"{self.key_prefix}{key}"
+
+    def _prepare(self, value):
+        """Return value handed out to callers."""
+        return value
+
+    def _load(self, key):
+        raise NotImplementedError
+
+
+class TenantCache(TwoTierCache):
+    """
+    Cache of tenants keyed by sub_domain, unknown sub_domains included
+    (see `projecthub.core.signals` for invalidation).
+    """
+
+    key_prefix = "tenant:sub_domain:"
+    settings_prefix = "TENANT_CACHE"
+
+    def get(self, sub_domain):
+        """
+        Return tenant with given sub_domain or None if it does not exist.
+        Hits the database only if neither tier knows the sub_domain.
+        """
+        return super().get(sub_domain)
+
+    def _prepare(self, tenant):
+        return copy.copy(tenant)
+
+    def _load(self, sub_domain):
+        from .models import Tenant
+
+        try:
+            return Tenant.objects.get(sub_domain=sub_domain)
+        except Tenant.DoesNotExist:
+            return None
+
+
+class RoleIndexCache(TwoTierCache):
+    """
+    Cache of role indexes (see `core.roles`) keyed by user id.
+
+    Policies rely on the index, so it skips the in-process tier, which other
+    processes can't invalidate: indexes are kept in the shared tier only and
+    loaded on every call without it.
+    """
+
+    key_prefix = "roles:user:"
+    settings_prefix = "ROLE_INDEX_CACHE"
+
+    def get(self, user_id):
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            value = shared_cache.get(self._make_key(user_id), _MISSING)
+            if value is not _MISSING:
+                self._incr("shared_hits")
+                return value
+
+        self._incr("misses")
+        value = self._load(user_id)
+        if shared_cache is not None:
+            shared_cache.set(
+                self._make_key(user_id), value, timeout=self.shared_timeout
+            )
+        return value
+
+    def _load(self, user_id):
+        return load_role_index(user_id)
+
+
+tenant_cache = TenantCache()
+role_index_cache = RoleIndexCache()
+
+
+class ResponseCache:
+    """
+    Two-tier cache of API responses with versioned keys.
+
+    Responses are cached under a version of their scope (e.g. a tenant
+    or a project), which writes bump (see `projecthub.core.signals`), so
+    stale entries are never read again and just expire. The first tier is
+    an in-process LRU, the second one is a shared Django cache
+    (`RESPONSE_CACHE_ALIAS`, e.g. Redis), which also holds versions, locks
+    and stats. Without it versions would be per-process and writes of other
+    processes (other workers, Celery) couldn't invalidate entries, so views
+    don't use the cache unless it's set (see `enabled`).
+
+    Only one request computes a missing entry at a time (per process, and
+    across processes with the shared tier), others wait for it up to
+    `RESPONSE_CACHE_LOCK_WAIT` seconds and then compute it themselves.
+    """
+
+    key_prefix = "response:"
+    stat_names = ("local_hits", "shared_hits", "misses", "waits", "invalidations")
+    poll_interval = 0.05
+
+    def __init__(self):
+        self._local = LRUCache(maxsize=self.max_size, ttl=self.timeout)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._versions = {}
+        self.reset_stats()
+
+    @property
+    def enabled(self):
+        """Whether responses are cached, which requires the shared tier."""
+        return self.shared_cache is not None
+
+    @property
+    def max_size(self):
+        return getattr(settings, "RESPONSE_CACHE_MAX_SIZE", 512)
+
+    @property
+    def timeout(self):
+        return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 30)
+
+    @property
+    def shared_timeout(self):
+        return getattr(settings, "RESPONSE_CACHE_SHARED_TIMEOUT", 300)
+
+    @property
+    def lock_timeout(self):
+        return getattr(settings, "RESPONSE_CACHE_LOCK_TIMEOUT", 10)
+
+    @property
+    def lock_wait(self):
+        return getattr(settings, "RESPONSE_CACHE_LOCK_WAIT", 2)
+
+    @property
+    def shared_cache(self):
+        alias = getattr(settings, "RESPONSE_CACHE_ALIAS", None)
+        return caches[alias] if alias else None
+
+    def get_or_set(self, scope, parts, compute):
+        """
+        Return `(value, source)` of entry identified by `parts` under current
+        version of `scope`, where source is "local", "shared" or "miss".
+        Missing entry is computed with `compute()`.
+        """
+        key = self._make_key(scope, self.get_version(scope), parts)
+
+        entry = self._get(key)
+        if entry is not _MISSING:
+            return entry
+
+        with self._key_lock(key):
+            # computed by other thread while this one was waiting
+            value = self._local.get(key, _MISSING)
+            if value is not _MISSING:
+                self._incr("waits")
+                return value, "local"
+
+            with self._shared_lock(key) as locked:
+                if not locked:
+                    value = self._wait(key)
+                    if value is not _MISSING:
+                        self._incr("waits")
+                        return value, "shared"
+
+                self._incr("misses")
+                value = compute()
+                self._set(key, value)
+                return value, "miss"
+
+    def get_version(self, scope):
+        shared_cache = self.shared_cache
+        if shared_cache is None:
+            with self._lock:
+                return self._versions.get(scope, 0)
+
+        key = self._make_version_key(scope)
+        version = shared_cache.get(key)
+        if version is None:
+            # versions start from current time, so entries cached under
+            # versions that were evicted can't be read again
+            shared_cache.add(key, time.time_ns(), timeout=None)
+            version = shared_cache.get(key)
+        return version
+
+    def bump(self, *scopes):
+        """Bump versions of scopes, which invalidates their entries."""
+        if not scopes:
+            return
+        shared_cache = self.shared_cache
+        for scope in set(scopes):
+            if shared_cache is None:
+                with self._lock:
+                    self._versions[scope] = self._versions.get(scope, 0) + 1
+                continue
+
+            key = self._make_version_key(scope)
+            try:
+                shared_cache.incr(key)
+            except ValueError:
+                shared_cache.add(key, time.time_ns(), timeout=None)
+        self._incr("invalidations")
+
+    def invalidate(self, *scopes):
+        if not scopes:
+            return
+        self.bump(*scopes)
+        # bump once more after commit, so a concurrent request can't cache
+        # rows as they were before this transaction under the new version
+        transaction.on_commit(lambda: self.bump(*scopes))
+
+    def clear(self):
+        self._local = LRUCache(maxsize=self.max_size, ttl=self.timeout)
+        with self._lock:
+            self._versions.clear()
+        self.reset_stats()
+
+    def stats(self):
+        shared_cache = self.shared_cache
+        if shared_cache is None:
+            with self._lock:
+                stats = dict(self._stats)
+        else:
+            keys = {self._make_stat_key(name): name for name in self.stat_names}
+            values = shared_cache.get_many(keys)
+            stats = {name: values.get(key, 0) for key, name in keys.items()}
+
+        stats["hits"] = stats["local_hits"] + stats["shared_hits"] + stats["waits"]
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / requests if requests else 0.0
+        stats["local_hit_ratio"] = stats["local_hits"] / requests if requests else 0.0
+        stats["size"] = len(self._local)
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = dict.fromkeys(self.stat_names, 0)
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            shared_cache.delete_many(
+                [self._make_stat_key(name) for name in self.stat_names]
+            )
+
+    def _get(self, key):
+        """Return `(value, source)` of cached entry or `_MISSING`."""
+        value = self._local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._incr("local_hits")
+            return value, "local"
+
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            value = shared_cache.get(key, _MISSING)
+            if value is not _MISSING:
+                self._incr("shared_hits")
+                self._local.set(key, value)
+                return value, "shared"
+        return _MISSING
+
+    def _set(self, key, value):
+        self._local.set(key, value)
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            shared_cache.set(key, value, timeout=self.shared_timeout)
+
+    def _wait(self, key):
+        """Wait for entry computed by other process."""
+        deadline = time.monotonic() + self.lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            value = self.shared_cache.get(key, _MISSING)
+            if value is not _MISSING:
+                self._local.set(key, value)
+                return value
+        return _MISSING
+
+    @contextmanager
+    def _key_lock(self, key):
+        with self._lock:
+            lock, users = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._key_locks[key]
+                if users == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (lock, users - 1)
+
+    @contextmanager
+    def _shared_lock(self, key):
+        shared_cache = self.shared_cache
+        if shared_cache is None:
+            yield True
+            return
+
+        lock_key = f"{key}:lock"
+        locked = shared_cache.add(lock_key, 1, timeout=self.lock_timeout)
+        try:
+            yield locked
+        finally:
+            if locked:
+                shared_cache.delete(lock_key)
+
+    def _incr(self, name):
+        with self._lock:
+            self._stats[name] += 1
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            key = self._make_stat_key(name)
+            try:
+                shared_cache.incr(key)
+            except ValueError:
+                shared_cache.set(key, 1, timeout=None)
+
+    def _make_key(self, scope, version, parts):
+        digest = hashlib.md5(
+            "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+        )
+        return f"{self.key_prefix}{scope}:{version}:{digest.hexdigest()}"
+
+    def _make_version_key(self, scope):
+        return f"{self.key_prefix}version:{scope}"
+
+    def _make_stat_key(self, name):
+        return f"{self.key_prefix}stats:{name}"
+
+
+def tenant_scope(tenant_id):
+    """Scope of responses that depend on projects of tenant."""
+    return f"tenant:{tenant_id}"
+
+
+def project_scope(project_id):
+    """Scope of responses that depend on tasks, boards and members of project."""
+    return f"project:{project_id}"
+
+
+response_cache = ResponseCache()
+
+
+class PresignedURLCache:
+    """
+    In-process LRU cache of presigned URLs of files of storages which sign
+    them (`querystring_auth`, e.g. `S3Storage`), so rendering lists of files
+    doesn't sign every URL of every response.
+
+    URLs are cached by storage, file name and expiry bucket: time split into
+    windows of `querystring_expire - PRESIGNED_URL_CACHE_MARGIN` seconds. URL
+    signed in a window is reused until the window ends, so it's valid for at
+    least the margin when handed out. URLs of storages that don't sign them
+    aren't cached.
+
+    Stats of processes are summed in shared cache (`PRESIGNED_URL_CACHE_ALIAS`)
+    if it's set: every process adds its counters at most once per
+    `PRESIGNED_URL_CACHE_STATS_INTERVAL` seconds, as a round trip per URL
+    would cost more than signing it.
+    """
+
+    stat_names = ("hits", "misses", "signing_time", "saved_time")
+    key_prefix = "presigned:"
+
+    def __init__(self):
+        self._local = LRUCache(maxsize=self.max_size)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def max_size(self):
+        return getattr(settings, "PRESIGNED_URL_CACHE_MAX_SIZE", 4096)
+
+    @property
+    def margin(self):
+        return getattr(settings, "PRESIGNED_URL_CACHE_MARGIN", 300)
+
+    @property
+    def stats_interval(self):
+        return getattr(settings, "PRESIGNED_URL_CACHE_STATS_INTERVAL", 60)
+
+    @property
+    def shared_cache(self):
+        alias = getattr(settings, "PRESIGNED_URL_CACHE_ALIAS", None)
+        return caches[alias] if alias else None
+
+    def get_url(self, file):
+        """Return URL of file (`FieldFile`) signed at most one window ago."""
+        storage = file.storage
+        if not getattr(storage, "querystring_auth", False):
+            return file.url
+
+        window = storage.querystring_expire - self.margin
+        if window <= 0:
+            return file.url
+
+        now = time.time()
+        bucket = int(now // window)
+        key = (*self._get_storage_key(storage), file.name, bucket)
+        url = self._local.get(key)
+        if url is not None:
+            # each hit saves one signing of average duration
+            self._record(hits=1, saved_time=self._average_signing_time())
+            return url
+
+        started = time.perf_counter()
+        url = file.url
+        signing_time = time.perf_counter() - started
+        self._local.set(key, url, ttl=(bucket + 1) * window - now)
+        self._record(misses=1, signing_time=signing_time)
+        return url
+
+    def clear(self):
+        self._local = LRUCache(maxsize=self.max_size)
+        self.reset_stats()
+
+    def stats(self):
+        """
+        Return hits and misses, total `signing_time` of misses and estimated
+        `saved_time` of hits (in seconds), hit ratio and size of cache (of
+        this process). Counters are of all processes with shared cache.
+        """
+        shared_cache = self.shared_cache
+        if shared_cache is None:
+            with self._lock:
+                stats = dict(self._stats)
+        else:
+            self.publish_stats()
+            keys = {self._make_stat_key(name): name for name in self.stat_names}
+            values = shared_cache.get_many(keys)
+            stats = {name: values.get(key, 0) for key, name in keys.items()}
+            # times are shared in microseconds, as the cache adds integers
+            for name in ("signing_time", "saved_time"):
+                stats[name] /= 1_000_000
+
+        requests = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / requests if requests else 0.0
+        stats["size"] = len(self._local)
+        return stats
+
+    def publish_stats(self):
+        """Add counters collected since last publishing to shared cache."""
+        shared_cache = self.shared_cache
+        with self._lock:
+            unpublished = self._unpublished
+            self._unpublished = dict.fromkeys(self.stat_names, 0)
+            self._published_at = time.monotonic()
+        if shared_cache is None:
+            return
+
+        for name, value in unpublished.items():
+            if name in ("signing_time", "saved_time"):
+                value = round(value * 1_000_000)
+            if not value:
+                continue
+            key = self._make_stat_key(name)
+            try:
+                shared_cache.incr(key, value)
+            except ValueError:
+                shared_cache.set(key, value, timeout=None)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = dict.fromkeys(self.stat_names, 0)
+            self._unpublished = dict.fromkeys(self.stat_names, 0)
+            self._published_at = time.monotonic()
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            shared_cache.delete_many(
+                [self._make_stat_key(name) for name in self.stat_names]
+            )
+
+    def _record(self, **values):
+        with self._lock:
+            for name, value in values.items():
+                self._stats[name] += value
+                self._unpublished[name] += value
+            due = time.monotonic() - self._published_at >= self.stats_interval
+        if due and self.shared_cache is not None:
+            self.publish_stats()
+
+    def _average_signing_time(self):
+        misses = self._stats["misses"]
+        return self._stats["signing_time"] / misses if misses else 0.0
+
+    def _make_stat_key(self, name):
+        return f"{self.key_prefix}stats:{name}"
+
+    def _get_storage_key(self, storage):
+        storage_class = type(storage)
+        return (
+            f"{storage_class.__module__}.{storage_class.__qualname__}",
+            getattr(storage, "bucket_name", None),
+            getattr(storage, "location", None),
+        )
+
+
+presigned_url_cache = PresignedURLCache()
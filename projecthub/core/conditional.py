@@ -0,0 +1,85 @@
+"""
+Validators of conditional requests.
+
+Validators of objects are computed from their `updated_at`. Validators of
+collections are computed from `MAX(updated_at)` and count of rows of the
+filtered queryset (new and changed rows change the maximum, deleted rows
+the count), so unchanged lists are answered with 304 before they are
+loaded and serialized. Collections have no `Last-Modified`, as it can't
+reflect deleted rows.
+"""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = "Not modified."
+    default_code = "not_modified"
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "Precondition failed."
+    default_code = "precondition_failed"
+
+
+def has_validators(model):
+    return any(field.name == "updated_at" for field in model._meta.concrete_fields)
+
+
+def make_etag(*parts):
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    )
+    return f'"{digest.hexdigest()}"'
+
+
+def get_object_validators(obj, *parts):
+    """Return `(etag, last_modified)` of object."""
+    etag = make_etag(obj._meta.label, obj.pk, obj.updated_at.isoformat(), *parts)
+    return etag, obj.updated_at
+
+
+def get_queryset_stats(queryset):
+    """Return `(MAX(updated_at), count)` of rows of `queryset`."""
+    stats = queryset.order_by().aggregate(
+        last_modified=Max("updated_at"), count=Count("pk")
+    )
+    return stats["last_modified"], stats["count"]
+
+
+def get_collection_validators(model, last_modified, count, *parts):
+    """Return `(etag, None)` of collection of `count` rows of `model`."""
+    etag = make_etag(
+        model._meta.label,
+        last_modified.isoformat() if last_modified else "",
+        count,
+        *parts,
+    )
+    return etag, None
+
+
+def check_preconditions(request, etag, last_modified=None):
+    """
+    Evaluate `If-Match`, `If-Unmodified-Since`, `If-None-Match` and
+    `If-Modified-Since` headers of request against validators.
+
+    Raises `NotModified` for safe requests and `PreconditionFailed` for
+    others when they fail.
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is None:
+        return
+    if response.status_code == status.HTTP_304_NOT_MODIFIED:
+        raise NotModified()
+    raise PreconditionFailed()
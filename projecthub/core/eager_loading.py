@@ -0,0 +1,154 @@
+"""
+Eager loading derived from read serializers.
+
+`get_eager_loading()` walks declared fields of serializer (including nested
+serializers and dotted sources like `board.name`) and collects relations to
+`select_related` (forward foreign keys), relations to `prefetch_related`
+(reverse and many-to-many relations) and fields to load with `only()`, so
+querysets can be serialized without N+1 queries.
+
+Fields that can't be mapped to model fields (`SerializerMethodField`,
+properties, ...) may read anything, so the model they are read from is
+loaded with all its fields.
+"""
+
+import re
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+DISPLAY_METHOD_RE = re.compile(r"get_(\w+)_display")
+
+
+class EagerLoading:
+
+    def __init__(self):
+        self.select_related = set()
+        self.prefetch_related = set()
+        # fields for `only()`, None if all fields of model are needed
+        self.only = set()
+
+    def apply(self, queryset, only=True):
+        """
+        Apply eager loading to `queryset`. `only()` is skipped when
+        `only` is False or when queryset already restricts loaded fields
+        or follows other relations.
+        """
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(self.prefetch_related))
+
+        query = queryset.query
+        can_restrict = (
+            query.deferred_loading == (frozenset(), True)
+            and query.select_related is not True
+            and set(get_select_related_paths(query.select_related))
+            <= self.select_related
+        )
+        if only and self.only is not None and can_restrict:
+            queryset = queryset.only(*self.only, *get_ordering_fields(queryset))
+        return queryset
+
+    def add_field(self, prefix, name):
+        if self.only is not None:
+            self.only.add(prefix + name)
+
+    def add_all_fields(self, prefix, model):
+        if not prefix:
+            self.only = None
+            return
+        for field in model._meta.concrete_fields:
+            self.add_field(prefix, field.name)
+
+
+@lru_cache(maxsize=None)
+def get_eager_loading(serializer_class, model):
+    loading = EagerLoading()
+    collect_serializer(serializer_class(), model, "", loading, prefetched=False)
+    return loading
+
+
+def collect_serializer(serializer, model, prefix, loading, prefetched):
+    if not prefetched:
+        loading.add_field(prefix, model._meta.pk.name)
+
+    for field in serializer.fields.values():
+        if field.source == "*":
+            if isinstance(field, BaseSerializer):
+                collect_serializer(field, model, prefix, loading, prefetched)
+            elif not prefetched:
+                loading.add_all_fields(prefix, model)
+            continue
+        collect_attrs(field, field.source_attrs, model, prefix, loading, prefetched)
+
+
+def collect_attrs(field, attrs, model, prefix, loading, prefetched):
+    attr, rest = attrs[0], attrs[1:]
+    model_field = get_model_field(model, attr)
+    if model_field is None:
+        if not prefetched:
+            loading.add_all_fields(prefix, model)
+        return
+
+    path = prefix + model_field.name
+    is_nested = bool(rest) or isinstance(field, BaseSerializer)
+    many = model_field.many_to_many or model_field.one_to_many
+
+    if not model_field.is_relation or not (is_nested or many):
+        # plain field or related field represented by primary key
+        if model_field.concrete and not prefetched:
+            loading.add_field(prefix, model_field.name)
+        return
+
+    if many:
+        loading.prefetch_related.add(path)
+        prefetched = True
+    elif prefetched:
+        loading.prefetch_related.add(path)
+    else:
+        if model_field.concrete:
+            loading.add_field(prefix, model_field.name)
+        loading.select_related.add(path)
+
+    related_model = model_field.related_model
+    if rest:
+        collect_attrs(field, rest, related_model, path + "__", loading, prefetched)
+    else:
+        child = field.child if isinstance(field, ListSerializer) else field
+        collect_serializer(child, related_model, path + "__", loading, prefetched)
+
+
+def get_model_field(model, attr):
+    """Return model field `attr` reads (supports `get_<field>_display`)."""
+    if attr == "pk":
+        return model._meta.pk
+    match = DISPLAY_METHOD_RE.fullmatch(attr)
+    if match:
+        attr = match.group(1)
+    try:
+        return model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        return None
+
+
+def get_select_related_paths(select_related, prefix=""):
+    if not isinstance(select_related, dict):
+        return
+    for name, nested in select_related.items():
+        yield prefix + name
+        yield from get_select_related_paths(nested, f"{prefix}{name}__")
+
+
+def get_ordering_fields(queryset):
+    """Names of model fields queryset is ordered by (read by paginators)."""
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    names = set()
+    for item in ordering:
+        if not isinstance(item, str):
+            continue
+        name = item.lstrip("-")
+        if get_model_field(queryset.model, name) is not None and name != "pk":
+            names.add(name)
+    return names
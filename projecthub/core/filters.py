@@ -1,5 +1,14 @@
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchRank
+from django.db import connections
+from django.db.models import F
 from django.forms import MultipleChoiceField
 from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+from projecthub.core.search import build_search_query, is_searchable
 
 
 # TODO: test
@@ -21,4 +30,57 @@ class MultipleValueFilter(filters.Filter):
 
     def __init__(self, *args, field_class, **kwargs):
         kwargs.setdefault('lookup_expr', 'in')
-        super().__init__(*args, field_class=field_class, **kwargs)
\ No newline at end of file
+        super().__init__(*args, field_class=field_class, **kwargs)
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    Full-text search over model's `search_vector`, ordered by relevance
+    unless explicit ordering is requested.
+
+    Falls back to `SearchFilter` (`icontains` over `search_fields`) on
+    databases other than PostgreSQL and for models without search vector.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = build_search_query(" ".join(self.get_search_terms(request)))
+        if query is None or not self.use_full_text_search(queryset):
+            return super().filter_queryset(request, queryset, view)
+
+        queryset = queryset.filter(search_vector=query)
+        if api_settings.ORDERING_PARAM in request.query_params:
+            return queryset
+
+        return queryset.annotate(
+            search_rank=SearchRank(F("search_vector"), query)
+        ).order_by("-search_rank", *queryset.model._meta.ordering, "pk")
+
+    def use_full_text_search(self, queryset):
+        vendor = connections[queryset.db].vendor
+        return vendor == "postgresql" and is_searchable(queryset.model)
+
+
+class UsernameFilter(filters.CharFilter):
+    """
+    Filter by case-insensitive substring of username of user in `field_name`.
+
+    Instead of joining users table for every filtered row, matching users
+    are looked up once (trigram-indexed on PostgreSQL) and rows are
+    filtered by `<field_name>_id IN (...)`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("lookup_expr", "icontains")
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        user_ids = (
+            get_user_model()
+            .objects.filter(**{f"username__{self.lookup_expr}": value})
+            .values("pk")
+        )
+        qs = qs.filter(**{f"{self.field_name}__in": user_ids})
+        return qs.distinct() if self.distinct else qs
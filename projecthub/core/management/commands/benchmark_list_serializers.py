@@ -0,0 +1,78 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from projecthub.comments.api.v1.serializers import CommentListSerializer
+from projecthub.comments.models import Comment
+from projecthub.core.api.v1.serializers import TenantMembershipListSerializer
+from projecthub.core.eager_loading import get_eager_loading
+from projecthub.core.models import TenantMembership
+from projecthub.core.projection import get_projection
+from projecthub.projects.api.v1.serializers import (
+    ProjectListSerializer,
+    ProjectMembershipListSerializer,
+)
+from projecthub.projects.models import Project, ProjectMembership
+from projecthub.tasks.api.v1.serializers import TaskListSerializer
+from projecthub.tasks.models import Task
+
+SERIALIZERS = [
+    (TaskListSerializer, Task),
+    (ProjectListSerializer, Project),
+    (CommentListSerializer, Comment),
+    (ProjectMembershipListSerializer, ProjectMembership),
+    (TenantMembershipListSerializer, TenantMembership),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput (rows per second) of list serializers and their "
+        "projections on a page of existing rows, including query and JSON "
+        "rendering."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200, help="Rows per page.")
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Number of timed runs."
+        )
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        renderer = JSONRenderer()
+
+        for serializer_class, model in SERIALIZERS:
+            queryset = model._default_manager.order_by("pk")
+            loading = get_eager_loading(serializer_class, model)
+            projection = get_projection(serializer_class, model)
+
+            def serialize():
+                page = list(loading.apply(queryset)[:rows])
+                return renderer.render(serializer_class(page, many=True).data)
+
+            def project():
+                page = list(projection.apply(queryset)[:rows])
+                return renderer.render(projection.to_representation(page))
+
+            count = queryset[:rows].count()
+            if not count:
+                self.stdout.write(f"{serializer_class.__name__}: no rows, skipped.")
+                continue
+
+            serializer_rate = count * repeat / self.measure(serialize, repeat)
+            projection_rate = count * repeat / self.measure(project, repeat)
+            self.stdout.write(
+                f"{serializer_class.__name__} ({count} rows): "
+                f"serializer {serializer_rate:.0f} rows/s, "
+                f"projection {projection_rate:.0f} rows/s "
+                f"({projection_rate / serializer_rate:.1f}x)"
+            )
+
+    def measure(self, func, repeat):
+        func()  # warm up
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return time.perf_counter() - started
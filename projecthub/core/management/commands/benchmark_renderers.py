@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from projecthub.comments.api.v1.serializers import CommentListSerializer
+from projecthub.comments.models import Comment
+from projecthub.core.eager_loading import get_eager_loading
+from projecthub.core.renderers import ORJSONRenderer
+from projecthub.projects.api.v1.serializers import ProjectListSerializer
+from projecthub.projects.models import Project
+from projecthub.tasks.api.v1.serializers import TaskListSerializer
+from projecthub.tasks.models import Task
+
+SERIALIZERS = [
+    (TaskListSerializer, Task),
+    (ProjectListSerializer, Project),
+    (CommentListSerializer, Comment),
+]
+RENDERERS = [JSONRenderer, ORJSONRenderer]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rendering time and size of responses of JSON renderers "
+        "on list pages of existing tasks, projects and comments."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200, help="Rows per page.")
+        parser.add_argument(
+            "--repeat", type=int, default=100, help="Number of timed runs."
+        )
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+
+        for serializer_class, model in SERIALIZERS:
+            queryset = model._default_manager.order_by("pk")
+            queryset = get_eager_loading(serializer_class, model).apply(queryset)
+            page = list(queryset[:rows])
+            if not page:
+                self.stdout.write(f"{serializer_class.__name__}: no rows, skipped.")
+                continue
+
+            data = serializer_class(page, many=True).data
+            results = []
+            for renderer_class in RENDERERS:
+                renderer = renderer_class()
+                content = renderer.render(data)
+                elapsed = self.measure(lambda: renderer.render(data), repeat)
+                results.append(
+                    f"{renderer_class.__name__} "
+                    f"{elapsed / repeat * 1000:.2f} ms, {len(content)} bytes"
+                )
+            self.stdout.write(
+                f"{serializer_class.__name__} ({len(page)} rows): " + "; ".join(results)
+            )
+
+    def measure(self, func, repeat):
+        func()  # warm up
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        return time.perf_counter() - started
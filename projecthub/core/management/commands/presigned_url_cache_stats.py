@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from projecthub.core.cache import presigned_url_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Print hit ratio of the presigned URL cache and signing time it saved. "
+        "Stats are summed over all processes only when "
+        "PRESIGNED_URL_CACHE_ALIAS is set."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset stats after printing."
+        )
+
+    def handle(self, *args, **options):
+        stats = presigned_url_cache.stats()
+        self.stdout.write(f"hit ratio: {stats['hit_ratio']:.2%}")
+        self.stdout.write(f"saved time: {stats['saved_time']:.3f}s")
+        for name in ("hits", "misses", "signing_time"):
+            self.stdout.write(f"{name}: {stats[name]}")
+
+        if options["reset"]:
+            presigned_url_cache.reset_stats()
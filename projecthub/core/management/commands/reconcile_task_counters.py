@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from projecthub.tasks.counters import reconcile_task_counters
+from projecthub.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount comment, reply and attachment counters of tasks "
+        "and repair those that have drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            dest="project_ids",
+            action="append",
+            metavar="PROJECT_ID",
+            help="Reconcile tasks of project only (may be repeated).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of tasks checked per query.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report tasks with drifted counters.",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Task.objects.all()
+        if options["project_ids"]:
+            queryset = queryset.filter(project_id__in=options["project_ids"])
+
+        drifted = reconcile_task_counters(
+            queryset, chunk_size=options["chunk_size"], dry_run=options["dry_run"]
+        )
+        action = "found" if options["dry_run"] else "repaired"
+        self.stdout.write(f"{drifted} tasks with drifted counters {action}.")
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from projecthub.core.cache import response_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Print hit ratios of the response cache. Stats are shared by all "
+        "processes only when its shared tier (RESPONSE_CACHE_ALIAS) is set."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset stats after printing."
+        )
+
+    def handle(self, *args, **options):
+        stats = response_cache.stats()
+        self.stdout.write(
+            f"hit ratio: {stats['hit_ratio']:.2%} "
+            f"(local {stats['local_hit_ratio']:.2%})"
+        )
+        for name in (*response_cache.stat_names, "hits"):
+            self.stdout.write(f"{name}: {stats[name]}")
+
+        if options["reset"]:
+            response_cache.reset_stats()
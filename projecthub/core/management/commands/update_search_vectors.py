@@ -0,0 +1,77 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from projecthub.core.search import build_search_vector, is_searchable
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild full-text search vectors of searchable models "
+        "(tasks, projects, comments) in chunks. PostgreSQL only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            metavar="app_label.ModelName",
+            help="Models to update (all searchable models by default).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rows updated per query.",
+        )
+        parser.add_argument(
+            "--only-missing",
+            action="store_true",
+            help="Update only rows without search vector.",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        database = options["database"]
+        if connections[database].vendor != "postgresql":
+            raise CommandError("Full-text search requires PostgreSQL.")
+
+        for model in self.get_models(options["models"]):
+            updated = self.update_model(
+                model, database, options["chunk_size"], options["only_missing"]
+            )
+            self.stdout.write(f"{model._meta.label}: {updated} rows updated.")
+
+    def get_models(self, labels):
+        if not labels:
+            return [model for model in apps.get_models() if is_searchable(model)]
+
+        models = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            if not is_searchable(model):
+                raise CommandError(f"{label} has no search vector.")
+            models.append(model)
+        return models
+
+    def update_model(self, model, database, chunk_size, only_missing):
+        queryset = model._default_manager.using(database).order_by("pk")
+        if only_missing:
+            queryset = queryset.filter(search_vector__isnull=True)
+        vector = build_search_vector(model.search_vector_fields)
+
+        updated = 0
+        last_pk = None
+        while True:
+            chunk = queryset
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list("pk", flat=True)[:chunk_size])
+            if not pks:
+                return updated
+
+            updated += queryset.filter(pk__in=pks).update(search_vector=vector)
+            last_pk = pks[-1]
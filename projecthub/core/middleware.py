@@ -1,6 +1,8 @@
 from django.core.exceptions import PermissionDenied
 from django.http import Http404
 
+from .cache import tenant_cache
+
 
 class TenantMiddleware:
     def __init__(self, get_response):
@@ -32,15 +34,10 @@ class TenantMiddleware:
         return parts[0] if len(parts) > 1 else None
 
     def get_tenant(self, sub_domain):
-        from .models import Tenant
-
-        try:
-            tenant = Tenant.objects.get(sub_domain=sub_domain)
-            if tenant.is_inactive:
-                raise PermissionDenied("Tenant is inactive.")
-            return tenant
-        except Tenant.DoesNotExist:
-            return None
+        tenant = tenant_cache.get(sub_domain)
+        if tenant is not None and tenant.is_inactive:
+            raise PermissionDenied("Tenant is inactive.")
+        return tenant
 
     def is_whitelisted_path(self, path):
         return any(path.startswith(p) for p in self.whitelist_paths)
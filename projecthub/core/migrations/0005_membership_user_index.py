@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_alter_tenant_sub_domain"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # new indexes are created before the ones they replace are dropped
+        migrations.AddIndex(
+            model_name="tenantmembership",
+            index=models.Index(
+                fields=["user", "tenant"], name="tenant_membership_user_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tenantmembership",
+            name="tenant",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Tenant that owns this member.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="members",
+                to="core.tenant",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tenantmembership",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="User that is member of tenant.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tenants",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
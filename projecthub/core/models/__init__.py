@@ -1,3 +1,3 @@
-from .base import UUIDModel, TimestampedModel
+from .base import UUIDModel, TimestampedModel, TrackedModel
 from .tenant import Tenant
 from .tenant_membership import TenantMembership
@@ -17,6 +17,70 @@ class TimestampedModel(models.Model):
             )
         ]
 
+    def save(self, *args, **kwargs):
+        # `updated_at` is the validator of conditional requests,
+        # so every update of existing row must bump it
+        if not self._state.adding:
+            self.updated_at = timezone.now()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "updated_at"}
+        super().save(*args, **kwargs)
+
+
+class TrackedModel(models.Model):
+    """
+    Remembers values of `tracked_fields` as they were loaded from (or last
+    saved to) the database, so changes can be detected without reading
+    the row again.
+    """
+
+    tracked_fields = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._store_original_values()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._store_original_values(kwargs.get("update_fields"))
+
+    def get_original_value(self, field_name):
+        """
+        Return value (`attname` value, e.g. id for foreign keys) of tracked
+        field as it is in the database. Unsaved instances have no original
+        values.
+        """
+        attname = self._meta.get_field(field_name).attname
+        return getattr(self, "_original_values", {}).get(attname)
+
+    def has_original_value(self, field_name):
+        attname = self._meta.get_field(field_name).attname
+        return attname in getattr(self, "_original_values", {})
+
+    def has_changed(self, field_name):
+        attname = self._meta.get_field(field_name).attname
+        original_values = getattr(self, "_original_values", {})
+        if attname not in original_values:
+            return True
+        return original_values[attname] != getattr(self, attname)
+
+    def _store_original_values(self, update_fields=None):
+        original_values = getattr(self, "_original_values", {})
+        for name in self.tracked_fields:
+            attname = self._meta.get_field(name).attname
+            if update_fields is not None and not {name, attname} & set(update_fields):
+                continue
+            # deferred fields are not loaded, so their values aren't known
+            if attname in self.__dict__:
+                original_values[attname] = self.__dict__[attname]
+        self._original_values = original_values
+
 
 class UUIDModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
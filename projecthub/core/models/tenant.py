@@ -1,9 +1,9 @@
 from django.conf import settings
 from django.core.validators import RegexValidator
 from django.db import models
-from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
+from projecthub.core.roles import get_role_index
 from .base import UUIDModel, TimestampedModel
 
 
@@ -12,7 +12,7 @@ class TenantQuerySet(models.QuerySet):
     def visible_to(self, user):
         if user.is_staff:
             return self
-        return self.filter(Q(owner=user) | Q(members__user=user))
+        return self.filter(pk__in=get_role_index(user).tenant_ids)
 
 
 class Tenant(UUIDModel, TimestampedModel):
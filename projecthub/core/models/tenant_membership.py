@@ -19,12 +19,14 @@ class TenantMembership(UUIDModel, TimestampedModel):
         "Tenant",
         on_delete=models.CASCADE,
         related_name="members",
+        db_index=False,  # covered by `unique_tenant_user`
         help_text=_("Tenant that owns this member."),
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="tenants",
+        db_index=False,  # covered by `tenant_membership_user_idx`
         help_text=_("User that is member of tenant."),
     )
     role = models.CharField(
@@ -60,6 +62,10 @@ class TenantMembership(UUIDModel, TimestampedModel):
                 fields=["tenant", "user"], name="unique_tenant_user"
             )
         ]
+        indexes = [
+            # tenants of user
+            models.Index(fields=["user", "tenant"], name="tenant_membership_user_idx"),
+        ]
 
     def __str__(self):
         role = self.get_role_display()
@@ -0,0 +1,88 @@
+import logging
+
+from django.contrib.postgres.operations import CreateExtension
+from django.db import migrations
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresOnlyMixin:
+    """
+    Runs database side of migration operation only on PostgreSQL, while still
+    updating migration state, so models can declare PostgreSQL-specific
+    features and test databases (SQLite) can be migrated as well.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgresAddIndex(PostgresOnlyMixin, migrations.AddIndex):
+    pass
+
+
+class PostgresRunSQL(PostgresOnlyMixin, migrations.RunSQL):
+    pass
+
+
+class CreateExtensionIfAvailable(CreateExtension):
+    """
+    Creates PostgreSQL extension if database server ships it. Otherwise
+    migration goes on without it, and operations that depend on the
+    extension (`ExtensionAddIndex`) are skipped.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        if not extension_available(schema_editor, self.name):
+            logger.warning(
+                "PostgreSQL extension %s is not available, skipping.", self.name
+            )
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+class ExtensionAddIndex(PostgresAddIndex):
+    """
+    Adds index that depends on PostgreSQL `extension` (e.g. operator class
+    from pg_trgm), if the extension is installed.
+    """
+
+    def __init__(self, model_name, index, extension):
+        super().__init__(model_name, index)
+        self.extension = extension
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        kwargs["extension"] = self.extension
+        return name, args, kwargs
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        if not extension_installed(schema_editor, self.extension):
+            logger.warning(
+                "PostgreSQL extension %s is not installed, skipping index %s.",
+                self.extension,
+                self.index.name,
+            )
+            return
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+
+def extension_available(schema_editor, name):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = %s", [name])
+        return cursor.fetchone() is not None
+
+
+def extension_installed(schema_editor, name):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = %s", [name])
+        return cursor.fetchone() is not None
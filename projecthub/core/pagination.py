@@ -0,0 +1,191 @@
+import base64
+import json
+from collections.abc import Mapping
+from functools import reduce
+from operator import or_
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.filters import OrderingFilter
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination that can reuse count of rows view already
+    computed (e.g. for validators of conditional requests) instead of
+    running COUNT(*).
+    """
+
+    known_count = None
+
+    def django_paginator_class(self, queryset, page_size):
+        paginator = Paginator(queryset, page_size)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
+
+class PageNumberOrKeysetPagination(PageNumberPagination):
+    """
+    Page number pagination with opt-in keyset (cursor) mode.
+
+    Keyset mode is selected per request with `?pagination=cursor` or by
+    passing `cursor`. It orders by the requested `ordering` (or by
+    `keyset_ordering`) plus primary key as a tie-breaker and continues after
+    the last row of previous page, so it never runs COUNT(*) or OFFSET.
+    Only forward iteration is supported (`next` link).
+    """
+
+    page_size = 30
+    max_page_size = 200
+    page_size_query_param = "page_size"
+
+    mode_query_param = "pagination"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    # default ordering of keyset mode
+    keyset_ordering = ("-created_at",)
+    # non-nullable fields `OrderingFilter` may order by in keyset mode
+    keyset_ordering_fields = ("created_at",)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.is_keyset_request(request)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.model = queryset.model
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_keyset_ordering(request, queryset, view)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(position))
+
+        # one extra row tells whether there is a next page
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.results = results[: self.page_size]
+        return self.results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return self.get_cursor_link(url, self.results[-1], self.ordering)
+
+    def is_keyset_request(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.cursor_query_param in request.query_params
+        )
+
+    def get_keyset_ordering(self, request, queryset, view):
+        """
+        Return ordering requested through `OrderingFilter` (or default one)
+        with primary key appended as a tie-breaker.
+        """
+        ordering = None
+        if view is not None and OrderingFilter in getattr(view, "filter_backends", []):
+            ordering = OrderingFilter().get_ordering(request, queryset, view)
+        ordering = list(ordering or self.keyset_ordering)
+
+        for field in ordering:
+            if field.lstrip("-") not in self.keyset_ordering_fields:
+                raise ParseError(
+                    f"Ordering by '{field.lstrip('-')}' is not supported "
+                    f"with cursor pagination."
+                )
+
+        return self.with_tie_breaker(ordering)
+
+    def get_default_keyset_ordering(self):
+        return self.with_tie_breaker(list(self.keyset_ordering))
+
+    def with_tie_breaker(self, ordering):
+        tie_breaker = "-pk" if ordering[-1].startswith("-") else "pk"
+        return ordering + [tie_breaker]
+
+    def get_cursor_link(self, url, obj, ordering):
+        """
+        Return `url` that continues keyset iteration ordered by `ordering`
+        after `obj`. Lets other views link to pages of this paginator.
+        """
+        self.ordering = ordering
+        url = remove_query_param(url, self.mode_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(obj)
+        )
+
+    def get_keyset_filter(self, position):
+        """
+        Build `(f1 > v1) OR (f1 = v1 AND f2 > v2) OR ...` predicate
+        (with `<` for descending fields) for the given position.
+        """
+        conditions = []
+        for i, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal = {
+                f.lstrip("-"): value
+                for f, value in zip(self.ordering[:i], position[:i])
+            }
+            conditions.append(Q(**equal, **{f"{name}__{lookup}": position[i]}))
+        return reduce(or_, conditions)
+
+    def encode_cursor(self, obj):
+        model = type(obj)
+        if isinstance(obj, Mapping):
+            # row of `values()` queryset (keyed by attnames) of paginated model
+            model = self.model
+            obj = SimpleNamespace(**obj)
+
+        # `value_to_string` keeps full precision (e.g. microseconds)
+        position = [
+            self._get_field(model, field.lstrip("-")).value_to_string(obj)
+            for field in self.ordering
+        ]
+        data = json.dumps(position).encode()
+        return base64.urlsafe_b64encode(data).decode()
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if len(position) != len(self.ordering):
+                raise ValueError
+            return [
+                self._get_field(model, field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _get_field(self, model, name):
+        if name == "pk":
+            return model._meta.pk
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise ParseError(f"Unknown ordering field '{name}'.")
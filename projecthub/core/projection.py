@@ -0,0 +1,121 @@
+"""
+Projection-based read path of list endpoints.
+
+`get_projection()` compiles read serializer into `values()` paths and
+a function building representation of a row directly, so lists are
+serialized without instantiating models and without going through
+`Serializer.to_representation` field by field. The output is the same as
+the one of the serializer.
+
+Supported fields are model fields (including `get_<field>_display`
+sources), dotted sources over foreign keys, nested serializers over foreign
+keys and related fields represented by primary key. Anything else (method
+fields, properties, `many=True`) raises `ImproperlyConfigured`.
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.utils.encoding import force_str
+from rest_framework.relations import PKOnlyObject, RelatedField
+from rest_framework.serializers import BaseSerializer
+
+from projecthub.core.eager_loading import DISPLAY_METHOD_RE
+
+
+class Projection:
+
+    def __init__(self, paths, build):
+        self.paths = paths
+        self.build = build
+
+    def apply(self, queryset, extra=()):
+        """Return `values()` queryset with columns needed by projection."""
+        paths = dict.fromkeys([*self.paths, *extra])
+        return queryset.values(*paths)
+
+    def to_representation(self, rows):
+        return [self.build(row) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def get_projection(serializer_class, model):
+    paths = []
+    build = compile_serializer(serializer_class(), model, "", paths)
+    return Projection(tuple(dict.fromkeys(paths)), build)
+
+
+def compile_serializer(serializer, model, prefix, paths):
+    """
+    Return function building representation of `serializer` from row and
+    add paths it reads to `paths`.
+    """
+    getters = [
+        (field.field_name, compile_field(field, model, prefix, paths))
+        for field in serializer._readable_fields
+    ]
+
+    def build(row):
+        return {name: getter(row) for name, getter in getters}
+
+    return build
+
+
+def compile_field(field, model, prefix, paths):
+    if field.source == "*" or getattr(field, "many", False):
+        raise_unsupported(field)
+
+    # follow dotted source over foreign keys, e.g. `board.name`
+    *relations, attr = field.source_attrs
+    for relation in relations:
+        model_field = get_model_field(field, model, relation)
+        if not (model_field.many_to_one or model_field.one_to_one):
+            raise_unsupported(field)
+        prefix = f"{prefix}{model_field.name}__"
+        model = model_field.related_model
+
+    display = DISPLAY_METHOD_RE.fullmatch(attr)
+    model_field = get_model_field(field, model, display.group(1) if display else attr)
+    path = prefix + model_field.name
+    paths.append(path)
+
+    if isinstance(field, BaseSerializer):
+        if not (model_field.many_to_one or model_field.one_to_one):
+            raise_unsupported(field)
+        build = compile_serializer(field, model_field.related_model, path + "__", paths)
+        return lambda row: None if row[path] is None else build(row)
+
+    if model_field.is_relation:
+        if not isinstance(field, RelatedField):
+            raise_unsupported(field)
+        return lambda row: (
+            None
+            if row[path] is None
+            else field.to_representation(PKOnlyObject(row[path]))
+        )
+
+    if display:
+        choices = {key: force_str(value) for key, value in model_field.flatchoices}
+        return lambda row: (
+            None
+            if row[path] is None
+            else field.to_representation(choices.get(row[path], row[path]))
+        )
+
+    return lambda row: None if row[path] is None else field.to_representation(row[path])
+
+
+def get_model_field(field, model, name):
+    if name == "pk":
+        return model._meta.pk
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        raise_unsupported(field)
+
+
+def raise_unsupported(field):
+    raise ImproperlyConfigured(
+        f"Field `{field.parent.__class__.__name__}.{field.field_name}` "
+        f"can't be projected."
+    )
@@ -0,0 +1,45 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+LINE_SEPARATORS = (
+    ("\u2028".encode(), b"\\u2028"),
+    ("\u2029".encode(), b"\\u2029"),
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using `orjson`.
+
+    UUIDs, dicts, lists and their subclasses (`ReturnDict`, `ErrorDetail`,
+    ...) are serialized natively. Datetimes, decimals, lazy strings and
+    other types are passed to DRF's `JSONEncoder`, so they are represented
+    the same way as by `JSONRenderer`. Indented output (requested with
+    `indent` media type parameter or by browsable API) is rendered by
+    `JSONRenderer`, as `orjson` only supports an indent of 2.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def __init__(self):
+        self.default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except orjson.JSONEncodeError:
+            # e.g. integers out of 64-bit range
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # escape line separators like `JSONRenderer` does, so output
+        # is a strict javascript subset
+        for char, escaped in LINE_SEPARATORS:
+            if char in ret:
+                ret = ret.replace(char, escaped)
+        return ret
@@ -0,0 +1,104 @@
+"""
+Per-user index of roles in tenants and projects.
+
+`get_role_index()` returns roles of user cached in the shared cache (see
+`core.cache.role_index_cache`, loaded on every call without it), so
+visibility filters and policies use `id IN (...)` predicates from the
+index instead of joining memberships on every request. The index is
+invalidated on membership and tenant/project owner and supervisor changes
+(see `projecthub.core.signals`).
+"""
+
+
+class RoleIndex:
+    OWNER = "owner"
+    SUPERVISOR = "supervisor"
+
+    def __init__(self, tenant_roles=None, project_roles=None, staff_projects=None):
+        # tenant id -> `OWNER` or `TenantMembership.Role`
+        self.tenant_roles = tenant_roles or {}
+        # project id -> `ProjectMembership.Role`
+        self.project_roles = project_roles or {}
+        # project id -> set of `OWNER` and/or `SUPERVISOR`
+        self.staff_projects = staff_projects or {}
+
+    @property
+    def tenant_ids(self):
+        """Ids of tenants user owns or is member of."""
+        return set(self.tenant_roles)
+
+    @property
+    def project_ids(self):
+        """Ids of projects user owns, supervises or is member of."""
+        return set(self.project_roles) | set(self.staff_projects)
+
+    @property
+    def staff_project_ids(self):
+        """Ids of projects user owns or supervises."""
+        return set(self.staff_projects)
+
+    def get_tenant_role(self, tenant_id):
+        return self.tenant_roles.get(tenant_id)
+
+    def is_tenant_member(self, tenant_id):
+        return tenant_id in self.tenant_roles
+
+    def get_project_role(self, project_id):
+        """Return membership role in project or None if user isn't member."""
+        return self.project_roles.get(project_id)
+
+
+def load_role_index(user_id):
+    """Load role index of user with one query."""
+    from django.db.models import CharField, Value
+
+    from projecthub.core.models import Tenant, TenantMembership
+    from projecthub.projects.models import Project, ProjectMembership
+
+    def rows(queryset, kind, id_field, role):
+        queryset = queryset.annotate(kind=Value(kind, output_field=CharField()))
+        if not isinstance(role, str):
+            queryset = queryset.annotate(value=role)
+            role = "value"
+        # compound statements don't allow ordering of parts
+        return queryset.order_by().values_list(id_field, role, "kind")
+
+    owner = Value(RoleIndex.OWNER, output_field=CharField())
+    supervisor = Value(RoleIndex.SUPERVISOR, output_field=CharField())
+    queries = [
+        rows(
+            TenantMembership.objects.filter(user_id=user_id),
+            "tenant",
+            "tenant_id",
+            "role",
+        ),
+        rows(Tenant.objects.filter(owner_id=user_id), "tenant", "pk", owner),
+        rows(
+            ProjectMembership.objects.filter(user_id=user_id),
+            "project",
+            "project_id",
+            "role",
+        ),
+        rows(Project.objects.filter(owner_id=user_id), "staff", "pk", owner),
+        rows(Project.objects.filter(supervisor_id=user_id), "staff", "pk", supervisor),
+    ]
+
+    index = RoleIndex()
+    for pk, role, kind in queries[0].union(*queries[1:], all=True):
+        if kind == "tenant":
+            # owner takes precedence over membership
+            if index.tenant_roles.get(pk) != RoleIndex.OWNER:
+                index.tenant_roles[pk] = role
+        elif kind == "project":
+            index.project_roles[pk] = role
+        else:
+            index.staff_projects.setdefault(pk, set()).add(role)
+    return index
+
+
+def get_role_index(user):
+    from .cache import role_index_cache
+
+    if user is None or user.pk is None:
+        return RoleIndex()
+    return role_index_cache.get(user.pk)
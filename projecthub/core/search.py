@@ -0,0 +1,47 @@
+"""
+PostgreSQL full-text search.
+
+Searchable models declare `search_vector` field and `search_vector_fields`,
+`(field, weight)` pairs the vector is built from. The vector is maintained
+by database trigger (created in migrations of every searchable model) and
+can be rebuilt with `update_search_vectors` management command.
+"""
+
+import re
+from functools import reduce
+from operator import add
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+
+# text search configuration used by search vectors and queries;
+# `simple` doesn't stem, so it works equally for any language
+SEARCH_CONFIG = "simple"
+
+
+def is_searchable(model):
+    return hasattr(model, "search_vector_fields")
+
+
+def build_search_vector(weighted_fields):
+    """
+    Build search vector expression from `(field, weight)` pairs,
+    e.g. `(("name", "A"), ("description", "B"))`.
+    """
+    vectors = [
+        SearchVector(field, weight=weight, config=SEARCH_CONFIG)
+        for field, weight in weighted_fields
+    ]
+    return reduce(add, vectors)
+
+
+def build_search_query(terms):
+    """
+    Build query matching rows that contain all words of `terms`, each word
+    as a prefix (so `proj` finds "project"). Return None if there are no
+    words in `terms`.
+    """
+    words = re.findall(r"\w+", terms)
+    if not words:
+        return None
+    raw_query = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw_query, search_type="raw", config=SEARCH_CONFIG)
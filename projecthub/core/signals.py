@@ -0,0 +1,240 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+
+from projecthub.attachments.models import Attachment
+from projecthub.comments.models import Comment
+from projecthub.projects.models import Project, ProjectMembership
+from projecthub.tasks.counters import update_task_counters
+from projecthub.tasks.models import Board, Task
+from projecthub.tasks.stats import (
+    count_tasks,
+    get_task_stats_delta,
+    refresh_project_stats,
+    update_project_stats,
+)
+from .cache import (
+    project_scope,
+    response_cache,
+    role_index_cache,
+    tenant_cache,
+    tenant_scope,
+)
+from .models import Tenant, TenantMembership
+
+
+def _invalidate_tenant_cache(*sub_domains):
+    tenant_cache.invalidate(*sub_domains)
+    # invalidate once more after commit, so a concurrent request can't
+    # repopulate cache with the row as it was before this transaction
+    transaction.on_commit(lambda: tenant_cache.invalidate(*sub_domains))
+
+
+@receiver(pre_save, sender=Tenant)
+def remember_previous_sub_domain(sender, instance, update_fields=None, **kwargs):
+    instance._previous_sub_domain = None
+
+    if instance._state.adding:
+        return
+
+    if update_fields is not None and "sub_domain" not in update_fields:
+        return
+
+    instance._previous_sub_domain = (
+        Tenant.objects.filter(pk=instance.pk)
+        .values_list("sub_domain", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Tenant)
+def invalidate_tenant_cache_on_save(sender, instance, **kwargs):
+    previous_sub_domain = getattr(instance, "_previous_sub_domain", None)
+    _invalidate_tenant_cache(instance.sub_domain, previous_sub_domain)
+
+
+@receiver(post_delete, sender=Tenant)
+def invalidate_tenant_cache_on_delete(sender, instance, **kwargs):
+    _invalidate_tenant_cache(instance.sub_domain)
+
+
+def _get_project_tenant_id(instance):
+    if "project" in instance._state.fields_cache:
+        return instance.project.tenant_id
+    return (
+        Project.objects.filter(pk=instance.project_id)
+        .values_list("tenant_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_responses(sender, instance, **kwargs):
+    response_cache.invalidate(
+        tenant_scope(instance.tenant_id), project_scope(instance.pk)
+    )
+
+
+@receiver(post_save, sender=ProjectMembership)
+@receiver(post_delete, sender=ProjectMembership)
+def invalidate_project_membership_responses(sender, instance, **kwargs):
+    # memberships decide which projects and tasks users see
+    scopes = [project_scope(instance.project_id)]
+    tenant_id = _get_project_tenant_id(instance)
+    if tenant_id is not None:
+        scopes.append(tenant_scope(tenant_id))
+    response_cache.invalidate(*scopes)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_task_responses(sender, instance, **kwargs):
+    response_cache.invalidate(project_scope(instance.project_id))
+
+
+def _invalidate_role_indexes(*user_ids):
+    role_index_cache.invalidate(*user_ids)
+    # see `_invalidate_tenant_cache`
+    transaction.on_commit(lambda: role_index_cache.invalidate(*user_ids))
+
+
+def _get_staff_ids(instance):
+    return [
+        getattr(instance, attname)
+        for attname in ("owner_id", "supervisor_id")
+        if hasattr(instance, attname)
+    ]
+
+
+@receiver(pre_save, sender=Tenant)
+@receiver(pre_save, sender=Project)
+def remember_previous_staff(sender, instance, update_fields=None, **kwargs):
+    instance._previous_staff_ids = []
+
+    if instance._state.adding:
+        return
+
+    fields = {"owner", "owner_id", "supervisor", "supervisor_id"}
+    if update_fields is not None and not fields & set(update_fields):
+        return
+
+    attnames = [
+        name for name in ("owner_id", "supervisor_id") if hasattr(instance, name)
+    ]
+    row = sender.objects.filter(pk=instance.pk).values_list(*attnames).first()
+    instance._previous_staff_ids = list(row or [])
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_save, sender=Project)
+def invalidate_staff_role_indexes_on_save(sender, instance, **kwargs):
+    previous_staff_ids = getattr(instance, "_previous_staff_ids", [])
+    staff_ids = _get_staff_ids(instance)
+    if set(previous_staff_ids) != set(staff_ids):
+        _invalidate_role_indexes(*staff_ids, *previous_staff_ids)
+
+
+@receiver(post_delete, sender=Tenant)
+@receiver(post_delete, sender=Project)
+def invalidate_staff_role_indexes_on_delete(sender, instance, **kwargs):
+    _invalidate_role_indexes(*_get_staff_ids(instance))
+
+
+@receiver(post_save, sender=TenantMembership)
+@receiver(post_delete, sender=TenantMembership)
+@receiver(post_save, sender=ProjectMembership)
+@receiver(post_delete, sender=ProjectMembership)
+def invalidate_member_role_index(sender, instance, **kwargs):
+    _invalidate_role_indexes(instance.user_id)
+
+
+def _get_origin_model(origin):
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+def _deletes_tasks(origin):
+    """Whether deletion started from `origin` deletes tasks themselves."""
+    return issubclass(_get_origin_model(origin), (Task, Project, Tenant))
+
+
+@receiver(post_save, sender=Comment)
+def count_comment_on_save(sender, instance, created, **kwargs):
+    is_reply = instance.parent_id is not None
+    if created:
+        update_task_counters(
+            instance.task_id, comment_count=1, reply_count=int(is_reply)
+        )
+    elif instance.has_original_value("parent") and instance.has_changed("parent"):
+        was_reply = instance.get_original_value("parent") is not None
+        update_task_counters(instance.task_id, reply_count=is_reply - was_reply)
+
+
+# counted before delete, as cascades may delete rows task is found through
+@receiver(pre_delete, sender=Comment)
+def count_comment_on_delete(sender, instance, origin=None, **kwargs):
+    if _deletes_tasks(origin):
+        return
+    update_task_counters(
+        instance.task_id,
+        comment_count=-1,
+        reply_count=-int(instance.parent_id is not None),
+    )
+
+
+def _get_attachment_task_id(instance):
+    if instance.task_id is not None:
+        return instance.task_id
+    if "comment" in instance._state.fields_cache:
+        return instance.comment.task_id
+    return (
+        Comment.objects.filter(pk=instance.comment_id)
+        .values_list("task_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Attachment)
+def count_attachment_on_save(sender, instance, created, **kwargs):
+    if created:
+        update_task_counters(_get_attachment_task_id(instance), attachment_count=1)
+
+
+@receiver(pre_delete, sender=Attachment)
+def count_attachment_on_delete(sender, instance, origin=None, **kwargs):
+    if _deletes_tasks(origin):
+        return
+    update_task_counters(_get_attachment_task_id(instance), attachment_count=-1)
+
+
+@receiver(post_save, sender=Task)
+def update_project_stats_on_save(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if created:
+        deltas = count_tasks([instance])
+    else:
+        deltas = get_task_stats_delta(instance, update_fields)
+    if deltas is None:
+        refresh_project_stats(instance.project_id)
+    else:
+        update_project_stats(instance.project_id, deltas)
+
+
+@receiver(pre_delete, sender=Task)
+def update_project_stats_on_delete(sender, instance, origin=None, **kwargs):
+    # counters are deleted with project
+    if issubclass(_get_origin_model(origin), (Project, Tenant)):
+        return
+    update_project_stats(instance.project_id, count_tasks([instance], sign=-1))
+
+
+@receiver(post_delete, sender=Board)
+def refresh_project_stats_on_board_delete(sender, instance, origin=None, **kwargs):
+    # tasks of board are moved out of it past their signals (SET_NULL)
+    if issubclass(_get_origin_model(origin), (Project, Tenant)):
+        return
+    refresh_project_stats(instance.project_id)
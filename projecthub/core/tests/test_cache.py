@@ -0,0 +1,372 @@
+import threading
+import time
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from rest_framework import serializers
+
+from projecthub.core.api.v1.serializers.base import PresignedFileField
+from projecthub.core.cache import (
+    LRUCache,
+    PresignedURLCache,
+    ResponseCache,
+    presigned_url_cache,
+    response_cache,
+    tenant_cache,
+)
+
+
+@pytest.mark.django_db
+class TestLRUCache:
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_expired_entry_is_missing(self):
+        cache = LRUCache(maxsize=2, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+@pytest.mark.django_db
+class TestTenantCache:
+
+    def test_missing_sub_domain_is_cached(self, django_assert_num_queries):
+        assert tenant_cache.get("missing") is None
+
+        with django_assert_num_queries(0):
+            assert tenant_cache.get("missing") is None
+
+    def test_created_tenant_invalidates_cached_miss(self, tenant_factory):
+        assert tenant_cache.get("new") is None
+        tenant = tenant_factory(sub_domain="new")
+        assert tenant_cache.get("new") == tenant
+
+    def test_save_invalidates_cached_tenant(self, tenant):
+        tenant_cache.get(tenant.sub_domain)
+
+        tenant.name = "renamed"
+        tenant.save()
+
+        assert tenant_cache.get(tenant.sub_domain).name == "renamed"
+
+    def test_sub_domain_change_invalidates_previous_sub_domain(self, tenant):
+        old_sub_domain = tenant.sub_domain
+        tenant_cache.get(old_sub_domain)
+
+        tenant.sub_domain = "renamed"
+        tenant.save()
+
+        assert tenant_cache.get(old_sub_domain) is None
+        assert tenant_cache.get("renamed") == tenant
+
+    def test_delete_invalidates_cached_tenant(self, tenant):
+        sub_domain = tenant.sub_domain
+        tenant_cache.get(sub_domain)
+
+        tenant.delete()
+
+        assert tenant_cache.get(sub_domain) is None
+
+    def test_activate_invalidates_cached_tenant(self, tenant_factory, user):
+        tenant = tenant_factory(sub_domain="inactive", is_active=False)
+        assert tenant_cache.get("inactive").is_inactive
+
+        tenant.activate(updated_by=user)
+
+        assert tenant_cache.get("inactive").is_active
+
+    def test_shared_tier_is_used_when_configured(
+        self, settings, tenant, django_assert_num_queries
+    ):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        settings.TENANT_CACHE_ALIAS = "default"
+
+        tenant_cache.get(tenant.sub_domain)
+        tenant_cache.clear()
+
+        with django_assert_num_queries(0):
+            assert tenant_cache.get(tenant.sub_domain) == tenant
+        assert tenant_cache.stats()["shared_hits"] == 1
+
+
+@pytest.fixture
+def shared_tier(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.RESPONSE_CACHE_ALIAS = "default"
+    response_cache.reset_stats()
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+
+    def test_entry_is_computed_once(self):
+        assert response_cache.get_or_set("scope", ["a"], lambda: 1) == (1, "miss")
+        assert response_cache.get_or_set("scope", ["a"], lambda: 2) == (1, "local")
+        assert response_cache.get_or_set("scope", ["b"], lambda: 3) == (3, "miss")
+
+    def test_bump_invalidates_entries_of_scope(self):
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+        response_cache.get_or_set("other", ["a"], lambda: 1)
+
+        response_cache.bump("scope")
+
+        assert response_cache.get_or_set("scope", ["a"], lambda: 2) == (2, "miss")
+        assert response_cache.get_or_set("other", ["a"], lambda: 2) == (1, "local")
+
+    def test_shared_tier(self, shared_tier):
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+        response_cache.clear()
+
+        assert response_cache.get_or_set("scope", ["a"], lambda: 2) == (1, "shared")
+
+        # versions are shared too
+        response_cache.bump("scope")
+        response_cache.clear()
+        assert response_cache.get_or_set("scope", ["a"], lambda: 3) == (3, "miss")
+
+    def test_bump_of_other_process_invalidates_entries(self, shared_tier):
+        other_process = ResponseCache()
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+
+        other_process.bump("scope")
+
+        assert response_cache.get_or_set("scope", ["a"], lambda: 2) == (2, "miss")
+
+    def test_enabled_only_with_shared_tier(self, settings):
+        assert not response_cache.enabled
+
+        settings.RESPONSE_CACHE_ALIAS = "default"
+        assert response_cache.enabled
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return len(calls)
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    response_cache.get_or_set("scope", ["a"], compute)[0]
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [1] * 5
+
+    def test_waits_for_entry_computed_by_other_process(self, shared_tier, settings):
+        settings.RESPONSE_CACHE_LOCK_WAIT = 2
+        key = response_cache._make_key(
+            "scope", response_cache.get_version("scope"), ["a"]
+        )
+        shared_cache = response_cache.shared_cache
+        shared_cache.add(f"{key}:lock", 1)
+        threading.Timer(0.1, lambda: shared_cache.set(key, 1)).start()
+
+        assert response_cache.get_or_set("scope", ["a"], lambda: 2) == (1, "shared")
+
+    def test_computes_entry_when_wait_times_out(self, shared_tier, settings):
+        settings.RESPONSE_CACHE_LOCK_WAIT = 0.1
+        key = response_cache._make_key(
+            "scope", response_cache.get_version("scope"), ["a"]
+        )
+        response_cache.shared_cache.add(f"{key}:lock", 1)
+
+        assert response_cache.get_or_set("scope", ["a"], lambda: 2) == (2, "miss")
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_stats(self, request, shared):
+        if shared:
+            request.getfixturevalue("shared_tier")
+
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+        response_cache.get_or_set("scope", ["b"], lambda: 1)
+
+        stats = response_cache.stats()
+        assert stats["misses"] == 2
+        assert stats["local_hits"] == 2
+        assert stats["hit_ratio"] == 0.5
+
+    def test_stats_command(self, capsys):
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+        response_cache.get_or_set("scope", ["a"], lambda: 1)
+
+        call_command("response_cache_stats", reset=True)
+
+        assert "hit ratio: 50.00%" in capsys.readouterr().out
+        assert response_cache.stats()["misses"] == 0
+
+
+class SigningStorage(FileSystemStorage):
+    querystring_auth = True
+    querystring_expire = 3600
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.signed = 0
+
+    def url(self, name):
+        self.signed += 1
+        return f"{super().url(name)}?signature={self.signed}"
+
+
+class StoredFile:
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+
+    def __bool__(self):
+        return True
+
+    @property
+    def url(self):
+        return self.storage.url(self.name)
+
+
+@pytest.mark.django_db
+class TestPresignedURLCache:
+
+    @pytest.fixture
+    def storage(self):
+        return SigningStorage(base_url="http://media.testserver/")
+
+    def test_url_is_reused_within_window(self, storage):
+        file = StoredFile(storage, "attachments/a.txt")
+
+        first = presigned_url_cache.get_url(file)
+        second = presigned_url_cache.get_url(file)
+
+        assert (
+            first == second == "http://media.testserver/attachments/a.txt?signature=1"
+        )
+        assert storage.signed == 1
+        stats = presigned_url_cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+        assert stats["saved_time"] == stats["signing_time"]
+
+    def test_url_is_signed_again_in_next_window(self, storage, mocker):
+        file = StoredFile(storage, "attachments/a.txt")
+        now = 1_000_000_000
+        mocker.patch("projecthub.core.cache.time.time", return_value=now)
+        presigned_url_cache.get_url(file)
+
+        # window is querystring_expire - PRESIGNED_URL_CACHE_MARGIN seconds
+        mocker.patch("projecthub.core.cache.time.time", return_value=now + 3300)
+        presigned_url_cache.get_url(file)
+
+        assert storage.signed == 2
+
+    def test_url_is_valid_for_margin_when_window_ends(self, storage, mocker):
+        file = StoredFile(storage, "attachments/a.txt")
+        window_start = 3300 * 1000
+        mocker.patch("projecthub.core.cache.time.time", return_value=window_start)
+        presigned_url_cache.get_url(file)
+
+        mocker.patch(
+            "projecthub.core.cache.time.time", return_value=window_start + 3299
+        )
+        presigned_url_cache.get_url(file)
+
+        # signed at window start, expires 300 seconds after window ends
+        assert storage.signed == 1
+
+    def test_unsigned_urls_are_not_cached(self):
+        file = StoredFile(FileSystemStorage(), "attachments/a.txt")
+
+        presigned_url_cache.get_url(file)
+
+        assert presigned_url_cache.stats()["misses"] == 0
+        assert presigned_url_cache.stats()["size"] == 0
+
+    def test_least_recently_used_urls_are_evicted(self, storage, settings):
+        settings.PRESIGNED_URL_CACHE_MAX_SIZE = 2
+        presigned_url_cache.clear()
+
+        for name in ["a.txt", "b.txt", "c.txt", "a.txt"]:
+            presigned_url_cache.get_url(StoredFile(storage, name))
+
+        assert presigned_url_cache.stats()["size"] == 2
+        assert storage.signed == 4
+
+    def test_stats_of_processes_are_summed_in_shared_cache(
+        self, storage, settings, mocker
+    ):
+        settings.PRESIGNED_URL_CACHE_ALIAS = "default"
+        settings.PRESIGNED_URL_CACHE_STATS_INTERVAL = 0
+        # every signing takes 1ms
+        mocker.patch(
+            "projecthub.core.cache.time.perf_counter", side_effect=[0, 0.001] * 2
+        )
+        other_process_cache = PresignedURLCache()
+        file = StoredFile(storage, "attachments/a.txt")
+
+        presigned_url_cache.get_url(file)
+        presigned_url_cache.get_url(file)
+        other_process_cache.get_url(file)
+
+        stats = other_process_cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert (stats["signing_time"], stats["saved_time"]) == (0.002, 0.001)
+        assert stats["hit_ratio"] == 1 / 3
+
+    def test_stats_are_published_once_per_interval(self, storage, settings, mocker):
+        settings.PRESIGNED_URL_CACHE_ALIAS = "default"
+        presigned_url_cache.reset_stats()
+        mock_publish = mocker.spy(presigned_url_cache, "publish_stats")
+
+        for _ in range(3):
+            presigned_url_cache.get_url(StoredFile(storage, "attachments/a.txt"))
+
+        mock_publish.assert_not_called()
+        assert PresignedURLCache().stats()["misses"] == 0
+        assert presigned_url_cache.stats()["hits"] == 2
+
+    def test_stats_command(self, storage, capsys):
+        file = StoredFile(storage, "attachments/a.txt")
+        presigned_url_cache.get_url(file)
+        presigned_url_cache.get_url(file)
+
+        call_command("presigned_url_cache_stats", reset=True)
+
+        output = capsys.readouterr().out
+        assert "hit ratio: 50.00%" in output
+        assert "saved time: " in output
+        assert presigned_url_cache.stats()["hits"] == 0
+
+    def test_serializer_field_renders_cached_url(self, storage, rf):
+        class FileSerializer(serializers.Serializer):
+            file = PresignedFileField()
+
+        file = StoredFile(storage, "attachments/a.txt")
+        request = rf.get("/")
+
+        first = FileSerializer({"file": file}, context={"request": request}).data
+        second = FileSerializer({"file": file}, context={"request": request}).data
+
+        assert first == second
+        assert storage.signed == 1
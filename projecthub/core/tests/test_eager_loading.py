@@ -0,0 +1,88 @@
+import pytest
+from rest_framework import serializers
+
+from projecthub.comments.api.v1.serializers import CommentListSerializer
+from projecthub.comments.models import Comment
+from projecthub.core.api.v1.serializers.base import UserNestedSerializer
+from projecthub.core.eager_loading import get_eager_loading
+from projecthub.projects.models import Project
+from projecthub.tasks.api.v1.serializers import TaskDetailSerializer
+from projecthub.tasks.models import Task
+
+
+class ProjectWithTasksSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    status = serializers.CharField(source="get_status_display")
+    tasks = TaskDetailSerializer(many=True)
+
+
+class ProjectWithMethodFieldSerializer(serializers.Serializer):
+    owner = UserNestedSerializer()
+    duration = serializers.SerializerMethodField()
+
+    def get_duration(self, obj):
+        return obj.duration
+
+
+@pytest.mark.django_db
+class TestGetEagerLoading:
+
+    def test_nested_serializers_and_dotted_sources(self):
+        loading = get_eager_loading(TaskDetailSerializer, Task)
+
+        assert loading.select_related == {"board", "created_by", "responsible"}
+        assert loading.prefetch_related == set()
+        assert {
+            "id",
+            "name",
+            "board",
+            "board__name",
+            "created_by__username",
+            "responsible__id",
+        } <= loading.only
+        assert "description" in loading.only
+        assert "project" not in loading.only
+
+    def test_related_field_represented_by_pk(self):
+        loading = get_eager_loading(CommentListSerializer, Comment)
+
+        assert loading.select_related == {"created_by"}
+        assert "parent" in loading.only
+
+    def test_reverse_relations_are_prefetched(self):
+        loading = get_eager_loading(ProjectWithTasksSerializer, Project)
+
+        assert loading.select_related == set()
+        assert loading.prefetch_related == {
+            "tasks",
+            "tasks__board",
+            "tasks__created_by",
+            "tasks__responsible",
+        }
+        assert loading.only == {"id", "status"}
+
+    def test_unknown_fields_load_whole_model(self):
+        loading = get_eager_loading(ProjectWithMethodFieldSerializer, Project)
+
+        assert loading.select_related == {"owner"}
+        assert loading.only is None
+
+
+@pytest.mark.django_db
+class TestEagerLoadingApply:
+
+    def test_serializes_without_extra_queries(
+        self, task_factory, django_assert_num_queries
+    ):
+        task_factory.create_batch(3)
+        loading = get_eager_loading(TaskDetailSerializer, Task)
+
+        with django_assert_num_queries(1):
+            TaskDetailSerializer(loading.apply(Task.objects.all()), many=True).data
+
+    def test_does_not_restrict_fields_of_restricted_queryset(self, task):
+        loading = get_eager_loading(TaskDetailSerializer, Task)
+
+        qs = loading.apply(Task.objects.select_related("project"))
+
+        assert qs.query.deferred_loading == (frozenset(), True)
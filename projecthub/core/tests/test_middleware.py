@@ -2,6 +2,7 @@ import pytest
 from django.core.exceptions import PermissionDenied
 from django.http import Http404
 
+from projecthub.core.cache import tenant_cache
 from projecthub.core.middleware import TenantMiddleware
 
 
@@ -52,3 +53,28 @@ class TestTenantMiddleware:
         middleware = TenantMiddleware(lambda req: None)
         middleware(request)
         assert request.tenant == tenant
+
+    def test_tenant_is_resolved_without_queries_when_cached(
+        self, rf, tenant, http_host, django_assert_num_queries
+    ):
+        middleware = TenantMiddleware(lambda req: None)
+        middleware(rf.get("/", HTTP_HOST=http_host))
+
+        request = rf.get("/", HTTP_HOST=http_host)
+        with django_assert_num_queries(0):
+            middleware(request)
+
+        assert request.tenant == tenant
+        assert tenant_cache.stats()["hits"] == 1
+        assert tenant_cache.stats()["misses"] == 1
+
+    def test_deactivated_tenant_is_not_served_from_cache(
+        self, rf, tenant, http_host, user
+    ):
+        middleware = TenantMiddleware(lambda req: None)
+        middleware(rf.get("/", HTTP_HOST=http_host))
+
+        tenant.deactivate(updated_by=user)
+
+        with pytest.raises(PermissionDenied):
+            middleware(rf.get("/", HTTP_HOST=http_host))
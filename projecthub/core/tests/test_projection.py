@@ -0,0 +1,81 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from projecthub.comments.api.v1.serializers import CommentListSerializer
+from projecthub.comments.models import Comment
+from projecthub.core.api.v1.serializers import TenantMembershipListSerializer
+from projecthub.core.models import TenantMembership
+from projecthub.core.projection import get_projection
+from projecthub.projects.api.v1.serializers import (
+    ProjectListSerializer,
+    ProjectMembershipListSerializer,
+)
+from projecthub.projects.models import Project, ProjectMembership
+from projecthub.tasks.api.v1.serializers import TaskListSerializer
+from projecthub.tasks.models import Task
+
+
+class ProjectWithMethodFieldSerializer(serializers.Serializer):
+    duration = serializers.SerializerMethodField()
+
+    def get_duration(self, obj):
+        return obj.duration
+
+
+def assert_same_output(serializer_class, queryset):
+    projection = get_projection(serializer_class, queryset.model)
+    expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+    rows = projection.to_representation(projection.apply(queryset))
+    assert JSONRenderer().render(rows) == expected
+
+
+@pytest.mark.django_db
+class TestProjection:
+
+    def test_tasks(self, active_project, todo_board, task_factory, user):
+        task_factory(project=active_project, board=todo_board, responsible=user)
+        task_factory(project=active_project, board=None, responsible=None)
+
+        assert_same_output(TaskListSerializer, Task.objects.order_by("pk"))
+
+    def test_projects(self, tenant, project_factory):
+        project_factory(tenant=tenant, status=Project.Status.ACTIVE)
+        project_factory(tenant=tenant, status=Project.Status.PENDING, end_date=None)
+
+        assert_same_output(ProjectListSerializer, Project.objects.order_by("pk"))
+
+    def test_comments(self, task, comment_factory):
+        parent = comment_factory(task=task)
+        comment_factory(task=task, parent=parent)
+
+        assert_same_output(CommentListSerializer, Comment.objects.order_by("pk"))
+
+    def test_memberships(self, project_membership, tenant_membership):
+        assert_same_output(
+            ProjectMembershipListSerializer, ProjectMembership.objects.order_by("pk")
+        )
+        assert_same_output(
+            TenantMembershipListSerializer, TenantMembership.objects.order_by("pk")
+        )
+
+    def test_paths_include_joined_fields(self):
+        projection = get_projection(TaskListSerializer, Task)
+
+        assert "board__name" in projection.paths
+        assert "created_by__username" in projection.paths
+
+    def test_unsupported_field(self):
+        with pytest.raises(ImproperlyConfigured):
+            get_projection(ProjectWithMethodFieldSerializer, Project)
+
+
+@pytest.mark.django_db
+def test_benchmark_command(task, capsys):
+    call_command("benchmark_list_serializers", rows=10, repeat=1)
+
+    out = capsys.readouterr().out
+    assert "TaskListSerializer (1 rows)" in out
+    assert "CommentListSerializer: no rows, skipped." in out
@@ -0,0 +1,143 @@
+"""
+Query plans of hot queries on a seeded dataset.
+
+Every test EXPLAINs a query the app runs on large tables and fails if
+PostgreSQL plans a sequential scan of the table instead of using one of
+its indexes, e.g. after an index was dropped or a query changed shape.
+"""
+
+import random
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from projecthub.comments.models import Comment
+from projecthub.core.models import TenantMembership
+from projecthub.projects.models import Project, ProjectMembership
+from projecthub.tasks.models import Board, Task
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Query plans of PostgreSQL"
+    ),
+]
+
+USERS = 50
+TENANTS = 20
+PROJECTS = 20
+TASKS_PER_PROJECT = 150
+COMMENTS = 3000
+
+
+def assert_uses_index(queryset, table):
+    plan = queryset.explain()
+    assert f"Seq Scan on {table}" not in plan, plan
+
+
+@pytest.fixture
+def dataset(tenant_factory, project_factory):
+    rng = random.Random(0)
+    now = timezone.now()
+
+    users = get_user_model().objects.bulk_create(
+        get_user_model()(username=f"user{i}", email=f"user{i}@example.com")
+        for i in range(USERS)
+    )
+    tenants = tenant_factory.create_batch(TENANTS)
+    TenantMembership.objects.bulk_create(
+        TenantMembership(tenant=tenant, user=user)
+        for tenant in tenants
+        for user in users
+    )
+
+    projects = project_factory.create_batch(PROJECTS, tenant=tenants[0])
+    ProjectMembership.objects.bulk_create(
+        ProjectMembership(project=project, user=user)
+        for project in projects
+        for user in users
+    )
+    boards = Board.objects.bulk_create(
+        Board(project=project, name=name, order=order)
+        for project in projects
+        for order, name in enumerate(["To Do", "In Progress", "Done"])
+    )
+
+    tasks = Task.objects.bulk_create(
+        Task(
+            project=project,
+            board=rng.choice(boards[i * 3 : i * 3 + 3]),
+            name=f"task {n}",
+            priority=rng.randint(0, 10),
+            responsible=rng.choice(users),
+            end_date=now + timedelta(days=rng.randint(1, 30)),
+            # most tasks are done
+            close_date=now if rng.random() < 0.8 else None,
+        )
+        for i, project in enumerate(projects)
+        for n in range(TASKS_PER_PROJECT)
+    )
+    Comment.objects.bulk_create(
+        Comment(task=rng.choice(tasks), body="comment", created_by=rng.choice(users))
+        for _ in range(COMMENTS)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    return {
+        "user": users[0],
+        "tenant": tenants[0],
+        "project": projects[0],
+        "board": boards[0],
+        "task": tasks[0],
+    }
+
+
+def test_task_list(dataset):
+    qs = Task.objects.filter(project=dataset["project"]).order_by("priority", "pk")
+    assert_uses_index(qs[:30], "tasks_task")
+
+
+def test_board_tasks(dataset):
+    qs = Task.objects.filter(board=dataset["board"]).order_by("priority", "pk")
+    assert_uses_index(qs[:11], "tasks_task")
+
+
+def test_open_tasks_of_responsible(dataset):
+    qs = Task.objects.filter(
+        responsible=dataset["user"], close_date__isnull=True
+    ).order_by("end_date", "pk")
+    assert_uses_index(qs, "tasks_task")
+
+
+def test_open_tasks_of_ended_projects(dataset):
+    open_tasks = Task.objects.filter(project=OuterRef("pk"), close_date__isnull=True)
+    qs = Project.objects.filter(pk=dataset["project"].pk).filter(~Exists(open_tasks))
+    assert_uses_index(qs, "tasks_task")
+
+
+def test_task_comments(dataset):
+    qs = Comment.objects.filter(task=dataset["task"]).order_by("-created_at", "-pk")
+    assert_uses_index(qs[:30], "comments_comment")
+
+
+def test_projects_of_user(dataset):
+    qs = ProjectMembership.objects.filter(user=dataset["user"]).values("project_id")
+    assert_uses_index(qs, "projects_projectmembership")
+
+
+def test_project_role_of_user(dataset):
+    qs = ProjectMembership.objects.filter(
+        project=dataset["project"], user=dataset["user"]
+    )
+    assert_uses_index(qs, "projects_projectmembership")
+
+
+def test_tenants_of_user(dataset):
+    qs = TenantMembership.objects.filter(user=dataset["user"]).values("tenant_id")
+    assert_uses_index(qs, "core_tenantmembership")
@@ -0,0 +1,107 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.core.management import call_command
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.reverse import reverse
+
+from projecthub.core.parsers import ORJSONParser
+from projecthub.core.renderers import ORJSONRenderer
+from projecthub.tasks.api.v1.serializers import TaskListSerializer
+
+
+@pytest.mark.django_db
+class TestORJSONRenderer:
+
+    def test_same_output_as_json_renderer(self, task):
+        data = {
+            "id": uuid.uuid4(),
+            "created_at": datetime.datetime(
+                2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+            ),
+            "date": datetime.date(2025, 1, 2),
+            "amount": decimal.Decimal("1.50"),
+            "message": gettext_lazy("Not found."),
+            "name": "Zadanie ż\u2028\u2029",
+            1: None,
+            "tasks": TaskListSerializer([task], many=True).data,
+        }
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indent(self):
+        data = {"a": [1, 2]}
+        renderer = ORJSONRenderer()
+
+        assert renderer.render(data, "application/json; indent=4") == (
+            JSONRenderer().render(data, "application/json; indent=4")
+        )
+
+    def test_none(self):
+        assert ORJSONRenderer().render(None) == b""
+
+
+@pytest.mark.django_db
+class TestORJSONParser:
+
+    def test_parse(self):
+        body = '{"name": "Zadanie ż\u2028\u2029", "items": [1, null]}'.encode()
+
+        assert ORJSONParser().parse(io.BytesIO(body)) == {
+            "name": "Zadanie ż\u2028\u2029",
+            "items": [1, None],
+        }
+
+    def test_other_encoding(self):
+        body = '{"name": "ż"}'.encode("utf-16")
+        context = {"encoding": "utf-16"}
+
+        assert ORJSONParser().parse(io.BytesIO(body), parser_context=context) == (
+            JSONParser().parse(io.BytesIO(body), parser_context=context)
+        )
+
+    def test_invalid(self):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"name": '))
+
+
+@pytest.mark.django_db
+class TestAPI:
+
+    def test_parse_error_envelope(self, api_client, active_project, http_host):
+        api_client.force_authenticate(user=active_project.owner)
+        url = reverse("api:v1:task_list", kwargs={"project_id": active_project.pk})
+
+        response = api_client.post(
+            url, data=b"{", content_type="application/json", HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response["Content-Type"] == "application/json"
+        assert response.json()["detail"].startswith("JSON parse error - ")
+
+    def test_not_found_envelope(self, api_client, user, http_host):
+        api_client.force_authenticate(user=user)
+        url = reverse("api:v1:task_list", kwargs={"project_id": uuid.uuid4()})
+
+        response = api_client.get(url, HTTP_HOST=http_host)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.content == b'{"detail":"No Project matches the given query."}'
+
+
+@pytest.mark.django_db
+def test_benchmark_command(task, capsys):
+    call_command("benchmark_renderers", rows=10, repeat=1)
+
+    out = capsys.readouterr().out
+    assert "TaskListSerializer (1 rows): JSONRenderer" in out
+    assert "ORJSONRenderer" in out
+    assert "CommentListSerializer: no rows, skipped." in out
@@ -0,0 +1,114 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+
+from projecthub.core.cache import RoleIndexCache
+from projecthub.core.roles import RoleIndex, get_role_index, load_role_index
+from projecthub.policies.project_roles import IsProjectMemberPolicy
+
+
+@pytest.mark.django_db
+class TestRoleIndex:
+
+    def test_index_is_loaded_with_one_query(
+        self,
+        tenant,
+        tenant_factory,
+        tenant_membership_factory,
+        project_factory,
+        project_membership_factory,
+        user_factory,
+        django_assert_num_queries,
+    ):
+        user = user_factory()
+        owned_tenant = tenant_factory(owner=user)
+        tenant_membership_factory(tenant=tenant, user=user)
+        staff_project = project_factory(tenant=tenant, owner=user, supervisor=user)
+        member_project = project_factory(tenant=tenant)
+        membership = project_membership_factory(project=member_project, user=user)
+
+        with django_assert_num_queries(1):
+            index = load_role_index(user.pk)
+
+        assert index.tenant_ids == {tenant.pk, owned_tenant.pk}
+        assert index.get_tenant_role(owned_tenant.pk) == RoleIndex.OWNER
+        assert index.project_ids == {staff_project.pk, member_project.pk}
+        assert index.staff_project_ids == {staff_project.pk}
+        assert index.staff_projects[staff_project.pk] == {
+            RoleIndex.OWNER,
+            RoleIndex.SUPERVISOR,
+        }
+        assert index.get_project_role(member_project.pk) == membership.role
+
+    def test_anonymous_user_has_no_roles(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            index = get_role_index(AnonymousUser())
+        assert not index.tenant_ids
+        assert not index.project_ids
+
+    @pytest.mark.usefixtures("shared_role_index_cache")
+    def test_index_is_cached(self, tenant_user, django_assert_num_queries):
+        get_role_index(tenant_user.user)
+
+        with django_assert_num_queries(0):
+            index = get_role_index(tenant_user.user)
+        assert index.is_tenant_member(tenant_user.tenant_id)
+
+    def test_index_is_loaded_without_shared_tier(
+        self, tenant_user, django_assert_num_queries
+    ):
+        get_role_index(tenant_user.user)
+
+        with django_assert_num_queries(1):
+            index = get_role_index(tenant_user.user)
+        assert index.is_tenant_member(tenant_user.tenant_id)
+
+    @pytest.mark.usefixtures("shared_role_index_cache")
+    def test_revocation_is_seen_by_other_processes(
+        self, project, project_membership_factory, user
+    ):
+        other_process_cache = RoleIndexCache()
+        membership = project_membership_factory(project=project, user=user)
+        assert other_process_cache.get(user.pk).project_ids == {project.pk}
+
+        membership.delete()
+
+        assert not other_process_cache.get(user.pk).project_ids
+
+    @pytest.mark.usefixtures("shared_role_index_cache")
+    def test_membership_change_invalidates_index(
+        self, project, project_membership_factory, user
+    ):
+        assert not get_role_index(user).project_ids
+
+        membership = project_membership_factory(project=project, user=user)
+        assert get_role_index(user).project_ids == {project.pk}
+
+        membership.delete()
+        assert not get_role_index(user).project_ids
+
+    @pytest.mark.usefixtures("shared_role_index_cache")
+    def test_supervisor_change_invalidates_indexes_of_both_users(
+        self, project_factory, tenant, user_factory
+    ):
+        previous, new = user_factory(), user_factory()
+        project = project_factory(tenant=tenant, supervisor=previous)
+        assert get_role_index(previous).staff_project_ids == {project.pk}
+        assert not get_role_index(new).staff_project_ids
+
+        project.supervisor = new
+        project.save()
+
+        assert not get_role_index(previous).staff_project_ids
+        assert get_role_index(new).staff_project_ids == {project.pk}
+
+    def test_policy_filter_doesnt_join_memberships(
+        self, rf, project, project_membership_factory, user
+    ):
+        project_membership_factory(project=project, user=user)
+        request = rf.get("/")
+        request.user = user
+        view = type("View", (), {"policy_lookups": {"project": "project"}})()
+
+        q = IsProjectMemberPolicy().get_filter(request, view)
+
+        assert q.children == [("project__in", {project.pk})]
@@ -0,0 +1,60 @@
+import pytest
+from django.core.management import call_command, CommandError
+from django.db import connection
+
+from projecthub.comments.models import Comment
+from projecthub.core.search import build_search_query
+from projecthub.projects.models import Project
+from projecthub.tasks.models import Task
+
+postgresql_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full-text search requires PostgreSQL"
+)
+
+
+@pytest.mark.django_db
+class TestSearchVector:
+
+    @postgresql_only
+    def test_maintained_on_insert_and_update(self, task):
+        task.name = "Release notes"
+        task.save()
+
+        assert (
+            Task.objects.filter(search_vector=build_search_query("release")).get()
+            == task
+        )
+
+    @postgresql_only
+    def test_models_are_searchable(self, task, comment_factory):
+        comment_factory(task=task, body="Lorem")
+
+        assert Task.objects.filter(search_vector__isnull=True).count() == 0
+        assert Project.objects.filter(search_vector__isnull=True).count() == 0
+        assert Comment.objects.filter(search_vector__isnull=True).count() == 0
+
+
+@pytest.mark.django_db
+class TestUpdateSearchVectorsCommand:
+
+    @postgresql_only
+    def test_rebuilds_vectors(self, active_project, task_factory, capsys):
+        tasks = task_factory.create_batch(3, project=active_project, name="Deploy")
+        Task.objects.update(search_vector=None)
+
+        call_command("update_search_vectors", "tasks.Task", chunk_size=2)
+
+        assert Task.objects.filter(
+            search_vector=build_search_query("deploy")
+        ).count() == len(tasks)
+        assert "tasks.Task: 3 rows updated." in capsys.readouterr().out
+
+    @postgresql_only
+    def test_not_searchable_model(self):
+        with pytest.raises(CommandError):
+            call_command("update_search_vectors", "tasks.Board")
+
+    @pytest.mark.skipif(connection.vendor == "postgresql", reason="Not PostgreSQL")
+    def test_requires_postgresql(self):
+        with pytest.raises(CommandError):
+            call_command("update_search_vectors")
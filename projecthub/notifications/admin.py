@@ -0,0 +1,21 @@
+from django.contrib import admin
+
+from projecthub.notifications.models import Notification
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = (
+        "kind",
+        "recipient",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "created_at",
+        "sent_at",
+    )
+    list_select_related = ("recipient",)
+    list_filter = ("kind", "status")
+    search_fields = ("recipient__username", "recipient__email")
+    readonly_fields = ("created_at", "sent_at", "last_error")
+    raw_id_fields = ("recipient",)
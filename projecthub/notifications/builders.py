@@ -0,0 +1,26 @@
+"""
+Email builders of notification kinds.
+
+Apps register a builder for every kind they enqueue. Builder is called with
+recipient and all their due notifications of the kind, so it can merge them
+into one email (and drop duplicates); it returns the message or None if
+there's nothing left to send.
+"""
+
+_builders = {}
+
+
+def register_builder(kind):
+    def decorator(func):
+        _builders[kind] = func
+        return func
+
+    return decorator
+
+
+def build_message(kind, recipient, notifications):
+    try:
+        builder = _builders[kind]
+    except KeyError:
+        raise LookupError(f"No email builder registered for {kind!r}.")
+    return builder(recipient, notifications)
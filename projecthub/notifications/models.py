@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from projecthub.core.models import UUIDModel
+
+
+class NotificationQuerySet(models.QuerySet):
+
+    def due(self, now=None):
+        """Pending notifications whose (next) attempt is due."""
+        return self.filter(
+            status=Notification.Status.PENDING,
+            next_attempt_at__lte=now or timezone.now(),
+        )
+
+
+class Notification(UUIDModel):
+    """
+    Outbox of emails. Rows are written in the same transaction as the change
+    they notify about and sent later by `dispatch_notifications`, which also
+    keeps retry state of every row.
+    """
+
+    class Kind(models.TextChoices):
+        TASK_ASSIGNED = "task_assigned", _("Task assigned")
+        TASK_REMINDER = "task_reminder", _("Task reminder")
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        SENT = "sent", _("Sent")
+        SKIPPED = "skipped", _("Skipped")
+        FAILED = "failed", _("Failed")
+
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notifications",
+        help_text=_("User notification is sent to."),
+    )
+    kind = models.CharField(
+        max_length=32, choices=Kind.choices, help_text=_("Kind of notification.")
+    )
+    payload = models.JSONField(
+        default=dict, blank=True, help_text=_("Data email is built from.")
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        help_text=_("Delivery status of notification."),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, help_text=_("Number of failed delivery attempts.")
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, help_text=_("Time notification can be sent at.")
+    )
+    last_error = models.TextField(
+        blank=True, default="", help_text=_("Error of the last failed attempt.")
+    )
+    created_at = models.DateTimeField(blank=True, default=timezone.now)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    objects = NotificationQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # queue of dispatcher, small as sent rows drop out of it
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="notification_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} to {self.recipient_id} ({self.status})"
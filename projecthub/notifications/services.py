@@ -0,0 +1,191 @@
+import logging
+import time
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from projecthub.notifications.builders import build_message
+from projecthub.notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_notification(recipient_id, kind, payload=None):
+    """Add notification to outbox; call inside transaction of the change."""
+    return Notification.objects.create(
+        recipient_id=recipient_id, kind=kind, payload=payload or {}
+    )
+
+
+def enqueue_notifications(notifications):
+    """Add unsaved notifications to outbox with one query."""
+    return Notification.objects.bulk_create(notifications)
+
+
+def get_retry_delay(attempts):
+    """Exponential backoff: base delay doubled with every failed attempt."""
+    return timedelta(seconds=settings.NOTIFICATION_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def get_queue_stats(now=None):
+    """
+    Return number of due notifications and queue lag, age (in seconds)
+    of the oldest of them.
+    """
+    now = now or timezone.now()
+    stats = Notification.objects.due(now).aggregate(
+        pending=Count("pk"), oldest=Min("next_attempt_at")
+    )
+    oldest = stats.pop("oldest")
+    stats["lag"] = (now - oldest).total_seconds() if oldest else 0.0
+    return stats
+
+
+def dispatch_notifications(batch_size=None, max_batches=None):
+    """
+    Send due notifications in batches until queue is drained or
+    `max_batches` batches were processed, and return dispatch metrics.
+
+    Every batch is claimed first: its rows are selected with `SKIP LOCKED`
+    and their next attempt is postponed by `NOTIFICATION_CLAIM_TIMEOUT`, so
+    concurrent dispatchers process different rows, and emails are sent after
+    the claim is committed, without holding row locks. Notifications of a
+    dispatcher that dies while sending are retried once the claim expires.
+    Notifications of one recipient and kind are
+    merged into one email and all emails of batch are sent over one mail
+    connection. Failed notifications are retried with exponential backoff
+    until `NOTIFICATION_MAX_ATTEMPTS` is reached.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+    max_batches = max_batches or settings.NOTIFICATION_MAX_BATCHES
+
+    stats = {"notifications": 0, "messages": 0, "failed": 0, "skipped": 0, "lag": 0.0}
+    started = time.monotonic()
+    for _ in range(max_batches):
+        processed = dispatch_batch(batch_size, stats)
+        if processed < batch_size:
+            break
+
+    elapsed = time.monotonic() - started
+    stats["elapsed"] = elapsed
+    stats["messages_per_second"] = stats["messages"] / elapsed if elapsed else 0.0
+    logger.info(
+        "Dispatched %(messages)d messages (%(notifications)d notifications, "
+        "%(failed)d failed, %(skipped)d skipped) at %(messages_per_second).1f "
+        "msg/s, queue lag %(lag).1fs",
+        stats,
+    )
+    return stats
+
+
+def dispatch_batch(batch_size, stats):
+    now = timezone.now()
+    notifications = claim_batch(batch_size, now)
+    if not notifications:
+        return 0
+
+    stats["notifications"] += len(notifications)
+    stats["lag"] = max(
+        stats["lag"],
+        max((now - n.next_attempt_at).total_seconds() for n in notifications),
+    )
+
+    # oldest first, then merged per recipient and kind
+    key = attrgetter("recipient_id", "kind")
+    groups = [
+        list(group) for _, group in groupby(sorted(notifications, key=key), key=key)
+    ]
+    send_groups(groups, now, stats)
+
+    Notification.objects.bulk_update(
+        notifications,
+        ["status", "attempts", "next_attempt_at", "last_error", "sent_at"],
+    )
+    return len(notifications)
+
+
+def claim_batch(batch_size, now):
+    """
+    Return due notifications of batch, claimed by postponing their next
+    attempt by `NOTIFICATION_CLAIM_TIMEOUT` (in committed transaction).
+    """
+    with transaction.atomic():
+        notifications = list(
+            Notification.objects.due(now)
+            .select_for_update(skip_locked=True, of=("self",))
+            .select_related("recipient")
+            .order_by("next_attempt_at", "pk")[:batch_size]
+        )
+        if notifications:
+            Notification.objects.filter(pk__in=[n.pk for n in notifications]).update(
+                next_attempt_at=now
+                + timedelta(seconds=settings.NOTIFICATION_CLAIM_TIMEOUT)
+            )
+    return notifications
+
+
+def send_groups(groups, now, stats):
+    """Send email of every group of notifications over one connection."""
+    messages = []
+    for group in groups:
+        recipient = group[0].recipient
+        message = None
+        if recipient.email:
+            try:
+                message = build_message(group[0].kind, recipient, group)
+            except Exception as e:
+                # e.g. unregistered kind, retried like failed sending
+                mark_failed(group, e, now, stats)
+                continue
+        if message is None:
+            mark(group, Notification.Status.SKIPPED, now)
+            stats["skipped"] += len(group)
+        else:
+            messages.append((group, message))
+
+    if not messages:
+        return
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        for group, _ in messages:
+            mark_failed(group, e, now, stats)
+        return
+
+    try:
+        for group, message in messages:
+            try:
+                connection.send_messages([message])
+            except Exception as e:
+                mark_failed(group, e, now, stats)
+            else:
+                mark(group, Notification.Status.SENT, now)
+                stats["messages"] += 1
+    finally:
+        connection.close()
+
+
+def mark(notifications, status, now):
+    for notification in notifications:
+        notification.status = status
+        notification.sent_at = now if status == Notification.Status.SENT else None
+
+
+def mark_failed(notifications, error, now, stats):
+    logger.warning("Sending notifications failed: %r", error)
+    for notification in notifications:
+        notification.attempts += 1
+        notification.last_error = repr(error)
+        if notification.attempts >= settings.NOTIFICATION_MAX_ATTEMPTS:
+            notification.status = Notification.Status.FAILED
+        else:
+            notification.next_attempt_at = now + get_retry_delay(notification.attempts)
+    stats["failed"] += len(notifications)
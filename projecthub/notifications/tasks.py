@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from projecthub.notifications.services import dispatch_notifications as dispatch
+
+
+@shared_task
+def dispatch_notifications():
+    """Drain notification outbox; scheduled periodically (e.g. every minute)."""
+    return dispatch()
@@ -0,0 +1,246 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.utils import timezone
+
+from projecthub.notifications import builders
+from projecthub.notifications.models import Notification
+from projecthub.notifications.services import (
+    dispatch_notifications,
+    enqueue_notification,
+    get_queue_stats,
+)
+
+KIND = Notification.Kind.TASK_REMINDER
+
+
+@pytest.fixture(autouse=True)
+def builder(mocker):
+    def build(user, notifications):
+        texts = sorted({n.payload["text"] for n in notifications})
+        return EmailMessage(subject="Test", body="\n".join(texts), to=[user.email])
+
+    mocker.patch.dict(builders._builders, {KIND: build})
+
+
+def notify(user, text="text", **kwargs):
+    notification = enqueue_notification(user.pk, KIND, {"text": text})
+    if kwargs:
+        Notification.objects.filter(pk=notification.pk).update(**kwargs)
+    return notification
+
+
+@pytest.fixture
+def fail_for(mocker):
+    """Make sending of emails to given addresses fail."""
+
+    def patch(*emails):
+        send_messages = EmailBackend.send_messages
+
+        def fake_send_messages(backend, messages):
+            if any(to in emails for message in messages for to in message.to):
+                raise OSError("Connection refused")
+            return send_messages(backend, messages)
+
+        mocker.patch.object(EmailBackend, "send_messages", fake_send_messages)
+
+    return patch
+
+
+@pytest.mark.django_db
+class TestDispatchNotifications:
+
+    def test_merges_notifications_of_recipient(self, user_factory):
+        user = user_factory()
+        notify(user, "first")
+        notify(user, "second")
+        notify(user, "second")
+
+        dispatch_notifications()
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [user.email]
+        assert mail.outbox[0].body == "first\nsecond"
+        assert not Notification.objects.exclude(status=Notification.Status.SENT)
+        assert all(n.sent_at for n in Notification.objects.all())
+
+    def test_sends_batch_over_one_connection(self, user_factory, mocker):
+        for user in user_factory.create_batch(3):
+            notify(user)
+        mock_get_connection = mocker.patch(
+            "projecthub.notifications.services.get_connection", wraps=get_connection
+        )
+
+        dispatch_notifications()
+
+        assert len(mail.outbox) == 3
+        assert mock_get_connection.call_count == 1
+
+    def test_drains_queue_in_batches(self, user_factory):
+        for user in user_factory.create_batch(5):
+            notify(user)
+
+        stats = dispatch_notifications(batch_size=2)
+
+        assert len(mail.outbox) == 5
+        assert stats["notifications"] == 5
+
+    def test_stops_after_max_batches(self, user_factory):
+        for user in user_factory.create_batch(5):
+            notify(user)
+
+        dispatch_notifications(batch_size=2, max_batches=1)
+
+        assert len(mail.outbox) == 2
+        assert Notification.objects.due().count() == 3
+
+    def test_does_not_send_notifications_not_due(self, user):
+        notify(user, next_attempt_at=timezone.now() + timedelta(minutes=1))
+
+        dispatch_notifications()
+
+        assert len(mail.outbox) == 0
+
+    def test_skips_recipient_without_email(self, user_factory):
+        user = user_factory(email="")
+        notification = notify(user)
+
+        stats = dispatch_notifications()
+
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.SKIPPED
+        assert stats["skipped"] == 1
+
+    def test_retries_failed_with_backoff(self, user_factory, fail_for):
+        user, other = user_factory(), user_factory()
+        notification = notify(user)
+        notify(other)
+        fail_for(user.email)
+
+        before = timezone.now()
+        stats = dispatch_notifications()
+
+        assert [email.to for email in mail.outbox] == [[other.email]]
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.PENDING
+        assert notification.attempts == 1
+        assert "Connection refused" in notification.last_error
+        assert notification.next_attempt_at >= before + timedelta(seconds=60)
+        assert stats["failed"] == 1
+
+    def test_backoff_doubles_with_every_attempt(self, user, fail_for):
+        notification = notify(user, attempts=2)
+        fail_for(user.email)
+
+        before = timezone.now()
+        dispatch_notifications()
+
+        notification.refresh_from_db()
+        assert notification.attempts == 3
+        assert notification.next_attempt_at >= before + timedelta(seconds=240)
+
+    def test_gives_up_after_max_attempts(self, user, fail_for, settings):
+        settings.NOTIFICATION_MAX_ATTEMPTS = 3
+        notification = notify(user, attempts=2)
+        fail_for(user.email)
+
+        dispatch_notifications()
+
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.FAILED
+        assert notification.attempts == 3
+
+    def test_failed_build_doesnt_block_other_notifications(self, user_factory):
+        user, other = user_factory(), user_factory()
+        broken = Notification.objects.create(recipient=user, kind="unregistered")
+        notify(user)
+        notify(other)
+
+        stats = dispatch_notifications()
+
+        assert sorted(email.to for email in mail.outbox) == sorted(
+            [[user.email], [other.email]]
+        )
+        broken.refresh_from_db()
+        assert broken.status == Notification.Status.PENDING
+        assert broken.attempts == 1
+        assert "unregistered" in broken.last_error
+        assert stats["failed"] == 1
+        assert Notification.objects.filter(status=Notification.Status.SENT).count() == 2
+
+    def test_sends_claimed_notifications(self, user, mocker):
+        notification = notify(user)
+        send_messages = EmailBackend.send_messages
+        due_while_sending = []
+
+        def fake_send_messages(backend, messages):
+            due_while_sending.append(Notification.objects.due().exists())
+            return send_messages(backend, messages)
+
+        mocker.patch.object(EmailBackend, "send_messages", fake_send_messages)
+
+        dispatch_notifications()
+
+        # claim is committed, so other dispatchers skip the rows being sent
+        assert due_while_sending == [False]
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.SENT
+
+    def test_claim_of_dead_dispatcher_expires(self, user, mocker, settings):
+        settings.NOTIFICATION_CLAIM_TIMEOUT = 60
+        notification = notify(user)
+        mocker.patch(
+            "projecthub.notifications.services.send_groups", side_effect=SystemExit
+        )
+
+        with pytest.raises(SystemExit):
+            dispatch_notifications()
+
+        assert not Notification.objects.due().exists()
+        assert (
+            Notification.objects.due(timezone.now() + timedelta(seconds=61)).get()
+            == notification
+        )
+
+    def test_connection_failure_retries_whole_batch(self, user_factory, mocker):
+        for user in user_factory.create_batch(2):
+            notify(user)
+        mocker.patch.object(EmailBackend, "open", side_effect=OSError, create=True)
+
+        stats = dispatch_notifications()
+
+        assert len(mail.outbox) == 0
+        assert stats["failed"] == 2
+        assert set(Notification.objects.values_list("attempts", flat=True)) == {1}
+
+    def test_reports_metrics(self, user_factory):
+        for user in user_factory.create_batch(2):
+            notify(user, next_attempt_at=timezone.now() - timedelta(seconds=30))
+
+        stats = dispatch_notifications()
+
+        assert stats["messages"] == 2
+        assert stats["notifications"] == 2
+        assert stats["lag"] >= 30
+        assert stats["messages_per_second"] > 0
+
+
+@pytest.mark.django_db
+class TestGetQueueStats:
+
+    def test_empty_queue(self):
+        assert get_queue_stats() == {"pending": 0, "lag": 0.0}
+
+    def test_counts_due_notifications(self, user):
+        now = timezone.now()
+        notify(user, next_attempt_at=now - timedelta(seconds=10))
+        notify(user, next_attempt_at=now + timedelta(seconds=10))
+        notify(user, status=Notification.Status.SENT)
+
+        stats = get_queue_stats(now)
+
+        assert stats["pending"] == 1
+        assert stats["lag"] == 10
@@ -4,4 +4,4 @@ from rest_framework.permissions import BasePermission
 class IsCommentAuthorPermission(BasePermission):
 
     def has_object_permission(self, request, view, obj):
-        return obj.created_by == request.user
+        return obj.created_by_id == request.user.id
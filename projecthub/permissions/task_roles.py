@@ -1,14 +1,12 @@
-from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import BasePermission
 
-from projecthub.core.utils import get_task_id_from_view
-from projecthub.tasks.models import Task
+from projecthub.core.access import get_access_context
 
 
 class TaskResponsibleHasNoDeletePermission(BasePermission):
 
     def has_object_permission(self, request, view, obj):
-        if obj.responsible != request.user:
+        if obj.responsible_id != request.user.id:
             return True
 
         return request.method != "DELETE"
@@ -17,6 +15,5 @@ class TaskResponsibleHasNoDeletePermission(BasePermission):
 class IsTaskResponsiblePermission(BasePermission):
 
     def has_permission(self, request, view):
-        task_id = get_task_id_from_view(view)
-        task = get_object_or_404(Task, project__tenant=request.tenant, pk=task_id)
-        return task.responsible == request.user
+        access = get_access_context(request, view)
+        return access.is_task_responsible()
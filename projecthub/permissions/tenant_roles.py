@@ -1,30 +1,24 @@
 from rest_framework.permissions import BasePermission
 
-from projecthub.core.models import TenantMembership
+from projecthub.core.access import get_access_context
 
 
 class IsTenantOwnerForCore(BasePermission):
 
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
 
 
 class IsTenantMemberPermission(BasePermission):
 
     def has_permission(self, request, view):
-        tenant_membership = TenantMembership.objects.filter(
-            tenant=request.tenant, user=request.user
-        )
-        return request.tenant.owner == request.user or tenant_membership.exists()
+        return get_access_context(request, view).is_tenant_member
 
     def has_object_permission(self, request, view, obj):
-        tenant_membership = TenantMembership.objects.filter(
-            tenant=request.tenant, user=request.user
-        )
-        return request.tenant.owner == request.user or tenant_membership.exists()
+        return get_access_context(request, view).is_tenant_member
 
 
 class IsTenantOwnerPermission(BasePermission):
 
     def has_permission(self, request, view):
-        return request.tenant.owner == request.user
+        return get_access_context(request, view).is_tenant_owner
@@ -1,5 +1,8 @@
 from rest_framework.exceptions import PermissionDenied
 
+from projecthub.core.access import get_access_context
+from .filters import combine_and, combine_or, negate
+
 
 class OperationHolderMixin:
 
@@ -54,24 +57,74 @@ class OperandHolder(OperationHolderMixin):
         return hash((self.operator_class, self.op1_class, self.op2_class))
 
 
+CHEAP = 0
+EXPENSIVE = 1
+
+
+def _ordered_by_cost(*operands):
+    # sorted() is stable, so operands of equal cost keep declared order
+    return sorted(operands, key=lambda operand: operand.cost)
+
+
+def check_access(policy, request, view):
+    """
+    Evaluate `has_access` of policy.
+    Results of leaf policies are memoized for the whole request,
+    so every leaf runs its lookups at most once.
+    """
+    if isinstance(policy, (AND, OR, NOT)):
+        return policy.has_access(request, view)
+
+    access = get_access_context(request, view)
+    key = type(policy)
+    cached = key in access.policy_results
+    if not cached:
+        access.policy_results[key] = policy.has_access(request, view)
+
+    result = access.policy_results[key]
+    access.trace_policy(policy, "has_access", result, cached)
+    return result
+
+
+def check_object_access(policy, request, view, obj):
+    if isinstance(policy, (AND, OR, NOT)):
+        return policy.has_object_access(request, view, obj)
+
+    result = policy.has_object_access(request, view, obj)
+    get_access_context(request, view).trace_policy(
+        policy, "has_object_access", result, False
+    )
+    return result
+
+
 class AND:
 
     def __init__(self, op1, op2):
         self.op1 = op1
         self.op2 = op2
 
+    @property
+    def cost(self):
+        return self.op1.cost + self.op2.cost
+
     def has_access(self, request, view):
-        return (
-                self.op1.has_access(request, view) and
-                self.op2.has_access(request, view)
+        return all(
+            check_access(op, request, view)
+            for op in _ordered_by_cost(self.op1, self.op2)
         )
 
     def has_object_access(self, request, view, obj):
-        return (
-                self.op1.has_object_access(request, view, obj) and
-                self.op2.has_object_access(request, view, obj)
+        return all(
+            check_object_access(op, request, view, obj)
+            for op in _ordered_by_cost(self.op1, self.op2)
         )
 
+    def get_filter(self, request, view):
+        filter1 = self.op1.get_filter(request, view)
+        if filter1 is False:
+            return False
+        return combine_and(filter1, self.op2.get_filter(request, view))
+
 
 class OR:
 
@@ -79,32 +132,49 @@ class OR:
         self.op1 = op1
         self.op2 = op2
 
+    @property
+    def cost(self):
+        return self.op1.cost + self.op2.cost
+
     def has_access(self, request, view):
-        return (
-                self.op1.has_access(request, view) or
-                self.op2.has_access(request, view)
+        return any(
+            check_access(op, request, view)
+            for op in _ordered_by_cost(self.op1, self.op2)
         )
 
     def has_object_access(self, request, view, obj):
-        return (
-                self.op1.has_access(request, view)
-                and self.op1.has_object_access(request, view, obj)
-        ) or (
-                self.op2.has_access(request, view)
-                and self.op2.has_object_access(request, view, obj)
+        # operand grants object access only if it granted access to the
+        # request, which is already memoized by `check_policies`
+        return any(
+            check_access(op, request, view)
+            and check_object_access(op, request, view, obj)
+            for op in _ordered_by_cost(self.op1, self.op2)
         )
 
+    def get_filter(self, request, view):
+        filter1 = self.op1.get_filter(request, view)
+        if filter1 is True:
+            return True
+        return combine_or(filter1, self.op2.get_filter(request, view))
+
 
 class NOT:
 
     def __init__(self, op1):
         self.op1 = op1
 
+    @property
+    def cost(self):
+        return self.op1.cost
+
     def has_access(self, request, view):
-        return not self.op1.has_access(request, view)
+        return not check_access(self.op1, request, view)
 
     def has_object_access(self, request, view, obj):
-        return not self.op1.has_object_access(request, view, obj)
+        return not check_object_access(self.op1, request, view, obj)
+
+    def get_filter(self, request, view):
+        return negate(self.op1.get_filter(request, view))
 
 
 class BasePolicyMetaclass(OperationHolderMixin, type):
@@ -114,14 +184,27 @@ class BasePolicyMetaclass(OperationHolderMixin, type):
 class BasePolicy(metaclass=BasePolicyMetaclass):
     """
     A base class from which all policies classes should inherit.
+
+    `cost` hints operators which operand to evaluate first: CHEAP policies
+    look only at the request, EXPENSIVE ones query the database.
     """
 
+    cost = EXPENSIVE
+
     def has_access(self, request, view):
         return True
 
     def has_object_access(self, request, view, obj):
         return True
 
+    def get_filter(self, request, view):
+        """
+        Return `Q` expression that grants on queryset level the same access
+        as this policy, or bool if access doesn't depend on the row.
+        By default access is evaluated once for the whole request.
+        """
+        return check_access(self, request, view)
+
 
 class AllowAnyPolicy(BasePolicy):
     """
@@ -131,6 +214,8 @@ class AllowAnyPolicy(BasePolicy):
     more explicit.
     """
 
+    cost = CHEAP
+
     def has_access(self, request, view):
         return True
 
@@ -140,6 +225,8 @@ class IsAuthenticatedPolicy(BasePolicy):
     Allows access only to authenticated users.
     """
 
+    cost = CHEAP
+
     def has_access(self, request, view):
         if not request.user or not request.user.is_authenticated:
             raise PermissionDenied("Authentication required.")
@@ -151,5 +238,7 @@ class IsAdminUserPolicy(BasePolicy):
     Allows access only to admin users.
     """
 
+    cost = CHEAP
+
     def has_access(self, request, view):
         return bool(request.user and request.user.is_staff)
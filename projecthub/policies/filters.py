@@ -0,0 +1,80 @@
+"""
+Compilation of policy expressions into queryset filters.
+
+Every policy (and operator over policies) can be compiled with `get_filter`
+into either a bool, when access doesn't depend on the row, or a `Q`
+expression that grants access to exactly the rows the policy allows.
+Combining them yields a single SQL predicate for a whole `policy_classes`
+expression instead of one round-trip per leaf.
+"""
+
+from django.db.models import Q
+
+
+def combine_and(filter1, filter2):
+    if filter1 is False or filter2 is False:
+        return False
+    if filter1 is True:
+        return filter2
+    if filter2 is True:
+        return filter1
+    return filter1 & filter2
+
+
+def combine_or(filter1, filter2):
+    if filter1 is True or filter2 is True:
+        return True
+    if filter1 is False:
+        return filter2
+    if filter2 is False:
+        return filter1
+    return filter1 | filter2
+
+
+def negate(filter1):
+    if isinstance(filter1, bool):
+        return not filter1
+    return ~filter1
+
+
+def get_lookup(view, relation, field=None):
+    """
+    Return lookup path from view's queryset model to `relation` (and its
+    `field` if given) declared in `view.policy_lookups`, or None if view
+    doesn't declare the relation.
+
+    Empty path means that queryset model is the relation itself.
+    """
+    path = getattr(view, "policy_lookups", {}).get(relation)
+    if path is None:
+        return None
+
+    if field is None:
+        return path or "pk"
+    return f"{path}__{field}" if path else field
+
+
+def compile_policies(policies, request, view):
+    """
+    Compile list of policies (which are AND-ed, same as in `check_policies`)
+    into one filter.
+    """
+    compiled = True
+    for policy in policies:
+        compiled = combine_and(compiled, policy.get_filter(request, view))
+        if compiled is False:
+            break
+    return compiled
+
+
+def filter_by_policies(queryset, policies, request, view):
+    compiled = compile_policies(policies, request, view)
+    if compiled is True:
+        return queryset
+    if compiled is False:
+        return queryset.none()
+    return queryset.filter(compiled)
+
+
+def lookup_q(lookup, value):
+    return Q(**{lookup: value})
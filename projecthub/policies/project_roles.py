@@ -1,43 +1,37 @@
-from rest_framework.generics import get_object_or_404
-
-from projecthub.core.utils import get_project_id_from_obj, get_project_id_from_view
-from projecthub.projects.models import ProjectMembership, Project
+from projecthub.core.access import get_access_context
 from .base import BasePolicy
+from .filters import get_lookup, lookup_q
 
 
 class IsProjectMemberPolicy(BasePolicy):
 
     def has_access(self, request, view):
-        project_id = get_project_id_from_view(view)
-        project = get_object_or_404(Project, pk=project_id)
-
-        project_membership = ProjectMembership.objects.filter(
-            project_id=project_id, project__tenant=request.tenant, user=request.user
-        )
-
-        has_access = (
-            request.user.id in {project.owner_id, project.supervisor_id}
-            or project_membership.exists()
-        )
-        return has_access
+        access = get_access_context(request, view)
+        return access.is_project_member()
 
     def has_object_access(self, request, view, obj):
-        project_id = get_project_id_from_obj(obj)
-        project = get_object_or_404(Project, pk=project_id)
+        access = get_access_context(request, view)
+        return access.is_project_member(access.get_project_for_obj(obj))
 
-        project_membership = ProjectMembership.objects.filter(
-            project_id=project_id, project__tenant=request.tenant, user=request.user
-        )
+    def get_filter(self, request, view):
+        project = get_lookup(view, "project")
+        if project is None:
+            return super().get_filter(request, view)
 
-        return (
-            request.user.id in {project.owner_id, project.supervisor_id}
-            or project_membership.exists()
-        )
+        project_ids = get_access_context(request, view).roles.project_ids
+        return lookup_q(f"{project}__in", project_ids) if project_ids else False
 
 
 class IsProjectStaffPolicy(BasePolicy):
 
     def has_access(self, request, view):
-        project_id = get_project_id_from_view(view)
-        project = get_object_or_404(Project, pk=project_id)
-        return request.user.id in {project.owner_id, project.supervisor_id}
+        access = get_access_context(request, view)
+        return access.is_project_staff()
+
+    def get_filter(self, request, view):
+        project = get_lookup(view, "project")
+        if project is None:
+            return super().get_filter(request, view)
+
+        project_ids = get_access_context(request, view).roles.staff_project_ids
+        return lookup_q(f"{project}__in", project_ids) if project_ids else False
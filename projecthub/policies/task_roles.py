@@ -1,13 +1,16 @@
-from rest_framework.generics import get_object_or_404
-
-from projecthub.core.utils import get_task_id_from_view
-from projecthub.tasks.models import Task
+from projecthub.core.access import get_access_context
 from .base import BasePolicy
+from .filters import get_lookup, lookup_q
 
 
 class IsTaskResponsiblePolicy(BasePolicy):
-    
+
     def has_access(self, request, view):
-        task_id = get_task_id_from_view(view)
-        task = get_object_or_404(Task, project__tenant=request.tenant, pk=task_id)
-        return task.responsible == request.user
+        access = get_access_context(request, view)
+        return access.is_task_responsible()
+
+    def get_filter(self, request, view):
+        if get_lookup(view, "task") is None:
+            return super().get_filter(request, view)
+
+        return lookup_q(get_lookup(view, "task", "responsible"), request.user)
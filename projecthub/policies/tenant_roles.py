@@ -1,17 +1,15 @@
-from projecthub.core.models import TenantMembership
-from .base import BasePolicy
+from projecthub.core.access import get_access_context
+from .base import BasePolicy, CHEAP
 
 
 class IsTenantMemberPolicy(BasePolicy):
 
     def has_access(self, request, view):
-        tenant_membership = TenantMembership.objects.filter(
-            tenant=request.tenant, user=request.user
-        )
-        return request.tenant.owner == request.user or tenant_membership.exists()
+        return get_access_context(request, view).is_tenant_member
 
 
 class IsTenantOwnerPolicy(BasePolicy):
+    cost = CHEAP
 
     def has_access(self, request, view):
-        return request.tenant.owner == request.user
+        return get_access_context(request, view).is_tenant_owner
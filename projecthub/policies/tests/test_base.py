@@ -0,0 +1,80 @@
+import pytest
+
+from projecthub.policies.base import (
+    BasePolicy,
+    CHEAP,
+    check_access,
+    check_object_access,
+)
+
+
+class CountingPolicy(BasePolicy):
+    result = True
+    calls = 0
+
+    def has_access(self, request, view):
+        type(self).calls += 1
+        return self.result
+
+
+class ExpensiveDenyPolicy(CountingPolicy):
+    result = False
+
+
+class ExpensiveAllowPolicy(CountingPolicy):
+    result = True
+
+
+class CheapAllowPolicy(CountingPolicy):
+    cost = CHEAP
+    result = True
+
+
+@pytest.fixture(autouse=True)
+def _reset_calls():
+    for policy in (ExpensiveDenyPolicy, ExpensiveAllowPolicy, CheapAllowPolicy):
+        policy.calls = 0
+
+
+@pytest.fixture
+def request_(rf):
+    return rf.get("/")
+
+
+@pytest.mark.django_db
+class TestOperators:
+
+    def test_has_access_is_memoized_per_request(self, request_):
+        policy = (ExpensiveDenyPolicy | ExpensiveAllowPolicy)()
+
+        assert check_access(policy, request_, None)
+        assert check_object_access(policy, request_, None, object())
+
+        assert ExpensiveDenyPolicy.calls == 1
+        assert ExpensiveAllowPolicy.calls == 1
+
+    def test_cheap_operand_is_evaluated_first(self, request_):
+        policy = (ExpensiveAllowPolicy | CheapAllowPolicy)()
+
+        assert check_access(policy, request_, None)
+
+        assert CheapAllowPolicy.calls == 1
+        assert ExpensiveAllowPolicy.calls == 0
+
+    def test_and_short_circuits(self, request_):
+        policy = (ExpensiveDenyPolicy & ExpensiveAllowPolicy)()
+
+        assert not check_access(policy, request_, None)
+        assert ExpensiveAllowPolicy.calls == 0
+
+    def test_trace_shows_deciding_policy(self, request_):
+        policy = (ExpensiveDenyPolicy | ExpensiveAllowPolicy)()
+
+        check_access(policy, request_, None)
+        check_access(policy, request_, None)
+
+        assert request_.access.deciding_policy == "ExpensiveAllowPolicy"
+        assert request_.access.policy_trace[-2:] == [
+            ("ExpensiveDenyPolicy", "has_access", False, True),
+            ("ExpensiveAllowPolicy", "has_access", True, True),
+        ]
@@ -1,5 +1,6 @@
 from django_filters import rest_framework as filters
 
+from projecthub.core.filters import UsernameFilter
 from ...models import Project, ProjectMembership
 
 
@@ -15,16 +16,12 @@ class ProjectFilterSet(filters.FilterSet):
     close_date_before = filters.IsoDateTimeFilter(
         field_name="close_date", lookup_expr="lte"
     )
-    creator = filters.CharFilter(
-        field_name="created_by__username", lookup_expr="icontains"
-    )
-    owner = filters.CharFilter(field_name="owner__username", lookup_expr="icontains")
-    supervisor = filters.CharFilter(
-        field_name="supervisor__username", lookup_expr="icontains"
-    )
-    responsible = filters.CharFilter(
-        field_name="responsible__username", lookup_expr="icontains"
-    )
+    creator = UsernameFilter(field_name="created_by")
+    creator_id = filters.UUIDFilter(field_name="created_by")
+    owner = UsernameFilter(field_name="owner")
+    owner_id = filters.UUIDFilter(field_name="owner")
+    supervisor = UsernameFilter(field_name="supervisor")
+    supervisor_id = filters.UUIDFilter(field_name="supervisor")
 
     class Meta:
         model = Project
@@ -37,18 +34,19 @@ class ProjectFilterSet(filters.FilterSet):
             "close_date_after",
             "close_date_before",
             "creator",
+            "creator_id",
             "owner",
+            "owner_id",
             "supervisor",
-            "responsible",
+            "supervisor_id",
         )
 
 
 class ProjectMembershipFilterSet(filters.FilterSet):
     role = filters.MultipleChoiceFilter(choices=ProjectMembership.Role.choices)
-    creator = filters.CharFilter(
-        field_name="created_by__username", lookup_expr="icontains"
-    )
+    creator = UsernameFilter(field_name="created_by")
+    creator_id = filters.UUIDFilter(field_name="created_by")
 
     class Meta:
         model = ProjectMembership
-        fields = ("role", "creator")
+        fields = ("role", "creator", "creator_id")
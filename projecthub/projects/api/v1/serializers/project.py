@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from projecthub.core.api.v1.serializers.base import UserNestedSerializer
+from projecthub.core.roles import get_role_index
 from projecthub.projects.models import Project
 from projecthub.tasks.services import create_default_boards
 
@@ -29,9 +30,8 @@ class BaseProjectWriteSerializer(serializers.ModelSerializer):
 
     def _validate_user_is_tenant_owner_or_member(self, user):
         tenant = self.context["tenant"]
-        tenant_members_ids = tenant.members.values_list("user_id", flat=True)
 
-        if not (user.pk == tenant.owner_id or user.pk in tenant_members_ids):
+        if not get_role_index(user).is_tenant_member(tenant.pk):
             raise serializers.ValidationError("Must be owner or member of tenant.")
         return user
 
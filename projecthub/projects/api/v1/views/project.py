@@ -2,6 +2,9 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, filters, permissions
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.core.api.v1.views.mixins import CachedListMixin, ProjectionListMixin
+from projecthub.core.cache import tenant_scope
+from projecthub.core.filters import RankedSearchFilter
 from projecthub.permissions import (
     ReadOnlyPermission,
     IsTenantOwnerPermission,
@@ -25,26 +28,34 @@ from ..serializers import (
 )
 
 
-class ProjectListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
+class ProjectListCreateAPIView(
+    SecureGenericAPIView,
+    CachedListMixin,
+    ProjectionListMixin,
+    generics.ListCreateAPIView,
+):
     policy_classes = [
         IsAuthenticatedPolicy & (IsAdminUserPolicy | IsTenantMemberPolicy)
     ]
+    filter_policy_classes = [
+        IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectMemberPolicy
+    ]
+    policy_lookups = {"project": ""}
     permission_classes = [
         permissions.IsAuthenticated & (IsTenantOwnerPermission | ReadOnlyPermission)
     ]
     pagination_class = ProjectPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        RankedSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_class = ProjectFilterSet
-    search_fields = ("name",)  # TODO: add search by description
+    search_fields = ("name", "description")
     ordering_fields = ("name", "created_at", "start_date", "end_date", "close_date")
 
     def get_queryset(self):
         qs = Project.objects.for_tenant(self.request.tenant)
-        qs = qs.visible_to(user=self.request.user, tenant=self.request.tenant)
         return qs
 
     def get_serializer_class(self):
@@ -58,6 +69,16 @@ class ProjectListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView)
         context["request_user"] = self.request.user
         return context
 
+    def get_response_cache_scope(self):
+        return tenant_scope(self.request.tenant.pk)
+
+    def get_response_cache_role(self):
+        # same classes as `filter_policy_classes`
+        user = self.request.user
+        if user.is_staff or self.request.access.is_tenant_owner:
+            return "all"
+        return f"member:{user.pk}"
+
     def perform_create(self, serializer):
         serializer.save(
             tenant=self.request.tenant,
@@ -74,6 +95,10 @@ class ProjectRetrieveUpdateDestroyAPIView(
         IsAuthenticatedPolicy
         & (IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectMemberPolicy)
     ]
+    filter_policy_classes = [
+        IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectMemberPolicy
+    ]
+    policy_lookups = {"project": ""}
     permission_classes = [
         permissions.IsAuthenticated
         & (
@@ -86,7 +111,6 @@ class ProjectRetrieveUpdateDestroyAPIView(
 
     def get_queryset(self):
         qs = Project.objects.for_tenant(self.request.tenant)
-        qs = qs.visible_to(user=self.request.user, tenant=self.request.tenant)
         return qs
 
     def get_serializer_class(self):
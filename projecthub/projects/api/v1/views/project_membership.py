@@ -1,8 +1,8 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, filters, permissions
-from rest_framework.generics import get_object_or_404
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.core.api.v1.views.mixins import ProjectionListMixin
 from projecthub.permissions import (
     ReadOnlyPermission,
     IsTenantOwnerPermission,
@@ -14,7 +14,7 @@ from projecthub.policies import (
     IsTenantOwnerPolicy,
     IsProjectMemberPolicy,
 )
-from projecthub.projects.models import ProjectMembership, Project
+from projecthub.projects.models import ProjectMembership
 from .pagination import ProjectMembershipPagination
 from ..filters import ProjectMembershipFilterSet
 from ..serializers import (
@@ -26,7 +26,7 @@ from ..serializers import (
 
 
 class ProjectMembershipListCreateAPIView(
-    SecureGenericAPIView, generics.ListCreateAPIView
+    SecureGenericAPIView, ProjectionListMixin, generics.ListCreateAPIView
 ):
     policy_classes = [
         IsAuthenticatedPolicy
@@ -63,8 +63,7 @@ class ProjectMembershipListCreateAPIView(
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        project = get_object_or_404(Project, pk=self.get_project_id())
-        context["project"] = project
+        context["project"] = self.request.access.project
         return context
 
     def perform_create(self, serializer):
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+from projecthub.core import operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_alter_tenant_sub_domain"),
+        ("projects", "0003_remove_project_responsible"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        operations.PostgresAddIndex(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="project_search_vector_gin"
+            ),
+        ),
+        operations.PostgresRunSQL(
+            sql="""
+            CREATE FUNCTION projects_project_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+                    setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER projects_project_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF name, description ON projects_project
+            FOR EACH ROW EXECUTE FUNCTION projects_project_search_vector_update();
+
+            -- fill vectors of existing rows through the trigger
+            UPDATE projects_project SET name = name;
+            """,
+            reverse_sql="""
+            DROP TRIGGER IF EXISTS projects_project_search_vector_trigger ON projects_project;
+            DROP FUNCTION IF EXISTS projects_project_search_vector_update();
+            """,
+        ),
+    ]
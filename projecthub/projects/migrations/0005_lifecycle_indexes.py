@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_alter_tenant_sub_domain"),
+        ("projects", "0004_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["status", "start_date"],
+                name="project_start_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status__in", ["active", "pending"])),
+                fields=["status", "end_date"],
+                name="project_end_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0005_lifecycle_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # new indexes are created before the ones they replace are dropped
+        migrations.AddIndex(
+            model_name="projectmembership",
+            index=models.Index(
+                fields=["user", "project"], name="project_membership_user_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectmembership",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Project that owns this member.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="members",
+                to="projects.project",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectmembership",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="User that is member of project.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="projects",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -1,10 +1,13 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from projecthub.core.models import UUIDModel, TimestampedModel, Tenant
+from projecthub.core.roles import get_role_index
 
 
 class ProjectQuerySet(models.QuerySet):
@@ -16,12 +19,9 @@ class ProjectQuerySet(models.QuerySet):
         if user.is_staff or tenant.owner_id == user.id:
             return self
 
-        return self.filter(
-            models.Q(owner=user)
-            | models.Q(supervisor=user)
-            | models.Q(responsible=user)
-            | models.Q(members__user=user)
-        )
+        # `id IN` from role index (memberships, owned and supervised
+        # projects) instead of joining members, which duplicates rows
+        return self.filter(pk__in=get_role_index(user).project_ids)
 
 
 class Project(UUIDModel, TimestampedModel):
@@ -93,20 +93,9 @@ class Project(UUIDModel, TimestampedModel):
         help_text=_("User who made the last change."),
     )
 
-    # TODO:
-    # add search vector: `search_vector = SearchVectorField(null=True)`
-    # create index for it `GinIndex(fields=["search_vector"]`
-    # override save method: `self.search_vector = SearchVector("body")
-    # in views:
-    # def get_queryset(self):
-    #   queryset = super().get_queryset()
-    #   query = self.request.query_params.get('search')
-    #   if query:
-    #       search_query = SearchQuery(query)
-    #       queryset = queryset.annotate(
-    #           rank=SearchRank(F('search_vector'), search_query)
-    #       ).filter(search_vector=search_query).order_by('-rank')
-    #   return queryset
+    # maintained by database trigger (PostgreSQL only), see `projecthub.core.search`
+    search_vector = SearchVectorField(null=True, editable=False)
+    search_vector_fields = (("name", "A"), ("description", "B"))
 
     objects = ProjectQuerySet.as_manager()
 
@@ -122,6 +111,21 @@ class Project(UUIDModel, TimestampedModel):
                 name="project_start_date_before_or_equal_to_end_date",
             )
         ]
+        indexes = [
+            # created on PostgreSQL only
+            GinIndex(fields=["search_vector"], name="project_search_vector_gin"),
+            # lifecycle jobs, see `projecthub.projects.tasks`
+            models.Index(
+                fields=["status", "start_date"],
+                condition=models.Q(status="pending"),
+                name="project_start_date_idx",
+            ),
+            models.Index(
+                fields=["status", "end_date"],
+                condition=models.Q(status__in=["active", "pending"]),
+                name="project_end_date_idx",
+            ),
+        ]
 
     def __str__(self):
         status = self.get_status_display()
@@ -25,12 +25,14 @@ class ProjectMembership(UUIDModel, TimestampedModel):
         "Project",
         on_delete=models.CASCADE,
         related_name="members",
+        db_index=False,  # covered by `unique_project_user_membership`
         help_text=_("Project that owns this member."),
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="projects",
+        db_index=False,  # covered by `project_membership_user_idx`
         help_text=_("User that is member of project."),
     )
     role = models.CharField(
@@ -66,6 +68,12 @@ class ProjectMembership(UUIDModel, TimestampedModel):
                 fields=["project", "user"], name="unique_project_user_membership"
             )
         ]
+        indexes = [
+            # projects of user
+            models.Index(
+                fields=["user", "project"], name="project_membership_user_idx"
+            ),
+        ]
 
     def __str__(self):
         role = self.get_role_display()
@@ -1,25 +1,82 @@
+import logging
+
 from celery import shared_task
+from django.conf import settings
+from django.db import transaction
 from django.db.models import OuterRef, Exists
 from django.utils import timezone
 
+from projecthub.core.cache import project_scope, response_cache, tenant_scope
 from projecthub.projects.models import Project
 from projecthub.tasks.models import Task
 
+logger = logging.getLogger(__name__)
+
+
+def transition_in_chunks(queryset, **values):
+    """
+    Update projects of `queryset` with `values` in chunks of
+    `PROJECT_LIFECYCLE_CHUNK_SIZE`, each in its own transaction, and return
+    number of updated projects.
+
+    `queryset` must select only projects whose state the update changes,
+    so updated projects drop out of it and the next chunk picks up the rest.
+    Rows locked by concurrent runs are skipped.
+    """
+    chunk_size = settings.PROJECT_LIFECYCLE_CHUNK_SIZE
+    total = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                queryset.select_for_update(skip_locked=True)
+                .order_by()
+                .values_list("pk", "tenant_id")[:chunk_size]
+            )
+            pks = [pk for pk, _ in rows]
+            updated = queryset.filter(pk__in=pks).update(**values) if pks else 0
+            # `update()` sends no signals
+            response_cache.invalidate(
+                *{tenant_scope(tenant_id) for _, tenant_id in rows},
+                *{project_scope(pk) for pk in pks},
+            )
+
+        total += updated
+        if updated == 0:
+            return total
+
 
 @shared_task
 def archive_ended_projects():
+    today = timezone.localdate()
     open_tasks = Task.objects.filter(project=OuterRef("pk"), close_date__isnull=True)
 
+    # uses `project_end_date_idx`
     ended_projects = Project.objects.filter(
-        end_date__lte=timezone.now(), close_date__isnull=True
+        status__in=[Project.Status.ACTIVE, Project.Status.PENDING],
+        end_date__lte=today,
+        close_date__isnull=True,
     )
-    ended_projects = ended_projects.annotate(has_open_tasks=Exists(open_tasks))
-    ended_projects = ended_projects.filter(has_open_tasks=False)
+    ended_projects = ended_projects.filter(~Exists(open_tasks))
 
-    ended_projects.update(status=Project.Status.ARCHIVED, close_date=timezone.now())
+    now = timezone.now()
+    archived = transition_in_chunks(
+        ended_projects, status=Project.Status.ARCHIVED, close_date=now, updated_at=now
+    )
+    logger.info("Archived %d ended projects", archived)
+    return f"{archived} projects archived"
 
 
 @shared_task
 def activate_pending_projects():
-    pending_projects = Project.objects.filter(start_date__lte=timezone.now())
-    pending_projects.update(status=Project.Status.ACTIVE)
+    today = timezone.localdate()
+
+    # uses `project_start_date_idx`
+    pending_projects = Project.objects.filter(
+        status=Project.Status.PENDING, start_date__lte=today
+    )
+
+    activated = transition_in_chunks(
+        pending_projects, status=Project.Status.ACTIVE, updated_at=timezone.now()
+    )
+    logger.info("Activated %d pending projects", activated)
+    return f"{activated} projects activated"
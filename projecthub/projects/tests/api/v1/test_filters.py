@@ -40,15 +40,22 @@ class TestProjectFilterSet:
         assert filtered.count() == 1
         assert filtered.first().pk == john_project.pk
 
-    def test_by_responsible_username(self, project_factory, john, alice):
-        john_project = project_factory(responsible=john)
-        alice_project = project_factory(responsible=alice)
+    @pytest.mark.parametrize("name", ["creator_id", "owner_id", "supervisor_id"])
+    def test_by_user_id(self, project_factory, john, alice, name):
+        field = {"creator_id": "created_by"}.get(name, name.removesuffix("_id"))
+        john_project = project_factory(**{field: john})
+        alice_project = project_factory(**{field: alice})
 
         queryset = Project.objects.all()
-        filtered = ProjectFilterSet({"responsible": "jo"}, queryset=queryset).qs
+        filtered = ProjectFilterSet({name: john.pk}, queryset=queryset).qs
 
-        assert filtered.count() == 1
-        assert filtered.first().pk == john_project.pk
+        assert list(filtered) == [john_project]
+
+    def test_invalid_user_id(self, project_factory):
+        filterset = ProjectFilterSet(
+            {"owner_id": "not-uuid"}, queryset=Project.objects.all()
+        )
+        assert not filterset.is_valid()
 
 
 @pytest.mark.django_db
@@ -65,3 +72,14 @@ class TestProjectMembershipFilterSet:
 
         assert filtered.count() == 1
         assert filtered.first().pk == john_membership.pk
+
+    def test_by_creator_id(self, project, project_membership_factory, john, alice):
+        john_membership = project_membership_factory(created_by=john)
+        alice_membership = project_membership_factory(created_by=alice)
+
+        queryset = ProjectMembership.objects.all()
+        filtered = ProjectMembershipFilterSet(
+            {"creator_id": john.pk}, queryset=queryset
+        ).qs
+
+        assert list(filtered) == [john_membership]
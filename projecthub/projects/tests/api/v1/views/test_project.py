@@ -155,6 +155,126 @@ class TestProjectListCreateAPIView:
             assert response.data["count"] == 1
             assert {x["id"] for x in response.data["results"]} == {str(p1.id)}
 
+        def test_project_supervisor_sees_supervised_projects(
+            self, api_client, list_url, projects, tenant_user, http_host
+        ):
+            p1, p2 = projects
+            p1.supervisor = tenant_user.user
+            p1.save()
+            api_client.force_authenticate(user=tenant_user.user)
+
+            response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+            assert {x["id"] for x in response.data["results"]} == {str(p1.id)}
+
+        def test_visibility_is_single_predicate(
+            self,
+            api_client,
+            list_url,
+            project_factory,
+            project_membership_factory,
+            tenant,
+            tenant_user,
+            http_host,
+            django_assert_num_queries,
+        ):
+            for project in project_factory.create_batch(5, tenant=tenant):
+                project_membership_factory(project=project, user=tenant_user.user)
+            api_client.force_authenticate(user=tenant_user.user)
+
+            # tenant, role index, count and page
+            with django_assert_num_queries(4):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.data["count"] == 5
+
+        @pytest.mark.usefixtures("shared_role_index_cache")
+        def test_role_index_is_loaded_once(
+            self,
+            api_client,
+            list_url,
+            project,
+            project_membership_factory,
+            tenant_user,
+            http_host,
+            django_assert_num_queries,
+        ):
+            project_membership_factory(project=project, user=tenant_user.user)
+            api_client.force_authenticate(user=tenant_user.user)
+            api_client.get(list_url, HTTP_HOST=http_host)
+
+            # tenant and role index are cached, so only count and page
+            with django_assert_num_queries(2):
+                response = api_client.get(
+                    list_url, {"ordering": "name"}, HTTP_HOST=http_host
+                )
+            assert response.data["count"] == 1
+
+    @pytest.mark.usefixtures("shared_response_cache")
+    class TestResponseCache:
+
+        def test_cached_until_project_changes(
+            self, admin_client, list_url, active_project, http_host
+        ):
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response["X-Cache"] == "MISS"
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response["X-Cache"] == "LOCAL"
+
+            active_project.name = "renamed"
+            active_project.save()
+
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response["X-Cache"] == "MISS"
+            assert response.data["results"][0]["name"] == "renamed"
+
+        def test_members_do_not_share_entries(
+            self,
+            api_client,
+            list_url,
+            tenant,
+            project_factory,
+            project_membership_factory,
+            tenant_membership_factory,
+            http_host,
+        ):
+            projects = project_factory.create_batch(2, tenant=tenant)
+            for project in projects:
+                membership = tenant_membership_factory(tenant=tenant)
+                project_membership_factory(project=project, user=membership.user)
+                api_client.force_authenticate(user=membership.user)
+
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+                assert response["X-Cache"] == "MISS"
+                assert [p["id"] for p in response.data["results"]] == [str(project.pk)]
+
+        def test_new_membership_invalidates_entries(
+            self,
+            api_client,
+            list_url,
+            tenant_user,
+            active_project,
+            project_membership_factory,
+            http_host,
+        ):
+            api_client.force_authenticate(user=tenant_user.user)
+            response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.data["count"] == 0
+
+            project_membership_factory(project=active_project, user=tenant_user.user)
+
+            response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.data["count"] == 1
+
+    def test_not_cached_without_shared_tier(
+        self, admin_client, list_url, active_project, http_host
+    ):
+        admin_client.get(list_url, HTTP_HOST=http_host)
+
+        response = admin_client.get(list_url, HTTP_HOST=http_host)
+
+        assert "X-Cache" not in response
+        assert response.data["count"] == 1
+
     def test_pagination_works(
         self, admin_client, list_url, project_factory, tenant, http_host
     ):
@@ -185,8 +305,8 @@ class TestProjectListCreateAPIView:
     def test_search_works(
         self, admin_client, list_url, tenant, project_factory, http_host
     ):
-        abc_project = project_factory(tenant=tenant, name="abc")
-        qwe_project = project_factory(tenant=tenant, name="qwe")
+        abc_project = project_factory(tenant=tenant, name="abc", description="")
+        qwe_project = project_factory(tenant=tenant, name="qwe", description="")
         response = admin_client.get(list_url, {"search": "ab"}, HTTP_HOST=http_host)
         assert response.status_code == status.HTTP_200_OK
         assert {p["id"] for p in response.data["results"]} == {str(abc_project.pk)}
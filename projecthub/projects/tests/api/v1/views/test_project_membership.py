@@ -233,6 +233,37 @@ class TestProjectMembershipListCreateAPIView:
         expected_ids = [str(old_membership.pk), str(new_membership.pk)]
         assert [m["id"] for m in response.data["results"]] == expected_ids
 
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self, api_client, list_url, http_host, project, django_assert_num_queries
+        ):
+            api_client.force_authenticate(user=project.owner)
+
+            with django_assert_num_queries(3):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+        @pytest.mark.parametrize("count", [1, 20])
+        def test_does_not_depend_on_number_of_members(
+            self,
+            api_client,
+            list_url,
+            http_host,
+            project,
+            project_membership_factory,
+            django_assert_num_queries,
+            count,
+        ):
+            project_membership_factory.create_batch(count, project=project)
+            api_client.force_authenticate(user=project.owner)
+
+            # tenant, project, count, members with users
+            with django_assert_num_queries(4):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["results"]) == count
+
 
 @pytest.mark.django_db
 class TestProjectMembershipRetrieveUpdateDestroyAPIView:
@@ -497,3 +528,19 @@ class TestProjectMembershipRetrieveUpdateDestroyAPIView:
         assert response.status_code == status.HTTP_200_OK
         project_membership.refresh_from_db()
         assert project_membership.updated_by == admin_user
+
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self,
+            api_client,
+            detail_url,
+            http_host,
+            project_membership,
+            django_assert_num_queries,
+        ):
+            api_client.force_authenticate(user=project_membership.project.owner)
+
+            with django_assert_num_queries(3):
+                response = api_client.get(detail_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
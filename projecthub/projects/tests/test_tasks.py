@@ -3,6 +3,7 @@ from datetime import timedelta
 import pytest
 from django.utils import timezone
 
+from projecthub.core.cache import response_cache, tenant_scope
 from projecthub.projects.models import Project
 from projecthub.projects.tasks import archive_ended_projects, activate_pending_projects
 
@@ -40,6 +41,36 @@ class TestArchiveEndedProjects:
         project.refresh_from_db()
         assert not project.is_archived
 
+    def test_does_not_touch_archived_projects(self, project_factory):
+        closed_at = timezone.now() - timedelta(days=3)
+        project = project_factory(
+            status=Project.Status.ARCHIVED,
+            end_date=timezone.now() - timedelta(days=3),
+            close_date=closed_at,
+        )
+
+        assert archive_ended_projects() == "0 projects archived"
+        project.refresh_from_db()
+        assert project.close_date == closed_at
+
+    def test_archives_in_chunks(self, project_factory, settings):
+        settings.PROJECT_LIFECYCLE_CHUNK_SIZE = 2
+        project_factory.create_batch(
+            5, status=Project.Status.ACTIVE, end_date=timezone.now()
+        )
+
+        assert archive_ended_projects() == "5 projects archived"
+        assert Project.objects.filter(status=Project.Status.ARCHIVED).count() == 5
+
+    def test_invalidates_cached_responses(self, project_factory):
+        project = project_factory(status=Project.Status.ACTIVE, end_date=timezone.now())
+        scope = tenant_scope(project.tenant_id)
+        version = response_cache.get_version(scope)
+
+        archive_ended_projects()
+
+        assert response_cache.get_version(scope) != version
+
 
 @pytest.mark.django_db
 class TestActivatePendingProjects:
@@ -62,3 +93,29 @@ class TestActivatePendingProjects:
         project2.refresh_from_db()
         assert project1.is_active
         assert project2.is_pending
+
+    def test_does_not_reactivate_archived_projects(self, project_factory):
+        project = project_factory(
+            status=Project.Status.ARCHIVED,
+            start_date=timezone.now() - timedelta(days=1),
+            close_date=timezone.now(),
+        )
+
+        assert activate_pending_projects() == "0 projects activated"
+        project.refresh_from_db()
+        assert project.is_archived
+
+    def test_activates_in_chunks(
+        self, project_factory, settings, django_assert_num_queries
+    ):
+        settings.PROJECT_LIFECYCLE_CHUNK_SIZE = 2
+        project_factory.create_batch(
+            3,
+            status=Project.Status.PENDING,
+            start_date=timezone.now() - timedelta(days=1),
+        )
+
+        # 3 chunks (2, 1 and none left) of savepoint, select, update, release;
+        # the last chunk doesn't update
+        with django_assert_num_queries(11):
+            assert activate_pending_projects() == "3 projects activated"
@@ -1,21 +1,20 @@
 from django.forms import CharField
 from django_filters import rest_framework as filters
 
-from projecthub.core.filters import MultipleValueFilter
+from projecthub.core.filters import MultipleValueFilter, UsernameFilter
 from ...models import Task
 
 
 class TaskFilterSet(filters.FilterSet):
     status = MultipleValueFilter(field_name="status__name", field_class=CharField)
+    board = filters.UUIDFilter(field_name="board")
     priority = filters.NumberFilter()
     priority_min = filters.NumberFilter(field_name="priority", lookup_expr="gte")
     priority_max = filters.NumberFilter(field_name="priority", lookup_expr="lte")
-    responsible = filters.CharFilter(
-        field_name="responsible__username", lookup_expr="icontains"
-    )
-    creator = filters.CharFilter(
-        field_name="created_by__username", lookup_expr="icontains"
-    )
+    responsible = UsernameFilter(field_name="responsible")
+    responsible_id = filters.UUIDFilter(field_name="responsible")
+    creator = UsernameFilter(field_name="created_by")
+    creator_id = filters.UUIDFilter(field_name="created_by")
     start_date_after = filters.IsoDateTimeFilter(
         field_name="start_date", lookup_expr="gte"
     )
@@ -37,9 +36,12 @@ class TaskFilterSet(filters.FilterSet):
         model = Task
         fields = (
             "status",
+            "board",
             "priority",
             "responsible",
+            "responsible_id",
             "creator",
+            "creator_id",
             "start_date_after",
             "start_date_before",
             "end_date_after",
@@ -3,6 +3,7 @@ from .board import (
     BoardDetailSerializer,
     BoardCreateSerializer,
     BoardUpdateSerializer,
+    KanbanBoardSerializer,
 )
 from .task import (
     TaskListSerializer,
@@ -10,4 +11,8 @@ from .task import (
     TaskCreateSerializer,
     TaskUpdateSerializer,
     TaskUpdateSerializerForResponsible,
+    TaskBulkCreateSerializer,
+    TaskBulkUpdateSerializer,
+    TaskBulkMoveSerializer,
 )
+from .stats import ProjectStatsSerializer
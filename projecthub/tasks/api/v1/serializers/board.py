@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from projecthub.tasks.models import Board
+from .task import TaskListSerializer
 
 
 class BaseBoardReadSerializer(serializers.Serializer):
@@ -17,6 +18,12 @@ class BoardDetailSerializer(BaseBoardReadSerializer):
     pass
 
 
+class KanbanBoardSerializer(BaseBoardReadSerializer):
+    tasks = TaskListSerializer(many=True, source="kanban_tasks")
+    tasks_count = serializers.IntegerField(source="kanban_tasks_count")
+    next = serializers.URLField(source="kanban_next", allow_null=True)
+
+
 class BoardCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Board
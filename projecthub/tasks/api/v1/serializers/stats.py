@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+
+class BoardTaskCountSerializer(serializers.Serializer):
+    board = serializers.UUIDField(allow_null=True)
+    count = serializers.IntegerField()
+
+
+class ResponsibleTaskCountSerializer(serializers.Serializer):
+    responsible = serializers.UUIDField(allow_null=True)
+    count = serializers.IntegerField()
+
+
+class ProjectStatsSerializer(serializers.Serializer):
+    open_tasks = serializers.IntegerField()
+    closed_tasks = serializers.IntegerField()
+    overdue_tasks = serializers.IntegerField()
+    tasks_per_board = BoardTaskCountSerializer(many=True)
+    tasks_per_responsible = ResponsibleTaskCountSerializer(many=True)
@@ -3,14 +3,17 @@ from datetime import datetime, time
 from django.utils import timezone
 from rest_framework import serializers
 
-from projecthub.core.api.v1.serializers.base import UserNestedSerializer
+from projecthub.core.api.v1.serializers.base import (
+    PreloadedRelatedField,
+    UserNestedSerializer,
+)
 from projecthub.tasks.models import Task
 
 
 class BaseTaskReadSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField()
-    board = serializers.SerializerMethodField()
+    board = serializers.CharField(source="board.name", allow_null=True)
     priority = serializers.IntegerField()
     start_date = serializers.DateTimeField()
     end_date = serializers.DateTimeField()
@@ -18,12 +21,11 @@ class BaseTaskReadSerializer(serializers.Serializer):
     created_by = UserNestedSerializer()
     created_at = serializers.DateTimeField()
 
-    def get_board(self, obj):
-        return getattr(obj.board, "name", None)
-
 
 class TaskListSerializer(BaseTaskReadSerializer):
-    pass
+    comment_count = serializers.IntegerField()
+    reply_count = serializers.IntegerField()
+    attachment_count = serializers.IntegerField()
 
 
 class TaskDetailSerializer(BaseTaskReadSerializer):
@@ -78,6 +80,9 @@ class BaseTaskWriteSerializer(serializers.ModelSerializer):
         else:
             project = self.instance.project
 
+        if start_date is None or project.start_date is None:
+            return start_date
+
         project_start = timezone.make_aware(
             datetime.combine(project.start_date, time.min)
         )
@@ -91,6 +96,10 @@ class BaseTaskWriteSerializer(serializers.ModelSerializer):
             project = self.context["project"]
         else:
             project = self.instance.project
+
+        if end_date is None or project.end_date is None:
+            return end_date
+
         project_end = timezone.make_aware(datetime.combine(project.end_date, time.min))
 
         if end_date > project_end:
@@ -103,6 +112,9 @@ class BaseTaskWriteSerializer(serializers.ModelSerializer):
         else:
             project = self.instance.project
 
+        if close_date is None or project.start_date is None:
+            return close_date
+
         project_start = timezone.make_aware(
             datetime.combine(project.start_date, time.min)
         )
@@ -128,12 +140,6 @@ class TaskCreateSerializer(BaseTaskWriteSerializer):
             "close_date",
         )
 
-    def create(self, validated_data):
-        responsible = validated_data.pop("responsible", None)
-        instance = super().create(validated_data)
-        instance.assign_responsible(responsible)
-        return instance
-
 
 class TaskUpdateSerializer(BaseTaskWriteSerializer):
     class Meta:
@@ -152,16 +158,10 @@ class TaskUpdateSerializer(BaseTaskWriteSerializer):
 
     def validate_close_date(self, close_date):
         task = self.instance
-        if task.start_date and close_date < task.start_date:
+        if task.start_date and close_date and close_date < task.start_date:
             raise serializers.ValidationError("Task can't close before task start.")
         return super().validate_close_date(close_date)
 
-    def update(self, instance, validated_data):
-        responsible = validated_data.pop("responsible", None)
-        super().update(instance, validated_data)
-        instance.assign_responsible(responsible)
-        return instance
-
 
 class TaskUpdateSerializerForResponsible(serializers.ModelSerializer):
     class Meta:
@@ -189,3 +189,43 @@ class TaskUpdateSerializerForResponsible(serializers.ModelSerializer):
 
         instance.set_board(new_board, user)
         return instance
+
+
+class BaseTaskBulkSerializer(serializers.Serializer):
+    """
+    Validates one item of bulk request. Boards and responsibles are resolved
+    from `boards` and `members` of project preloaded once for the whole
+    batch (see `TaskBulkAPIView`), so items are validated without queries.
+    """
+
+    board = PreloadedRelatedField("boards", required=False, allow_null=True)
+    responsible = PreloadedRelatedField(
+        "members",
+        required=False,
+        allow_null=True,
+        error_messages={"does_not_exist": "Responsible must be member of project."},
+    )
+
+    def validate_board(self, board):
+        # only boards of project are preloaded
+        return board
+
+    def validate_responsible(self, responsible):
+        # only members of project are preloaded
+        return responsible
+
+
+class TaskBulkCreateSerializer(BaseTaskBulkSerializer, TaskCreateSerializer):
+    pass
+
+
+class TaskBulkUpdateSerializer(BaseTaskBulkSerializer, TaskUpdateSerializer):
+    pass
+
+
+class TaskBulkMoveSerializer(BaseTaskBulkSerializer, serializers.ModelSerializer):
+    board = PreloadedRelatedField("boards")
+
+    class Meta:
+        model = Task
+        fields = ("board", "priority")
@@ -1,4 +1,7 @@
 from .board import (
     BoardListCreateAPIView, BoardRetrieveUpdateDestroyAPIView
 )
+from .bulk import TaskBulkAPIView, TaskBulkMoveAPIView
+from .kanban import KanbanAPIView
 from .task import TaskListCreateAPIView, TaskRetrieveUpdateDestroyAPIView
+from .stats import ProjectStatsAPIView
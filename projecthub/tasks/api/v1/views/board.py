@@ -1,5 +1,4 @@
 from rest_framework import generics, permissions, filters
-from rest_framework.generics import get_object_or_404
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
 from projecthub.permissions import (
@@ -13,7 +12,6 @@ from projecthub.policies import (
     IsTenantOwnerPolicy,
     IsProjectMemberPolicy,
 )
-from projecthub.projects.models import Project
 from projecthub.tasks.models import Board
 from .pagination import BoardPagination
 from ..serializers import (
@@ -74,9 +72,8 @@ class BoardListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
     def get_project_id(self):
         return self.kwargs["project_id"]
 
-    # TODO: додати кешування project в self._cached_project
     def get_project(self):
-        return get_object_or_404(Project, pk=self.get_project_id())
+        return self.request.access.project
 
 
 class BoardRetrieveUpdateDestroyAPIView(
@@ -109,4 +106,4 @@ class BoardRetrieveUpdateDestroyAPIView(
         return self.kwargs["project_id"]
 
     def get_project(self):
-        return get_object_or_404(Project, pk=self.get_project_id())
+        return self.request.access.project
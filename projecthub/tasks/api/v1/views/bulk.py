@@ -0,0 +1,227 @@
+import uuid
+
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.permissions import IsTenantOwnerPermission, IsProjectStaffPermission
+from projecthub.policies import (
+    IsAuthenticatedPolicy,
+    IsAdminUserPolicy,
+    IsTenantOwnerPolicy,
+    IsProjectMemberPolicy,
+)
+from projecthub.tasks.models import Task
+from projecthub.tasks.services import (
+    bulk_create_tasks,
+    bulk_update_tasks,
+    get_project_boards,
+    get_project_members,
+)
+from ..serializers import (
+    TaskBulkCreateSerializer,
+    TaskBulkMoveSerializer,
+    TaskBulkUpdateSerializer,
+    TaskListSerializer,
+)
+
+
+class BaseTaskBulkAPIView(SecureGenericAPIView, generics.GenericAPIView):
+    """
+    Base view for bulk task operations.
+
+    Request body is a list of items. Project, its boards and members are
+    loaded once and every item is validated against them. If any item is
+    invalid, nothing is saved and response is a list of per-item errors
+    (empty for valid items) in order of items.
+    """
+
+    policy_classes = [
+        IsAuthenticatedPolicy
+        & (IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectMemberPolicy)
+    ]
+    max_batch_size = 500
+    not_found_message = "Not found."
+
+    def get_queryset(self):
+        qs = Task.objects.for_tenant(self.request.tenant)
+        qs = qs.for_project(self.kwargs["project_id"])
+        qs = qs.visible_to(
+            user=self.request.user,
+            tenant=self.request.tenant,
+            project_id=self.kwargs["project_id"],
+            access=self.request.access,
+        )
+        return qs.select_related("board", "created_by")
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        project = self.request.access.project
+        context["project"] = project
+        context["boards"] = get_project_boards(project)
+        context["members"] = get_project_members(project)
+        return context
+
+    def get_items(self):
+        items = self.request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError("Expected a non-empty list of items.")
+        if len(items) > self.max_batch_size:
+            raise ValidationError(
+                f"Ensure there are no more than {self.max_batch_size} items."
+            )
+        if not all(isinstance(item, dict) for item in items):
+            raise ValidationError("Expected a list of objects.")
+        return items
+
+    def validate_items(self, entries, get_serializer):
+        """
+        Validate every entry (item or `(task, data)` pair) with serializer
+        returned by `get_serializer(entry)`, which may also raise
+        `ValidationError` for errors found before validation.
+        """
+        validated, errors = [], []
+        for entry in entries:
+            try:
+                serializer = get_serializer(entry)
+                serializer.is_valid(raise_exception=True)
+            except ValidationError as e:
+                errors.append(e.detail)
+                continue
+            validated.append(serializer)
+            errors.append({})
+
+        if any(errors):
+            raise ValidationError(errors)
+        return validated
+
+    def get_tasks_for_items(self, items):
+        """
+        Load tasks referenced by `id` of items with one query and return
+        `(task, data)` pairs, where task is None if it's not found
+        (or was already referenced by previous item).
+        """
+        ids = [self.parse_id(item.get("id")) for item in items]
+        tasks = self.get_queryset().in_bulk({pk for pk in ids if pk is not None})
+
+        project = self.request.access.project
+        entries = []
+        for pk, item in zip(ids, items):
+            task = tasks.pop(pk, None)
+            if task is not None:
+                # serializers validate against `instance.project`
+                task.project = project
+            data = {key: value for key, value in item.items() if key != "id"}
+            entries.append((task, data))
+        return entries
+
+    def parse_id(self, value):
+        try:
+            return uuid.UUID(str(value))
+        except ValueError:
+            return None
+
+    def get_task_serializer(self, serializer_class, entry, context, partial=True):
+        task, data = entry
+        if task is None:
+            raise ValidationError({"id": [self.not_found_message]})
+        return serializer_class(task, data=data, partial=partial, context=context)
+
+    def respond(self, tasks, status_code=status.HTTP_200_OK):
+        serializer = TaskListSerializer(tasks, many=True)
+        return Response(serializer.data, status=status_code)
+
+
+class TaskBulkAPIView(BaseTaskBulkAPIView):
+    """
+    API view for creating (POST) and updating (PATCH) tasks in bulk.
+
+    PATCH items must contain `id` of task.
+
+    Permissions:
+        - POST, PATCH: admin, tenant owner, project owner, project supervisor
+    """
+
+    permission_classes = [
+        permissions.IsAuthenticated
+        & (permissions.IsAdminUser | IsTenantOwnerPermission | IsProjectStaffPermission)
+    ]
+
+    def post(self, request, *args, **kwargs):
+        items = self.get_items()
+        context = self.get_serializer_context()
+        serializers = self.validate_items(
+            items, lambda item: TaskBulkCreateSerializer(data=item, context=context)
+        )
+
+        tasks = bulk_create_tasks(
+            context["project"],
+            [serializer.validated_data for serializer in serializers],
+            user=request.user,
+        )
+        return self.respond(tasks, status.HTTP_201_CREATED)
+
+    def patch(self, request, *args, **kwargs):
+        items = self.get_items()
+        context = self.get_serializer_context()
+        serializers = self.validate_items(
+            self.get_tasks_for_items(items),
+            lambda entry: self.get_task_serializer(
+                TaskBulkUpdateSerializer, entry, context
+            ),
+        )
+
+        tasks = bulk_update_tasks(
+            [(s.instance, s.validated_data) for s in serializers], user=request.user
+        )
+        return self.respond(tasks)
+
+
+class TaskBulkMoveAPIView(BaseTaskBulkAPIView):
+    """
+    API view for moving tasks between boards (and reordering them by
+    priority) in bulk. Items are `{"id", "board", "priority"}`.
+
+    Permissions:
+        - POST: admin, tenant owner, project owner, project supervisor;
+          project users can only move (not reprioritize) tasks they are
+          responsible for
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        items = self.get_items()
+        context = self.get_serializer_context()
+        # move serializer doesn't validate project as task write serializers
+        # do, so archived projects are rejected once for the whole batch
+        if context["project"].is_archived:
+            raise ValidationError("Cannot modify tasks in an archived project.")
+        serializers = self.validate_items(
+            self.get_tasks_for_items(items),
+            lambda entry: self.get_move_serializer(entry, context),
+        )
+
+        tasks = bulk_update_tasks(
+            [(s.instance, s.validated_data) for s in serializers], user=request.user
+        )
+        return self.respond(tasks)
+
+    def get_move_serializer(self, entry, context):
+        task, data = entry
+        if task is not None and "priority" in data and not self.is_staff():
+            raise ValidationError(
+                {"priority": ["Only project staff can change priority."]}
+            )
+        return self.get_task_serializer(
+            TaskBulkMoveSerializer, entry, context, partial=False
+        )
+
+    def is_staff(self):
+        access = self.request.access
+        return (
+            self.request.user.is_staff
+            or access.is_tenant_owner
+            or access.is_project_staff()
+        )
@@ -0,0 +1,124 @@
+from collections import defaultdict
+
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+from rest_framework import generics, permissions
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.utils.urls import replace_query_param
+
+from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.policies import (
+    IsAuthenticatedPolicy,
+    IsAdminUserPolicy,
+    IsTenantOwnerPolicy,
+    IsProjectMemberPolicy,
+)
+from projecthub.tasks.models import Board, Task
+from .pagination import TaskPagination
+from ..serializers import KanbanBoardSerializer
+
+
+class KanbanAPIView(SecureGenericAPIView, generics.GenericAPIView):
+    """
+    API view for Kanban board of project: all boards in `order`, each with
+    its first tasks (in default task ordering) and total number of tasks.
+
+    Tasks of all boards are fetched with one query, numbered per board with
+    window function. When a board has more tasks, its `next` links to the
+    task list filtered by the board, continuing with keyset pagination.
+
+    Access:
+        - Only staff and members of current tenant
+
+    Permissions:
+        - GET: admin, tenant owner, owner, supervisor and members of project
+          (project users see only tasks they are responsible for)
+    """
+
+    policy_classes = [
+        IsAuthenticatedPolicy
+        & (IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectMemberPolicy)
+    ]
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = KanbanBoardSerializer
+    task_pagination_class = TaskPagination
+
+    tasks_per_board = 10
+    max_tasks_per_board = 50
+    tasks_per_board_query_param = "tasks_per_board"
+
+    def get(self, request, *args, **kwargs):
+        boards = list(self.get_queryset())
+        self.attach_tasks(boards)
+        serializer = self.get_serializer(boards, many=True)
+        return Response(serializer.data)
+
+    def get_queryset(self):
+        return Board.objects.for_project(self.request.access.project)
+
+    def get_task_queryset(self):
+        qs = Task.objects.for_tenant(self.request.tenant)
+        qs = qs.for_project(self.kwargs["project_id"])
+        qs = qs.visible_to(
+            user=self.request.user,
+            tenant=self.request.tenant,
+            project_id=self.kwargs["project_id"],
+            access=self.request.access,
+        )
+        return qs.filter(board__isnull=False).select_related("created_by")
+
+    def get_tasks_per_board(self):
+        try:
+            value = int(self.request.query_params[self.tasks_per_board_query_param])
+        except (KeyError, ValueError):
+            return self.tasks_per_board
+
+        if value <= 0:
+            return self.tasks_per_board
+        return min(value, self.max_tasks_per_board)
+
+    def attach_tasks(self, boards):
+        limit = self.get_tasks_per_board()
+        paginator = self.task_pagination_class()
+        ordering = paginator.get_default_keyset_ordering()
+
+        # one extra task per board tells whether board has more tasks
+        tasks = (
+            self.get_task_queryset()
+            .annotate(
+                board_position=Window(
+                    RowNumber(), partition_by=F("board"), order_by=ordering
+                ),
+                board_tasks_count=Window(Count("pk"), partition_by=F("board")),
+            )
+            .filter(board_position__lte=limit + 1)
+            .order_by("board", "board_position")
+        )
+
+        tasks_by_board = defaultdict(list)
+        for task in tasks:
+            tasks_by_board[task.board_id].append(task)
+
+        list_url = reverse(
+            "api:v1:task_list",
+            kwargs={"project_id": self.kwargs["project_id"]},
+            request=self.request,
+        )
+        list_url = replace_query_param(list_url, paginator.page_size_query_param, limit)
+
+        for board in boards:
+            board_tasks = tasks_by_board.get(board.pk, [])
+            for task in board_tasks:
+                task.board = board
+
+            board.kanban_tasks = board_tasks[:limit]
+            board.kanban_tasks_count = (
+                board_tasks[0].board_tasks_count if board_tasks else 0
+            )
+            board.kanban_next = None
+            if len(board_tasks) > limit:
+                url = replace_query_param(list_url, "board", board.pk)
+                board.kanban_next = paginator.get_cursor_link(
+                    url, board.kanban_tasks[-1], ordering
+                )
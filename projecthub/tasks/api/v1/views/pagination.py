@@ -1,13 +1,18 @@
-from rest_framework import pagination
+from projecthub.core.pagination import (
+    PageNumberOrKeysetPagination,
+    PageNumberPagination,
+)
 
 
-class TaskPagination(pagination.PageNumberPagination):
+class TaskPagination(PageNumberOrKeysetPagination):
     page_size = 30
     max_page_size = 200
     page_size_query_param = "page_size"
+    keyset_ordering = ("priority",)
+    keyset_ordering_fields = ("priority", "created_at", "name")
 
 
-class BoardPagination(pagination.PageNumberPagination):
+class BoardPagination(PageNumberPagination):
     page_size = 30
     max_page_size = 200
-    page_size_query_param = "page_size"
\ No newline at end of file
+    page_size_query_param = "page_size"
@@ -0,0 +1,41 @@
+from rest_framework import generics, permissions
+from rest_framework.response import Response
+
+from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.policies import (
+    IsAuthenticatedPolicy,
+    IsAdminUserPolicy,
+    IsTenantOwnerPolicy,
+    IsProjectStaffPolicy,
+)
+from projecthub.tasks.stats import get_project_stats
+from ..serializers import ProjectStatsSerializer
+
+
+class ProjectStatsAPIView(SecureGenericAPIView, generics.GenericAPIView):
+    """
+    API view for statistics of tasks of project: open, closed and overdue
+    tasks and tasks per board and per responsible.
+
+    Stats are read from counters maintained on task changes
+    (see `projecthub.tasks.stats`) with one query, regardless of number
+    of tasks.
+
+    Access:
+        - Only staff and members of current tenant
+
+    Permissions:
+        - GET: admin, tenant owner, owner and supervisor of project
+    """
+
+    policy_classes = [
+        IsAuthenticatedPolicy
+        & (IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectStaffPolicy)
+    ]
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ProjectStatsSerializer
+
+    def get(self, request, *args, **kwargs):
+        stats = get_project_stats(self.request.access.project.pk)
+        serializer = self.get_serializer(stats)
+        return Response(serializer.data)
@@ -1,8 +1,11 @@
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, filters, permissions
-from rest_framework.generics import get_object_or_404
 
 from projecthub.core.api.v1.views.base import SecureGenericAPIView
+from projecthub.core.api.v1.views.mixins import CachedListMixin, ProjectionListMixin
+from projecthub.core.cache import project_scope
+from projecthub.core.filters import RankedSearchFilter
 from projecthub.permissions import (
     ReadOnlyPermission,
     IsTenantOwnerPermission,
@@ -15,7 +18,7 @@ from projecthub.policies import (
     IsTenantOwnerPolicy,
     IsProjectMemberPolicy,
 )
-from projecthub.projects.models import Project
+from projecthub.projects.models import ProjectMembership
 from projecthub.tasks.models import Task
 from .pagination import TaskPagination
 from ..filters import TaskFilterSet
@@ -28,7 +31,12 @@ from ..serializers import (
 )
 
 
-class TaskListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
+class TaskListCreateAPIView(
+    SecureGenericAPIView,
+    CachedListMixin,
+    ProjectionListMixin,
+    generics.ListCreateAPIView,
+):
     policy_classes = [
         IsAuthenticatedPolicy
         & (IsAdminUserPolicy | IsTenantOwnerPolicy | IsProjectMemberPolicy)
@@ -45,11 +53,11 @@ class TaskListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
     pagination_class = TaskPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        RankedSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_class = TaskFilterSet
-    search_fields = ["name"]  # TODO: add search by description
+    search_fields = ["name", "description"]
     ordering_fields = [
         "name",
         "priority",
@@ -66,6 +74,7 @@ class TaskListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
             user=self.request.user,
             tenant=self.request.tenant,
             project_id=self.kwargs["project_id"],
+            access=self.request.access,
         )
         return qs
 
@@ -76,9 +85,23 @@ class TaskListCreateAPIView(SecureGenericAPIView, generics.ListCreateAPIView):
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context["project"] = get_object_or_404(Project, pk=self.kwargs["project_id"])
+        context["project"] = self.request.access.project
         return context
 
+    def get_response_cache_scope(self):
+        return project_scope(self.kwargs["project_id"])
+
+    def get_response_cache_role(self):
+        # same classes as `TaskQuerySet.visible_to`
+        user, access = self.request.user, self.request.access
+        if user.is_staff or access.is_tenant_owner:
+            return "all"
+        if user.id in {access.project.owner_id, access.project.supervisor_id}:
+            return "all"
+        if access.project_role == ProjectMembership.Role.USER:
+            return f"responsible:{user.pk}"
+        return "none"
+
     def perform_create(self, serializer):
         serializer.save(
             project_id=self.kwargs["project_id"],
@@ -112,7 +135,11 @@ class TaskRetrieveUpdateDestroyAPIView(
             user=self.request.user,
             tenant=self.request.tenant,
             project_id=self.kwargs["project_id"],
+            access=self.request.access,
         )
+        if self.request.method in {"PUT", "PATCH"}:
+            # task can't change between `If-Match` check and save
+            qs = qs.select_for_update(of=("self",))
         return qs
 
     def get_serializer_class(self):
@@ -128,5 +155,9 @@ class TaskRetrieveUpdateDestroyAPIView(
         context["request_user"] = self.request.user
         return context
 
+    def update(self, request, *args, **kwargs):
+        with transaction.atomic():
+            return super().update(request, *args, **kwargs)
+
     def perform_update(self, serializer):
         serializer.save(updated_by=self.request.user)
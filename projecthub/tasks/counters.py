@@ -0,0 +1,103 @@
+"""
+Denormalized counters of comments, replies and attachments of tasks.
+
+Counters are updated with F() expressions (see `update_task_counters()`)
+from signals of comments and attachments (see `projecthub.core.signals`),
+so task lists show them without counting related rows. Counters may drift
+when rows are changed past signals (raw SQL, `QuerySet.update()`, replies
+orphaned by cascades), which `reconcile_task_counters()` (and
+`reconcile_task_counters` command) repairs.
+"""
+
+from functools import reduce
+from operator import or_
+
+from django.db.models import F, Func, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from projecthub.core.cache import project_scope, response_cache
+from projecthub.tasks.models import Task
+
+
+def update_task_counters(task_id, **deltas):
+    """Add `deltas` (e.g. `comment_count=1`) to counters of task."""
+    updates = {
+        # never below zero, even if counter has drifted
+        name: Greatest(F(name) + delta, 0)
+        for name, delta in deltas.items()
+        if delta
+    }
+    if task_id is None or not updates:
+        return
+
+    tasks = Task.objects.filter(pk=task_id)
+    # counters are part of task representation,
+    # so its validators and cached responses are updated too
+    tasks.update(updated_at=timezone.now(), **updates)
+    project_id = tasks.values_list("project_id", flat=True).first()
+    if project_id is not None:
+        response_cache.invalidate(project_scope(project_id))
+
+
+def get_counter_expressions():
+    """Return expressions of actual values of counters of task keyed by name."""
+    from projecthub.attachments.models import Attachment
+    from projecthub.comments.models import Comment
+
+    comments = Comment.objects.filter(task=OuterRef("pk"))
+    attachments = Attachment.objects.filter(
+        Q(task=OuterRef("pk")) | Q(comment__task=OuterRef("pk"))
+    )
+    return {
+        "comment_count": _count(comments),
+        "reply_count": _count(comments.filter(parent__isnull=False)),
+        "attachment_count": _count(attachments),
+    }
+
+
+def reconcile_task_counters(queryset=None, chunk_size=1000, dry_run=False):
+    """
+    Recount counters of tasks (all by default) in chunks and return number
+    of tasks whose counters had drifted.
+    """
+    queryset = Task.objects.all() if queryset is None else queryset
+    queryset = queryset.order_by("pk")
+    actual = {f"actual_{name}": e for name, e in get_counter_expressions().items()}
+    drifted_filter = reduce(
+        or_, (~Q(**{name: F(f"actual_{name}")}) for name in Task.counter_fields)
+    )
+
+    repaired = 0
+    last_pk = None
+    while True:
+        chunk = queryset
+        if last_pk is not None:
+            chunk = chunk.filter(pk__gt=last_pk)
+        pks = list(chunk.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return repaired
+
+        drifted = list(
+            Task.objects.filter(pk__in=pks)
+            .annotate(**actual)
+            .filter(drifted_filter)
+            .values_list("pk", "project_id")
+        )
+        if drifted and not dry_run:
+            Task.objects.filter(pk__in=[pk for pk, _ in drifted]).update(
+                updated_at=timezone.now(), **get_counter_expressions()
+            )
+            response_cache.invalidate(
+                *{project_scope(project_id) for _, project_id in drifted}
+            )
+        repaired += len(drifted)
+        last_pk = pks[-1]
+
+
+def _count(queryset):
+    # COUNT without GROUP BY, so subquery always returns one row
+    counts = queryset.order_by().annotate(
+        count=Func(F("pk"), function="COUNT", output_field=IntegerField())
+    )
+    return Subquery(counts.values("count")[:1])
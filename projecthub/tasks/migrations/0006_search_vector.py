@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+from projecthub.core import operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0004_search_vector"),
+        ("tasks", "0005_remove_board_unique_border_type_for_project_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        operations.PostgresAddIndex(
+            model_name="task",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="task_search_vector_gin"
+            ),
+        ),
+        operations.PostgresRunSQL(
+            sql="""
+            CREATE FUNCTION tasks_task_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+                    setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER tasks_task_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF name, description ON tasks_task
+            FOR EACH ROW EXECUTE FUNCTION tasks_task_search_vector_update();
+
+            -- fill vectors of existing rows through the trigger
+            UPDATE tasks_task SET name = name;
+            """,
+            reverse_sql="""
+            DROP TRIGGER IF EXISTS tasks_task_search_vector_trigger ON tasks_task;
+            DROP FUNCTION IF EXISTS tasks_task_search_vector_update();
+            """,
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_membership_user_index"),
+        ("tasks", "0006_search_vector"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # new indexes are created before the ones they replace are dropped
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["project", "priority", "id"], name="task_project_priority_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["board", "priority", "id"], name="task_board_priority_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("close_date__isnull", True)),
+                fields=["responsible", "end_date", "id"],
+                name="task_open_responsible_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("close_date__isnull", True)),
+                fields=["project"],
+                name="task_open_project_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="board",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                help_text="Board of task.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="tasks",
+                to="tasks.board",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="Project to which task belongs.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="projects.project",
+            ),
+        ),
+    ]
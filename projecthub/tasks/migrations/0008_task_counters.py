@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:40
+
+from django.db import migrations, models
+
+
+def count(queryset):
+    counts = queryset.order_by().annotate(
+        count=models.Func(
+            models.F("pk"), function="COUNT", output_field=models.IntegerField()
+        )
+    )
+    return models.Subquery(counts.values("count")[:1])
+
+
+def set_task_counters(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    Comment = apps.get_model("comments", "Comment")
+    Attachment = apps.get_model("attachments", "Attachment")
+
+    comments = Comment.objects.filter(task=models.OuterRef("pk"))
+    attachments = Attachment.objects.filter(
+        models.Q(task=models.OuterRef("pk"))
+        | models.Q(comment__task=models.OuterRef("pk"))
+    )
+    Task.objects.update(
+        comment_count=count(comments),
+        reply_count=count(comments.filter(parent__isnull=False)),
+        attachment_count=count(attachments),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_hot_query_indexes"),
+        ("comments", "0004_comment_threads"),
+        ("attachments", "0003_remove_taskattachment_task_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="attachment_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of files attached to task and its comments.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of comments of task (including replies).",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="reply_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, help_text="Number of replies to comments."
+            ),
+        ),
+        migrations.RunPython(set_task_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:45
+
+import datetime
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def get_key(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def create_project_stats(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    ProjectStatsCounter = apps.get_model("tasks", "ProjectStatsCounter")
+
+    tasks = Task.objects.order_by()
+    open_tasks = tasks.filter(close_date__isnull=True)
+    closed_tasks = tasks.filter(close_date__isnull=False)
+    groups = [
+        ("status", open_tasks.annotate(value=models.Value("open"))),
+        ("status", closed_tasks.annotate(value=models.Value("closed"))),
+        ("board", tasks.annotate(value=models.F("board_id"))),
+        ("responsible", tasks.annotate(value=models.F("responsible_id"))),
+        (
+            "end_date",
+            open_tasks.filter(end_date__isnull=False).annotate(
+                value=TruncDate("end_date")
+            ),
+        ),
+    ]
+
+    counters = []
+    for dimension, queryset in groups:
+        counts = queryset.values_list("project_id", "value").annotate(
+            count=models.Count("pk")
+        )
+        for project_id, value, count in counts:
+            counters.append(
+                ProjectStatsCounter(
+                    project_id=project_id,
+                    dimension=dimension,
+                    key=get_key(value),
+                    count=count,
+                )
+            )
+    ProjectStatsCounter.objects.bulk_create(counters, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_membership_user_index"),
+        ("tasks", "0008_task_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectStatsCounter",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("status", "Status"),
+                            ("board", "Board"),
+                            ("responsible", "Responsible"),
+                            ("end_date", "End date"),
+                        ],
+                        help_text="Counted dimension.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        blank=True,
+                        help_text="Value of dimension (empty if tasks have none).",
+                        max_length=64,
+                    ),
+                ),
+                ("count", models.IntegerField(default=0, help_text="Number of tasks.")),
+                (
+                    "project",
+                    models.ForeignKey(
+                        db_index=False,
+                        help_text="Project of counted tasks.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stats_counters",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "dimension", "key"),
+                        name="unique_project_stats_counter",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_project_stats, migrations.RunPython.noop),
+    ]
@@ -1,2 +1,3 @@
 from .board import Board
 from .task import Task
+from .stats import ProjectStatsCounter
@@ -0,0 +1,47 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from projecthub.core.models import UUIDModel
+from projecthub.projects.models import Project
+
+
+class ProjectStatsCounter(UUIDModel):
+    """
+    Number of tasks of project with given value (`key`) of `dimension`,
+    maintained incrementally, see `projecthub.tasks.stats`.
+    """
+
+    class Dimension(models.TextChoices):
+        STATUS = "status", _("Status")
+        BOARD = "board", _("Board")
+        RESPONSIBLE = "responsible", _("Responsible")
+        # open tasks only, keyed by day, so overdue tasks are counted on read
+        END_DATE = "end_date", _("End date")
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="stats_counters",
+        db_index=False,  # covered by `unique_project_stats_counter`
+        help_text=_("Project of counted tasks."),
+    )
+    dimension = models.CharField(
+        max_length=20, choices=Dimension.choices, help_text=_("Counted dimension.")
+    )
+    key = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text=_("Value of dimension (empty if tasks have none)."),
+    )
+    count = models.IntegerField(default=0, help_text=_("Number of tasks."))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "dimension", "key"],
+                name="unique_project_stats_counter",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}={self.key}: {self.count} in {self.project_id}"
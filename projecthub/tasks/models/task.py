@@ -1,12 +1,14 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework.generics import get_object_or_404
 
-from projecthub.core.models import UUIDModel, TimestampedModel
+from projecthub.core.models import UUIDModel, TimestampedModel, TrackedModel
 from projecthub.projects.models import ProjectMembership, Project
 
 
@@ -21,33 +23,47 @@ class TaskQuerySet(models.QuerySet):
     def for_responsible(self, user):
         return self.filter(responsible=user)
 
-    def visible_to(self, user, tenant, project_id):
+    def visible_to(self, user, tenant, project_id, access=None):
+        """
+        Pass `access` (request access context) to reuse project
+        and membership it has already loaded.
+        """
         if user.is_staff:
             return self
 
         if user.id == tenant.owner_id:
             return self
 
-        project = get_object_or_404(Project, pk=project_id)
+        if access is not None:
+            project = access.get_project(project_id)
+        else:
+            project = get_object_or_404(Project, pk=project_id)
+
         if user.id in {project.owner_id, project.supervisor_id}:
             return self
 
-        project_membership = ProjectMembership.objects.filter(
-            project=project, user=user, role=ProjectMembership.Role.USER
-        ).first()
+        if access is not None:
+            is_project_user = (
+                access.get_project_role(project) == ProjectMembership.Role.USER
+            )
+        else:
+            is_project_user = ProjectMembership.objects.filter(
+                project=project, user=user, role=ProjectMembership.Role.USER
+            ).exists()
 
-        if project_membership:
+        if is_project_user:
             return self.for_responsible(user)
 
         return self.none()
 
 
-class Task(UUIDModel, TimestampedModel):
+class Task(UUIDModel, TimestampedModel, TrackedModel):
     name = models.CharField(max_length=255, help_text=_("Name of task."))
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
         related_name="tasks",
+        db_index=False,  # covered by `task_project_priority_idx`
         help_text=_("Project to which task belongs."),
     )
     board = models.ForeignKey(
@@ -56,6 +72,7 @@ class Task(UUIDModel, TimestampedModel):
         null=True,
         blank=True,
         related_name="tasks",
+        db_index=False,  # covered by `task_board_priority_idx`
         help_text=_("Board of task."),
     )
     priority = models.IntegerField(
@@ -101,23 +118,32 @@ class Task(UUIDModel, TimestampedModel):
         help_text=_("User who made the last change."),
     )
 
-    # TODO:
-    # add search vector: `search_vector = SearchVectorField(null=True)`
-    # create index for it `GinIndex(fields=["search_vector"]`
-    # override save method: `self.search_vector = SearchVector("body")
-    # in views:
-    # def get_queryset(self):
-    #   queryset = super().get_queryset()
-    #   query = self.request.query_params.get('search')
-    #   if query:
-    #       search_query = SearchQuery(query)
-    #       queryset = queryset.annotate(
-    #           rank=SearchRank(F('search_vector'), search_query)
-    #       ).filter(search_vector=search_query).order_by('-rank')
-    #   return queryset
+    # maintained with F() expressions when comments and attachments are
+    # created and deleted, see `projecthub.tasks.counters`
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=_("Number of comments of task (including replies)."),
+    )
+    reply_count = models.PositiveIntegerField(
+        default=0, editable=False, help_text=_("Number of replies to comments.")
+    )
+    attachment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text=_("Number of files attached to task and its comments."),
+    )
+
+    # maintained by database trigger (PostgreSQL only), see `projecthub.core.search`
+    search_vector = SearchVectorField(null=True, editable=False)
+    search_vector_fields = (("name", "A"), ("description", "B"))
 
     objects = TaskQuerySet.as_manager()
 
+    # responsible for assignment notifications, all for project stats
+    tracked_fields = ("responsible", "board", "close_date", "end_date")
+    counter_fields = ("comment_count", "reply_count", "attachment_count")
+
     class Meta:
         ordering = ["priority"]
         constraints = [
@@ -130,6 +156,28 @@ class Task(UUIDModel, TimestampedModel):
                 name="task_start_date_before_or_equal_to_end_date",
             )
         ]
+        indexes = [
+            # created on PostgreSQL only
+            GinIndex(fields=["search_vector"], name="task_search_vector_gin"),
+            # task lists and Kanban, in default ordering
+            models.Index(
+                fields=["project", "priority", "id"], name="task_project_priority_idx"
+            ),
+            models.Index(
+                fields=["board", "priority", "id"], name="task_board_priority_idx"
+            ),
+            # open tasks: daily reminders and archiving of ended projects
+            models.Index(
+                fields=["responsible", "end_date", "id"],
+                condition=models.Q(close_date__isnull=True),
+                name="task_open_responsible_idx",
+            ),
+            models.Index(
+                fields=["project"],
+                condition=models.Q(close_date__isnull=True),
+                name="task_open_project_idx",
+            ),
+        ]
 
     def __str__(self):
         board_name = getattr(self.board, "name", "No board")
@@ -162,15 +210,39 @@ class Task(UUIDModel, TimestampedModel):
         self.save(update_fields=["board", "responsible", "updated_at"])
 
     def assign_responsible(self, new_responsible):
-        from projecthub.tasks.tasks import send_task_assignment_email
-
-        old_instance = Task.objects.get(pk=self.pk)
-        old_responsible_id = old_instance.responsible_id
-
         self.responsible = new_responsible
         self.save(update_fields=["responsible"])
 
-        if new_responsible and old_responsible_id != new_responsible.id:
-            send_task_assignment_email.delay(
-                task_id=self.pk, user_id=new_responsible.id
-            )
+    def save(self, *args, **kwargs):
+        """
+        Notify new responsible (through notification outbox) in the same
+        transaction when responsible changed.
+
+        Counters are never written from instance, which may have been
+        loaded before they were last updated, and neither are fields
+        deferred when it was loaded.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None and not self._state.adding:
+            deferred = self.get_deferred_fields()
+            update_fields = kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.counter_fields
+                and field.attname not in deferred
+            ]
+        # checked first, so deferred responsible isn't loaded
+        assigned = (
+            (update_fields is None or "responsible" in update_fields)
+            and self.responsible_id is not None
+            and self.has_changed("responsible")
+        )
+        if not assigned:
+            return super().save(*args, **kwargs)
+
+        from projecthub.tasks.notifications import get_assignment_notification
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            get_assignment_notification(self).save()
@@ -0,0 +1,110 @@
+"""Emails of task notifications, see `projecthub.notifications`."""
+
+from datetime import datetime
+
+from django.conf import settings
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.utils.timezone import localtime
+
+from projecthub.notifications.builders import register_builder
+from projecthub.notifications.models import Notification
+from projecthub.tasks.models import Task
+
+
+def get_assignment_notification(task):
+    """Return unsaved notification of responsible about assignment of task."""
+    return Notification(
+        recipient_id=task.responsible_id,
+        kind=Notification.Kind.TASK_ASSIGNED,
+        payload={"task_id": str(task.pk)},
+    )
+
+
+def get_reminder_notification(user_id, tasks):
+    """
+    Return unsaved reminder of user about open tasks,
+    `(name, end_date, project_name)` rows.
+    """
+    rows = [
+        [name, end_date.isoformat() if end_date else None, project_name]
+        for name, end_date, project_name in tasks
+    ]
+    return Notification(
+        recipient_id=user_id,
+        kind=Notification.Kind.TASK_REMINDER,
+        payload={"tasks": rows},
+    )
+
+
+def build_task_assignment_email(task, user):
+    plain_message = (
+        f"Вам призначено завдання {task.name} у проєкті {task.project.name}."
+    )
+    message = EmailMultiAlternatives(
+        subject=f"Вам призначено завдання: {task.name}",
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+    message.attach_alternative(plain_message, "text/html")
+    return message
+
+
+def build_task_assignment_digest_email(tasks, user):
+    if len(tasks) == 1:
+        return build_task_assignment_email(tasks[0], user)
+
+    lines = [f"- {task.name} у проєкті {task.project.name}" for task in tasks]
+    plain_message = "Вам призначено завдання:\n\n" + "\n".join(lines)
+    return EmailMultiAlternatives(
+        subject=f"Вам призначено завдань: {len(tasks)}",
+        body=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+@register_builder(Notification.Kind.TASK_ASSIGNED)
+def build_assignment_message(user, notifications):
+    """
+    One email about all tasks assigned to user since previous dispatch.
+    Tasks assigned several times are listed once, tasks already reassigned
+    to someone else are left out.
+    """
+    task_ids = {n.payload["task_id"] for n in notifications}
+    tasks = list(
+        Task.objects.filter(pk__in=task_ids, responsible=user)
+        .select_related("project")
+        .order_by("created_at")
+    )
+    if not tasks:
+        return None
+    return build_task_assignment_digest_email(tasks, user)
+
+
+@register_builder(Notification.Kind.TASK_REMINDER)
+def build_reminder_message(user, notifications):
+    """One email with open tasks of all (e.g. per-tenant) reminders of user."""
+    rows = dict.fromkeys(
+        tuple(row) for n in notifications for row in n.payload["tasks"]
+    )
+    return build_task_reminder_email(user.email, list(rows))
+
+
+def build_task_reminder_email(email, tasks):
+    lines = []
+    for name, end_date, project_name in tasks:
+        deadline = "none"
+        if end_date:
+            deadline = localtime(datetime.fromisoformat(end_date)).strftime(
+                "%Y-%m-%d %H:%M"
+            )
+        lines.append(f"- [Project: {project_name}] {name} (deadline: {deadline})")
+
+    message = "\n".join(lines)
+    return EmailMessage(
+        subject="Your Tasks for Today",
+        body=f"You have the following open tasks: \n\n{message}",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[email],
+    )
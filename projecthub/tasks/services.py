@@ -1,4 +1,21 @@
+from collections import Counter
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from projecthub.core.cache import project_scope, response_cache
+from projecthub.notifications.services import enqueue_notifications
 from projecthub.tasks.models.board import Board
+from projecthub.tasks.models.task import Task
+from projecthub.tasks.notifications import get_assignment_notification
+from projecthub.tasks.stats import (
+    count_tasks,
+    get_task_stats_delta,
+    refresh_project_stats,
+    update_project_stats,
+)
 
 
 def create_default_boards(project):
@@ -10,3 +27,90 @@ def create_default_boards(project):
     ]
     boards = [Board(project=project, **board_data) for board_data in default_boards]
     Board.objects.bulk_create(boards)
+    response_cache.invalidate(project_scope(project.pk))
+
+
+def get_project_boards(project):
+    """Return boards of project keyed by id."""
+    return {board.pk: board for board in Board.objects.for_project(project)}
+
+
+def get_project_members(project):
+    """
+    Return users that can be responsible for tasks of project
+    (owner, supervisor and members) keyed by id.
+    """
+    users = get_user_model().objects.filter(
+        Q(pk__in=[project.owner_id, project.supervisor_id])
+        | Q(projects__project=project)
+    )
+    return {user.pk: user for user in users.distinct()}
+
+
+def bulk_create_tasks(project, items, user):
+    """
+    Create tasks from list of validated data in one query
+    and notify their responsibles.
+    """
+    now = timezone.now()
+    tasks = [
+        Task(
+            project=project,
+            created_by=user,
+            updated_by=user,
+            created_at=now,
+            updated_at=now,
+            **data,
+        )
+        for data in items
+    ]
+
+    with transaction.atomic():
+        Task.objects.bulk_create(tasks)
+        update_project_stats(project.pk, count_tasks(tasks))
+        enqueue_notifications(
+            [get_assignment_notification(task) for task in tasks if task.responsible]
+        )
+        response_cache.invalidate(project_scope(project.pk))
+    return tasks
+
+
+def bulk_update_tasks(changes, user):
+    """
+    Apply list of `(task, validated_data)` changes with one query
+    and notify newly assigned responsibles.
+    """
+    now = timezone.now()
+    fields = {"updated_by", "updated_at"}
+    assigned = []
+
+    for task, data in changes:
+        for field, value in data.items():
+            setattr(task, field, value)
+        task.updated_by = user
+        task.updated_at = now
+        fields.update(data)
+
+        if task.responsible_id is not None and task.has_changed("responsible"):
+            assigned.append(task)
+
+    tasks = [task for task, _ in changes]
+    # deltas of project stats by project (None if they must be recounted)
+    stats_deltas = {}
+    for task in tasks:
+        deltas = get_task_stats_delta(task, fields)
+        if deltas is None:
+            stats_deltas[task.project_id] = None
+        elif stats_deltas.setdefault(task.project_id, Counter()) is not None:
+            stats_deltas[task.project_id].update(deltas)
+
+    with transaction.atomic():
+        Task.objects.bulk_update(tasks, sorted(fields))
+        for project_id, deltas in stats_deltas.items():
+            if deltas is None:
+                refresh_project_stats(project_id)
+            else:
+                update_project_stats(project_id, deltas)
+        enqueue_notifications([get_assignment_notification(task) for task in assigned])
+        response_cache.invalidate(*{project_scope(task.project_id) for task in tasks})
+    return tasks
@@ -0,0 +1,269 @@
+"""
+Incrementally maintained statistics of tasks of projects.
+
+Every task is counted in a few `ProjectStatsCounter` rows of its project:
+its status (open or closed), its board, its responsible and, while open,
+the day of its end date. Task saves and deletes (see
+`projecthub.core.signals`) and bulk services add the difference between
+rows task was and is counted in with F() expressions, so stats are read
+with one query regardless of number of tasks.
+
+Changes made past those paths (`QuerySet.update()`, boards and users
+deleted with SET_NULL, ...) are repaired by `refresh_project_stats()`,
+which `reconcile_project_stats` task runs periodically for all projects.
+"""
+
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from projecthub.projects.models import Project
+from projecthub.tasks.models import ProjectStatsCounter, Task
+
+Dimension = ProjectStatsCounter.Dimension
+
+OPEN = "open"
+CLOSED = "closed"
+
+STATS_FIELDS = ("close_date", "board", "responsible", "end_date")
+
+
+def get_stats_keys(close_date, board_id, responsible_id, end_date):
+    """Return `(dimension, key)` of counters task with given values is in."""
+    keys = [
+        (Dimension.STATUS, CLOSED if close_date else OPEN),
+        (Dimension.BOARD, _key(board_id)),
+        (Dimension.RESPONSIBLE, _key(responsible_id)),
+    ]
+    if close_date is None and end_date is not None:
+        keys.append((Dimension.END_DATE, timezone.localdate(end_date).isoformat()))
+    return keys
+
+
+def count_tasks(tasks, sign=1):
+    """Return deltas of counters for adding (or removing, `sign=-1`) tasks."""
+    deltas = Counter()
+    for task in tasks:
+        for key in get_stats_keys(
+            task.close_date, task.board_id, task.responsible_id, task.end_date
+        ):
+            deltas[key] += sign
+    return deltas
+
+
+def get_task_stats_delta(task, update_fields=None):
+    """
+    Return deltas of counters for saving changes of stats fields of loaded
+    task (in `update_fields` only, if given), or None if values task was
+    loaded with are unknown (e.g. deferred).
+    """
+    if update_fields is not None and not any(
+        {name, task._meta.get_field(name).attname} & set(update_fields)
+        for name in STATS_FIELDS
+    ):
+        # nothing counted changes, even if fields are deferred
+        return Counter()
+
+    original = {}
+    for name in STATS_FIELDS:
+        attname = task._meta.get_field(name).attname
+        if update_fields is not None and not {name, attname} & set(update_fields):
+            original[name] = getattr(task, attname)
+        elif task.has_original_value(name):
+            original[name] = task.get_original_value(name)
+        else:
+            return None
+
+    deltas = Counter()
+    for key in get_stats_keys(
+        original["close_date"],
+        original["board"],
+        original["responsible"],
+        original["end_date"],
+    ):
+        deltas[key] -= 1
+    for key in get_stats_keys(
+        task.close_date, task.board_id, task.responsible_id, task.end_date
+    ):
+        deltas[key] += 1
+    return deltas
+
+
+def update_project_stats(project_id, deltas):
+    """Add `deltas` (`(dimension, key)` -> number of tasks) to counters."""
+    # in the same order in all transactions, so they can't deadlock
+    deltas = sorted((key, delta) for key, delta in deltas.items() if delta)
+    missing = [key for key, delta in deltas if not _add(project_id, key, delta)]
+    if not missing:
+        return
+
+    # created empty first (unless concurrent transaction creates them
+    # meanwhile), so they are incremented as the others
+    ProjectStatsCounter.objects.bulk_create(
+        [
+            ProjectStatsCounter(project_id=project_id, dimension=dimension, key=key)
+            for dimension, key in missing
+        ],
+        ignore_conflicts=True,
+    )
+    for key, delta in deltas:
+        if key in missing:
+            _add(project_id, key, delta)
+
+
+def count_project_tasks(project_id):
+    """Return actual counters of project computed from its tasks."""
+    tasks = Task.objects.filter(project_id=project_id).order_by()
+    expected = Counter()
+
+    statuses = tasks.aggregate(
+        open=Count("pk", filter=Q(close_date__isnull=True)),
+        closed=Count("pk", filter=Q(close_date__isnull=False)),
+    )
+    expected[Dimension.STATUS, OPEN] = statuses["open"]
+    expected[Dimension.STATUS, CLOSED] = statuses["closed"]
+
+    for dimension, field in [
+        (Dimension.BOARD, "board_id"),
+        (Dimension.RESPONSIBLE, "responsible_id"),
+    ]:
+        for value, count in tasks.values_list(field).annotate(count=Count("pk")):
+            expected[dimension, _key(value)] = count
+
+    end_days = (
+        tasks.filter(close_date__isnull=True, end_date__isnull=False)
+        .annotate(day=TruncDate("end_date"))
+        .values_list("day")
+        .annotate(count=Count("pk"))
+    )
+    for day, count in end_days:
+        expected[Dimension.END_DATE, day.isoformat()] = count
+
+    return +expected
+
+
+def refresh_project_stats(project_id):
+    """
+    Recompute counters of project from its tasks and return whether they
+    had drifted.
+    """
+    with transaction.atomic():
+        # locked first, so increments of concurrent transactions either are
+        # committed before tasks are counted or wait until they are written
+        current = {
+            (counter.dimension, counter.key): counter
+            for counter in ProjectStatsCounter.objects.filter(
+                project_id=project_id
+            ).select_for_update()
+        }
+        expected = count_project_tasks(project_id)
+
+        changed = [
+            counter
+            for key, counter in current.items()
+            if key in expected and counter.count != expected[key]
+        ]
+        for counter in changed:
+            counter.count = expected[counter.dimension, counter.key]
+        ProjectStatsCounter.objects.bulk_update(changed, ["count"])
+
+        created = [
+            ProjectStatsCounter(
+                project_id=project_id, dimension=dimension, key=key, count=count
+            )
+            for (dimension, key), count in expected.items()
+            if (dimension, key) not in current
+        ]
+        ProjectStatsCounter.objects.bulk_create(created)
+
+        removed = [c for key, c in current.items() if key not in expected]
+        ProjectStatsCounter.objects.filter(pk__in=[c.pk for c in removed]).delete()
+
+    return bool(changed or created or any(c.count for c in removed))
+
+
+class ProjectStats:
+    """Statistics of tasks of project read from its counters."""
+
+    def __init__(self, counters, today=None):
+        # (dimension, key) -> number of tasks
+        self.counters = counters
+        self.today = today or timezone.localdate()
+
+    def get_counts(self, dimension):
+        """Return `[(key or None, count)]` of dimension, largest first."""
+        counts = [
+            (key or None, count)
+            for (counter_dimension, key), count in self.counters.items()
+            if counter_dimension == dimension and count
+        ]
+        return sorted(counts, key=lambda item: (-item[1], item[0] or ""))
+
+    @property
+    def open_tasks(self):
+        return self.counters.get((Dimension.STATUS, OPEN), 0)
+
+    @property
+    def closed_tasks(self):
+        return self.counters.get((Dimension.STATUS, CLOSED), 0)
+
+    @property
+    def overdue_tasks(self):
+        """Open tasks which ended before today."""
+        today = self.today.isoformat()
+        return sum(
+            count
+            for (dimension, key), count in self.counters.items()
+            if dimension == Dimension.END_DATE and key < today
+        )
+
+    @property
+    def tasks_per_board(self):
+        return [
+            {"board": key, "count": count}
+            for key, count in self.get_counts(Dimension.BOARD)
+        ]
+
+    @property
+    def tasks_per_responsible(self):
+        return [
+            {"responsible": key, "count": count}
+            for key, count in self.get_counts(Dimension.RESPONSIBLE)
+        ]
+
+
+def get_project_stats(project_id):
+    counters = ProjectStatsCounter.objects.filter(project_id=project_id)
+    return ProjectStats(
+        {
+            (dimension, key): count
+            for dimension, key, count in counters.values_list(
+                "dimension", "key", "count"
+            )
+        }
+    )
+
+
+def reconcile_project_stats(queryset=None):
+    """
+    Refresh stats of projects (all by default) one by one and return
+    number of projects whose stats had drifted.
+    """
+    queryset = Project.objects.all() if queryset is None else queryset
+    project_ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+    return sum(refresh_project_stats(project_id) for project_id in project_ids)
+
+
+def _add(project_id, key, delta):
+    dimension, key = key
+    counters = ProjectStatsCounter.objects.filter(
+        project_id=project_id, dimension=dimension, key=key
+    )
+    return counters.update(count=F("count") + delta)
+
+
+def _key(value):
+    return "" if value is None else str(value)
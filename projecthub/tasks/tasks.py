@@ -1,61 +1,119 @@
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
 from celery import shared_task
 from django.conf import settings
-from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.utils.timezone import localtime
+from django.utils import timezone
 
+from projecthub.core.models import Tenant
+from projecthub.notifications.models import Notification
+from projecthub.notifications.services import (
+    enqueue_notification,
+    enqueue_notifications,
+)
+from projecthub.tasks import stats
 from projecthub.tasks.models import Task
+from projecthub.tasks.notifications import (
+    get_assignment_notification,
+    get_reminder_notification,
+)
 
-User = get_user_model()
 
+def iter_task_reminders(queryset):
+    """
+    Stream open tasks of `queryset` and yield `(user_id, tasks)` for every
+    responsible, where tasks are `(name, end_date, project_name)` rows.
 
-@shared_task
-def send_task_assignment_email(task_id, user_id):
-    task = Task.objects.get(pk=task_id)
-    user = User.objects.get(pk=user_id)
-    plain_message = (
-        f"Вам призначено завдання {task.name} у проєкті {task.project.name}."
+    Rows are read with server-side cursor in chunks of
+    `TASK_REMINDERS_CHUNK_SIZE` and ordered by responsible, so tasks of
+    one user are consecutive and only one user's tasks are held in memory.
+    """
+    rows = (
+        queryset.filter(close_date__isnull=True, responsible__isnull=False)
+        .exclude(responsible__email="")
+        .order_by("responsible_id", "end_date", "pk")
+        .values_list("responsible_id", "name", "end_date", "project__name")
+        .iterator(chunk_size=settings.TASK_REMINDERS_CHUNK_SIZE)
     )
+    for user_id, group in groupby(rows, key=itemgetter(0)):
+        yield user_id, [row[1:] for row in group]
 
-    send_mail(
-        subject=f"Вам призначено завдання: {task.name}",
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
-        html_message=plain_message,
-        fail_silently=False,
-    )
 
-    return f"Email sent to {user.email} for task {task.name}"
+@shared_task
+def send_daily_task_reminders(tenant_id=None):
+    """
+    Queue reminder for every user listing their open tasks (of tenant, if
+    `tenant_id` is given) to notification outbox, `TASK_REMINDERS_BATCH_SIZE`
+    notifications per query. Emails are sent by `dispatch_notifications`.
+    """
+    queryset = Task.objects.all()
+    if tenant_id is not None:
+        queryset = queryset.filter(project__tenant_id=tenant_id)
+
+    queued = 0
+    batch = []
+    for user_id, tasks in iter_task_reminders(queryset):
+        batch.append(get_reminder_notification(user_id, tasks))
+        if len(batch) >= settings.TASK_REMINDERS_BATCH_SIZE:
+            queued += len(enqueue_notifications(batch))
+            batch = []
+    if batch:
+        queued += len(enqueue_notifications(batch))
+
+    return f"{queued} reminders queued"
+
+
+@shared_task
+def dispatch_daily_task_reminders():
+    """
+    Queue `send_daily_task_reminders` for every tenant, so reminders of
+    tenants are built in parallel by workers. Reminders of users working
+    in several tenants are merged into one email by the dispatcher.
+    """
+    tenant_ids = list(Tenant.objects.values_list("pk", flat=True))
+    for tenant_id in tenant_ids:
+        send_daily_task_reminders.delay(str(tenant_id))
+
+    return f"Reminders queued for {len(tenant_ids)} tenants"
+
+
+@shared_task
+def reconcile_project_stats():
+    """
+    Recount stats of all projects, repairing counters drifted by changes
+    made past incremental updates (see `projecthub.tasks.stats`).
+    """
+    drifted = stats.reconcile_project_stats()
+    return f"Stats of {drifted} projects repaired"
+
+
+# TODO: remove with the next release, assignment emails go through the
+# notification outbox now; these only drain messages queued before deploy
 
 
 @shared_task
-def send_daily_task_reminders():
-    tasks = (
-        Task.objects.filter(close_date__isnull=True)
-        .select_related("responsible", "project", "board")
-        .order_by("end_date")
+def send_task_assignment_email(task_id, user_id):
+    """Deprecated: queue assignment notification to outbox instead."""
+    enqueue_notification(
+        user_id, Notification.Kind.TASK_ASSIGNED, {"task_id": str(task_id)}
     )
+    return f"Assignment of task {task_id} queued"
+
 
-    user_to_tasks = {}
-    for task in tasks:
-        user = task.responsible
-        if user and user.email:
-            user_to_tasks.setdefault(user, []).append(task)
-
-    for user, user_tasks in user_to_tasks.items():
-        lines = []
-        for task in user_tasks:
-            lines.append(
-                f"- [Project: {task.project.name}] {task.name} (deadline: {localtime(task.end_date).strftime('%Y-%m-%d %H:%M')})"
-            )
-
-        message = "\n".join(lines)
-        subject = "Your Tasks for Today"
-
-        send_mail(
-            subject=subject,
-            message=f"You have the following open tasks: \n\n{message}",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-        )
+@shared_task
+def send_task_assignment_digest(user_id):
+    """
+    Deprecated: queue assignment notifications of open tasks of user changed
+    within the last hour (digests were sent a minute after assignment) to
+    outbox instead.
+    """
+    tasks = Task.objects.filter(
+        responsible_id=user_id,
+        close_date__isnull=True,
+        updated_at__gte=timezone.now() - timedelta(hours=1),
+    ).only("pk", "responsible_id")
+    queued = enqueue_notifications(
+        [get_assignment_notification(task) for task in tasks]
+    )
+    return f"{len(queued)} assignments queued"
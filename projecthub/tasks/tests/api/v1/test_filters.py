@@ -26,3 +26,27 @@ class TestTaskFilterSet:
 
         assert filtered.count() == 1
         assert filtered.first().pk == john_task.pk
+
+    def test_by_responsible_id(self, task_factory, john, alice):
+        john_task = task_factory(responsible=john)
+        alice_task = task_factory(responsible=alice)
+
+        queryset = Task.objects.all()
+        filtered = TaskFilterSet({"responsible_id": john.pk}, queryset=queryset).qs
+
+        assert list(filtered) == [john_task]
+
+    def test_by_creator_id(self, task_factory, john, alice):
+        john_task = task_factory(created_by=john)
+        alice_task = task_factory(created_by=alice)
+
+        queryset = Task.objects.all()
+        filtered = TaskFilterSet({"creator_id": john.pk}, queryset=queryset).qs
+
+        assert list(filtered) == [john_task]
+
+    def test_username_filter_does_not_join_users(self):
+        queryset = Task.objects.all()
+        filtered = TaskFilterSet({"responsible": "jo"}, queryset=queryset).qs
+
+        assert "JOIN" not in str(filtered.query)
@@ -246,6 +246,22 @@ class TestBoardListCreateAPIView:
         expected_ids = [str(z_board.pk), str(a_board.pk)]
         assert [s["id"] for s in response.data["results"]] == expected_ids
 
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self,
+            api_client,
+            list_url,
+            http_host,
+            active_project,
+            django_assert_num_queries,
+        ):
+            api_client.force_authenticate(user=active_project.owner)
+
+            with django_assert_num_queries(3):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
 
 @pytest.mark.django_db
 class TestBoardRetrieveUpdateDestroyAPIView:
@@ -467,3 +483,19 @@ class TestBoardRetrieveUpdateDestroyAPIView:
                 content_type="application/json",
             )
             assert response.status_code == expected_status_code
+
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self,
+            api_client,
+            detail_url,
+            http_host,
+            active_project,
+            django_assert_num_queries,
+        ):
+            api_client.force_authenticate(user=active_project.owner)
+
+            with django_assert_num_queries(3):
+                response = api_client.get(detail_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
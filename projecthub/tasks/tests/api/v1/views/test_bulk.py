@@ -0,0 +1,373 @@
+import pytest
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from projecthub.notifications.models import Notification
+from projecthub.projects.models import ProjectMembership
+from projecthub.tasks.models import Task
+
+
+@pytest.fixture
+def bulk_url(active_project):
+    return reverse("api:v1:task_bulk", kwargs={"project_id": active_project.pk})
+
+
+@pytest.fixture
+def move_url(active_project):
+    return reverse("api:v1:task_bulk_move", kwargs={"project_id": active_project.pk})
+
+
+@pytest.fixture
+def board(active_project, board_factory):
+    return board_factory(project=active_project, name="To Do", order=1)
+
+
+@pytest.fixture
+def project_user(active_project, project_membership_factory):
+    return project_membership_factory(
+        project=active_project, role=ProjectMembership.Role.USER
+    ).user
+
+
+@pytest.fixture
+def admin_api_client(api_client, admin_user):
+    api_client.force_authenticate(user=admin_user)
+    return api_client
+
+
+@pytest.mark.django_db
+class TestTaskBulkAPIView:
+
+    class TestPermissions:
+
+        def test_anonymous(self, api_client, bulk_url, http_host):
+            response = api_client.post(bulk_url, [], format="json", HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        def test_project_user(self, api_client, bulk_url, http_host, project_user):
+            api_client.force_authenticate(user=project_user)
+
+            response = api_client.post(
+                bulk_url, [{"name": "task"}], format="json", HTTP_HOST=http_host
+            )
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        def test_project_owner(self, api_client, bulk_url, http_host, active_project):
+            api_client.force_authenticate(user=active_project.owner)
+
+            response = api_client.post(
+                bulk_url, [{"name": "task"}], format="json", HTTP_HOST=http_host
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+    class TestCreate:
+
+        def test_creates_tasks(
+            self,
+            api_client,
+            bulk_url,
+            http_host,
+            active_project,
+            board,
+            project_user,
+        ):
+            api_client.force_authenticate(user=active_project.owner)
+            data = [
+                {"name": "first", "board": str(board.pk)},
+                {"name": "second", "responsible": str(project_user.pk)},
+            ]
+
+            response = api_client.post(
+                bulk_url, data, format="json", HTTP_HOST=http_host
+            )
+
+            assert response.status_code == status.HTTP_201_CREATED
+            assert [t["name"] for t in response.data] == ["first", "second"]
+            assert response.data[0]["board"] == "To Do"
+
+            tasks = Task.objects.filter(project=active_project)
+            assert tasks.count() == 2
+            second = tasks.get(name="second")
+            assert second.created_by == active_project.owner
+            assert second.responsible == project_user
+            notification = Notification.objects.get()
+            assert notification.recipient == project_user
+            assert notification.payload == {"task_id": str(second.pk)}
+
+        def test_per_item_errors(
+            self, admin_api_client, bulk_url, http_host, active_project, user_factory
+        ):
+            stranger = user_factory()
+            data = [
+                {"name": "valid"},
+                {"priority": 5},
+                {"name": "task", "responsible": str(stranger.pk)},
+            ]
+
+            response = admin_api_client.post(
+                bulk_url, data, format="json", HTTP_HOST=http_host
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.data[0] == {}
+            assert "name" in response.data[1]
+            assert response.data[2]["responsible"] == [
+                "Responsible must be member of project."
+            ]
+            assert not Task.objects.filter(project=active_project).exists()
+
+        def test_board_of_other_project(
+            self, admin_api_client, bulk_url, http_host, board_factory
+        ):
+            other_board = board_factory()
+
+            response = admin_api_client.post(
+                bulk_url,
+                [{"name": "task", "board": str(other_board.pk)}],
+                format="json",
+                HTTP_HOST=http_host,
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "board" in response.data[0]
+
+        @pytest.mark.parametrize("data", [{}, [], [1, 2]])
+        def test_invalid_payload(self, admin_api_client, bulk_url, http_host, data):
+            response = admin_api_client.post(
+                bulk_url, data, format="json", HTTP_HOST=http_host
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        def test_batch_size_is_limited(
+            self, admin_api_client, bulk_url, http_host, mocker
+        ):
+            mocker.patch(
+                "projecthub.tasks.api.v1.views.bulk.TaskBulkAPIView.max_batch_size", 2
+            )
+            data = [{"name": "task"}] * 3
+
+            response = admin_api_client.post(
+                bulk_url, data, format="json", HTTP_HOST=http_host
+            )
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    class TestUpdate:
+
+        def test_updates_tasks(
+            self,
+            api_client,
+            bulk_url,
+            http_host,
+            active_project,
+            board,
+            task_factory,
+            project_user,
+        ):
+            first = task_factory(project=active_project, board=board, priority=1)
+            second = task_factory(project=active_project, board=board)
+            api_client.force_authenticate(user=active_project.owner)
+            data = [
+                {"id": str(first.pk), "priority": 7},
+                {"id": str(second.pk), "responsible": str(project_user.pk)},
+            ]
+
+            response = api_client.patch(
+                bulk_url, data, format="json", HTTP_HOST=http_host
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            first.refresh_from_db()
+            second.refresh_from_db()
+            assert first.priority == 7
+            assert first.updated_by == active_project.owner
+            assert second.responsible == project_user
+            notification = Notification.objects.get(recipient=project_user)
+            assert notification.payload == {"task_id": str(second.pk)}
+
+        def test_unknown_and_duplicate_ids(
+            self,
+            admin_api_client,
+            bulk_url,
+            http_host,
+            active_project,
+            board,
+            task_factory,
+        ):
+            task = task_factory(project=active_project, board=board, priority=1)
+            other_project_task = task_factory()
+            data = [
+                {"id": str(task.pk), "priority": 2},
+                {"id": str(task.pk), "priority": 3},
+                {"id": str(other_project_task.pk), "priority": 3},
+                {"id": "not-uuid"},
+            ]
+
+            response = admin_api_client.patch(
+                bulk_url, data, format="json", HTTP_HOST=http_host
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.data[0] == {}
+            assert all("id" in errors for errors in response.data[1:])
+            task.refresh_from_db()
+            assert task.priority == 1
+
+    class TestNumQueries:
+
+        @pytest.mark.parametrize("count", [1, 20])
+        def test_does_not_depend_on_number_of_items(
+            self,
+            api_client,
+            bulk_url,
+            http_host,
+            active_project,
+            board,
+            project_user,
+            django_assert_num_queries,
+            count,
+        ):
+            api_client.force_authenticate(user=active_project.owner)
+            data = [
+                {
+                    "name": f"task {i}",
+                    "board": str(board.pk),
+                    "responsible": str(project_user.pk),
+                }
+                for i in range(count)
+            ]
+
+            # tenant, project, boards, members, savepoint, insert tasks,
+            # project stats (status, board, responsible: update, create
+            # and update again), insert notifications, release
+            with django_assert_num_queries(15):
+                response = api_client.post(
+                    bulk_url, data, format="json", HTTP_HOST=http_host
+                )
+            assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+class TestTaskBulkMoveAPIView:
+
+    def test_moves_tasks(
+        self, admin_api_client, move_url, http_host, active_project, board, task_factory
+    ):
+        done = active_project.boards.create(name="Done", order=2)
+        tasks = task_factory.create_batch(3, project=active_project, board=board)
+        data = [
+            {"id": str(task.pk), "board": str(done.pk), "priority": i}
+            for i, task in enumerate(tasks)
+        ]
+
+        response = admin_api_client.post(
+            move_url, data, format="json", HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {t["board"] for t in response.data} == {"Done"}
+        moved = Task.objects.filter(board=done).order_by("priority")
+        assert list(moved) == tasks
+
+    def test_archived_project_is_rejected(
+        self, admin_api_client, move_url, http_host, active_project, board, task_factory
+    ):
+        done = active_project.boards.create(name="Done", order=2)
+        task = task_factory(project=active_project, board=board)
+        active_project.status = active_project.Status.ARCHIVED
+        active_project.save()
+        data = [{"id": str(task.pk), "board": str(done.pk), "priority": 1}]
+
+        response = admin_api_client.post(
+            move_url, data, format="json", HTTP_HOST=http_host
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        task.refresh_from_db()
+        assert task.board == board
+
+    def test_board_is_required(
+        self, admin_api_client, move_url, http_host, active_project, board, task_factory
+    ):
+        task = task_factory(project=active_project, board=board)
+
+        response = admin_api_client.post(
+            move_url, [{"id": str(task.pk)}], format="json", HTTP_HOST=http_host
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "board" in response.data[0]
+
+    class TestProjectUser:
+
+        def test_moves_own_tasks(
+            self,
+            api_client,
+            move_url,
+            http_host,
+            active_project,
+            board,
+            task_factory,
+            project_user,
+        ):
+            done = active_project.boards.create(name="Done", order=2)
+            task = task_factory(
+                project=active_project, board=board, responsible=project_user
+            )
+            api_client.force_authenticate(user=project_user)
+
+            response = api_client.post(
+                move_url,
+                [{"id": str(task.pk), "board": str(done.pk)}],
+                format="json",
+                HTTP_HOST=http_host,
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            task.refresh_from_db()
+            assert task.board == done
+
+        def test_cannot_move_others_tasks(
+            self,
+            api_client,
+            move_url,
+            http_host,
+            active_project,
+            board,
+            task_factory,
+            project_user,
+        ):
+            task = task_factory(project=active_project, board=board)
+            api_client.force_authenticate(user=project_user)
+
+            response = api_client.post(
+                move_url,
+                [{"id": str(task.pk), "board": str(board.pk)}],
+                format="json",
+                HTTP_HOST=http_host,
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.data[0] == {"id": ["Not found."]}
+
+        def test_cannot_change_priority(
+            self,
+            api_client,
+            move_url,
+            http_host,
+            active_project,
+            board,
+            task_factory,
+            project_user,
+        ):
+            task = task_factory(
+                project=active_project, board=board, responsible=project_user
+            )
+            api_client.force_authenticate(user=project_user)
+
+            response = api_client.post(
+                move_url,
+                [{"id": str(task.pk), "board": str(board.pk), "priority": 1}],
+                format="json",
+                HTTP_HOST=http_host,
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "priority" in response.data[0]
@@ -0,0 +1,142 @@
+import pytest
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from projecthub.projects.models import ProjectMembership
+
+
+@pytest.fixture
+def url(active_project):
+    return reverse("api:v1:kanban", kwargs={"project_id": active_project.pk})
+
+
+@pytest.fixture
+def boards(active_project, board_factory):
+    return [
+        board_factory(project=active_project, name="Done", order=2),
+        board_factory(project=active_project, name="To Do", order=1),
+    ]
+
+
+@pytest.mark.django_db
+class TestKanbanAPIView:
+
+    class TestPermissions:
+
+        def test_anonymous(self, api_client, url, http_host):
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        def test_not_project_member(
+            self, api_client, url, http_host, tenant, tenant_membership_factory
+        ):
+            tenant_membership = tenant_membership_factory(tenant=tenant)
+            api_client.force_authenticate(user=tenant_membership.user)
+
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        def test_project_user(self, api_client, url, http_host, active_project_user):
+            api_client.force_authenticate(user=active_project_user.user)
+
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+        def test_read_only(self, admin_client, url, http_host):
+            response = admin_client.post(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_boards_are_ordered_with_their_tasks(
+        self, admin_client, url, http_host, boards, active_project, task_factory
+    ):
+        done, todo = boards
+        low = task_factory(project=active_project, board=todo, priority=5)
+        high = task_factory(project=active_project, board=todo, priority=1)
+        task_factory(project=active_project, board=None)
+
+        response = admin_client.get(url, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_200_OK
+        assert [b["id"] for b in response.data] == [str(todo.pk), str(done.pk)]
+
+        todo_data, done_data = response.data
+        assert [t["id"] for t in todo_data["tasks"]] == [str(high.pk), str(low.pk)]
+        assert todo_data["tasks"][0]["board"] == "To Do"
+        assert todo_data["tasks_count"] == 2
+        assert todo_data["next"] is None
+        assert done_data["tasks"] == []
+        assert done_data["tasks_count"] == 0
+
+    def test_load_more_continues_in_task_list(
+        self, admin_client, url, http_host, boards, active_project, task_factory
+    ):
+        done, todo = boards
+        tasks = [
+            task_factory(project=active_project, board=todo, priority=priority)
+            for priority in range(1, 6)
+        ]
+        task_factory(project=active_project, board=done)
+
+        response = admin_client.get(url, {"tasks_per_board": 2}, HTTP_HOST=http_host)
+        todo_data = response.data[0]
+        assert [t["id"] for t in todo_data["tasks"]] == [str(t.pk) for t in tasks[:2]]
+        assert todo_data["tasks_count"] == 5
+        assert response.data[1]["next"] is None
+
+        next_url = todo_data["next"]
+        response = admin_client.get(next_url, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_200_OK
+        assert [t["id"] for t in response.data["results"]] == [
+            str(t.pk) for t in tasks[2:4]
+        ]
+
+        response = admin_client.get(response.data["next"], HTTP_HOST=http_host)
+        assert [t["id"] for t in response.data["results"]] == [str(tasks[4].pk)]
+        assert response.data["next"] is None
+
+    def test_project_user_sees_only_own_tasks(
+        self,
+        api_client,
+        url,
+        http_host,
+        boards,
+        active_project,
+        project_membership_factory,
+        task_factory,
+    ):
+        done, todo = boards
+        membership = project_membership_factory(
+            project=active_project, role=ProjectMembership.Role.USER
+        )
+        own_task = task_factory(
+            project=active_project, board=todo, responsible=membership.user
+        )
+        task_factory(project=active_project, board=todo)
+
+        api_client.force_authenticate(user=membership.user)
+        response = api_client.get(url, HTTP_HOST=http_host)
+
+        todo_data = response.data[0]
+        assert [t["id"] for t in todo_data["tasks"]] == [str(own_task.pk)]
+        assert todo_data["tasks_count"] == 1
+
+    class TestNumQueries:
+
+        def test_number_of_queries_does_not_depend_on_boards_and_tasks(
+            self,
+            api_client,
+            url,
+            http_host,
+            active_project,
+            board_factory,
+            task_factory,
+            django_assert_num_queries,
+        ):
+            for order in range(1, 4):
+                board = board_factory(project=active_project, order=order)
+                task_factory.create_batch(3, project=active_project, board=board)
+            api_client.force_authenticate(user=active_project.owner)
+
+            # tenant, project, boards, tasks
+            with django_assert_num_queries(4):
+                response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,65 @@
+import pytest
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+
+@pytest.fixture
+def url(active_project):
+    return reverse("api:v1:project_stats", kwargs={"project_id": active_project.pk})
+
+
+@pytest.mark.django_db
+class TestProjectStatsAPIView:
+
+    class TestPermissions:
+
+        def test_anonymous(self, api_client, url, http_host):
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        def test_project_user(self, api_client, url, http_host, active_project_user):
+            api_client.force_authenticate(user=active_project_user.user)
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        def test_project_owner(self, api_client, url, http_host, active_project):
+            api_client.force_authenticate(user=active_project.owner)
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+        def test_project_supervisor(self, api_client, url, http_host, active_project):
+            api_client.force_authenticate(user=active_project.supervisor)
+            response = api_client.get(url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+    def test_stats(self, admin_client, url, http_host, active_project, task_factory):
+        task = task_factory(project=active_project, responsible=None)
+
+        response = admin_client.get(url, HTTP_HOST=http_host)
+
+        assert response.data == {
+            "open_tasks": 1,
+            "closed_tasks": 0,
+            "overdue_tasks": 0,
+            "tasks_per_board": [{"board": str(task.board_id), "count": 1}],
+            "tasks_per_responsible": [{"responsible": None, "count": 1}],
+        }
+
+    @pytest.mark.parametrize("count", [1, 20])
+    def test_num_queries_does_not_depend_on_number_of_tasks(
+        self,
+        api_client,
+        url,
+        http_host,
+        active_project,
+        task_factory,
+        django_assert_num_queries,
+        count,
+    ):
+        task_factory.create_batch(count, project=active_project)
+        api_client.force_authenticate(user=active_project.owner)
+
+        # tenant, project and counters
+        with django_assert_num_queries(3):
+            response = api_client.get(url, HTTP_HOST=http_host)
+        assert response.data["open_tasks"] == count
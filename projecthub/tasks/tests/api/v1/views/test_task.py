@@ -1,8 +1,11 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.reverse import reverse
 
 from projecthub.tasks.models import Task
+from projecthub.tasks.services import bulk_create_tasks
 
 
 @pytest.fixture
@@ -229,6 +232,43 @@ class TestTaskListCreateAPIView:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 3
 
+    def test_cursor_pagination_walks_all_tasks_without_count(
+        self,
+        admin_client,
+        list_url,
+        active_project,
+        task_factory,
+        http_host,
+    ):
+        tasks = task_factory.create_batch(5, project=active_project, priority=1)
+        params = {"pagination": "cursor", "page_size": 3, "ordering": "priority"}
+
+        response = admin_client.get(list_url, params, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        ids = [t["id"] for t in response.data["results"]]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = admin_client.get(response.data["next"], HTTP_HOST=http_host)
+        ids += [t["id"] for t in response.data["results"]]
+
+        sqls = [q["sql"].upper() for q in ctx.captured_queries]
+        assert not any("COUNT(" in sql or "OFFSET" in sql for sql in sqls)
+
+        assert response.data["next"] is None
+        assert sorted(ids) == sorted(str(t.pk) for t in tasks)
+
+    def test_cursor_pagination_rejects_unsupported_ordering(
+        self, admin_client, list_url, http_host
+    ):
+        params = {"pagination": "cursor", "ordering": "end_date"}
+        response = admin_client.get(list_url, params, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalid_cursor(self, admin_client, list_url, http_host):
+        response = admin_client.get(list_url, {"cursor": "zzz"}, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_perform_create(
         self, admin_client, list_url, admin_user, active_project, http_host
     ):
@@ -260,13 +300,40 @@ class TestTaskListCreateAPIView:
     def test_search_works(
         self, admin_client, list_url, active_project, task_factory, http_host
     ):
-        abc_task = task_factory(name="abc", project=active_project)
-        qwe_task = task_factory(name="qwe", project=active_project)
+        abc_task = task_factory(name="abc", description="", project=active_project)
+        qwe_task = task_factory(name="qwe", description="", project=active_project)
 
         response = admin_client.get(list_url, {"search": "ab"}, HTTP_HOST=http_host)
         assert response.status_code == status.HTTP_200_OK
         assert {t["id"] for t in response.data["results"]} == {str(abc_task.pk)}
 
+    def test_search_by_description(
+        self, admin_client, list_url, active_project, task_factory, http_host
+    ):
+        task = task_factory(description="fix login page", project=active_project)
+        task_factory(description="write docs", project=active_project)
+
+        response = admin_client.get(list_url, {"search": "login"}, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_200_OK
+        assert [t["id"] for t in response.data["results"]] == [str(task.pk)]
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql", reason="Ranking requires PostgreSQL"
+    )
+    def test_search_results_are_ranked(
+        self, admin_client, list_url, active_project, task_factory, http_host
+    ):
+        # lower priority would come first without ranking
+        in_description = task_factory(
+            name="docs", description="login", priority=1, project=active_project
+        )
+        in_name = task_factory(name="login", priority=10, project=active_project)
+
+        response = admin_client.get(list_url, {"search": "log"}, HTTP_HOST=http_host)
+        assert response.status_code == status.HTTP_200_OK
+        expected_ids = [str(in_name.pk), str(in_description.pk)]
+        assert [t["id"] for t in response.data["results"]] == expected_ids
+
     def test_ordering_works(
         self, admin_client, list_url, active_project, task_factory, http_host
     ):
@@ -278,6 +345,185 @@ class TestTaskListCreateAPIView:
         expected_ids = [str(a_task.pk), str(z_task.pk)]
         assert [t["id"] for t in response.data["results"]] == expected_ids
 
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self,
+            api_client,
+            list_url,
+            http_host,
+            active_project,
+            django_assert_num_queries,
+        ):
+            api_client.force_authenticate(user=active_project.owner)
+
+            with django_assert_num_queries(3):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+        @pytest.mark.parametrize("count", [1, 20])
+        def test_does_not_depend_on_number_of_tasks(
+            self,
+            api_client,
+            list_url,
+            http_host,
+            active_project,
+            board_factory,
+            task_factory,
+            django_assert_num_queries,
+            count,
+        ):
+            for _ in range(count):
+                task_factory(
+                    project=active_project,
+                    board=board_factory(project=active_project),
+                )
+            api_client.force_authenticate(user=active_project.owner)
+
+            # tenant, project, count, tasks with boards and creators
+            with django_assert_num_queries(4):
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["results"]) == count
+
+    class TestConditionalRequests:
+
+        def test_not_modified(self, admin_client, list_url, task, http_host):
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            etag = response["ETag"]
+
+            with CaptureQueriesContext(connection) as ctx:
+                response = admin_client.get(
+                    list_url, HTTP_HOST=http_host, HTTP_IF_NONE_MATCH=etag
+                )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+            assert response["ETag"] == etag
+            # tasks aren't loaded
+            assert not any('"tasks_task"."name"' in q["sql"] for q in ctx)
+
+        @pytest.mark.parametrize("change", ["update", "create", "delete"])
+        def test_modified(
+            self, admin_client, list_url, task, task_factory, http_host, change
+        ):
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            etag = response["ETag"]
+
+            if change == "update":
+                task.save()
+            elif change == "create":
+                task_factory(project=task.project)
+            else:
+                task.delete()
+
+            response = admin_client.get(
+                list_url, HTTP_HOST=http_host, HTTP_IF_NONE_MATCH=etag
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert response["ETag"] != etag
+
+        def test_etag_depends_on_query(self, admin_client, list_url, task, http_host):
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+
+            response = admin_client.get(
+                list_url,
+                {"ordering": "name"},
+                HTTP_HOST=http_host,
+                HTTP_IF_NONE_MATCH=response["ETag"],
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        def test_no_etag_in_cursor_mode(self, admin_client, list_url, task, http_host):
+            response = admin_client.get(
+                list_url, {"pagination": "cursor"}, HTTP_HOST=http_host
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert "ETag" not in response
+
+        @pytest.mark.usefixtures("shared_response_cache")
+        def test_not_modified_from_cache(
+            self, admin_client, list_url, task, http_host, django_assert_num_queries
+        ):
+            etag = admin_client.get(list_url, HTTP_HOST=http_host)["ETag"]
+
+            # tenant and project for policies
+            with django_assert_num_queries(2):
+                response = admin_client.get(
+                    list_url, HTTP_HOST=http_host, HTTP_IF_NONE_MATCH=etag
+                )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.usefixtures("shared_response_cache")
+    class TestResponseCache:
+
+        def test_cached_until_task_changes(
+            self, admin_client, list_url, task, http_host, django_assert_num_queries
+        ):
+            admin_client.get(list_url, HTTP_HOST=http_host)
+
+            # tenant and project for policies
+            with django_assert_num_queries(2):
+                response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response["X-Cache"] == "LOCAL"
+
+            task.name = "renamed"
+            task.save()
+
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response["X-Cache"] == "MISS"
+            assert response.data["results"][0]["name"] == "renamed"
+
+        def test_query_params_are_normalized(
+            self, admin_client, list_url, task, http_host
+        ):
+            admin_client.get(
+                list_url, {"ordering": "name", "page_size": 5}, HTTP_HOST=http_host
+            )
+
+            response = admin_client.get(
+                list_url, {"page_size": 5, "ordering": "name"}, HTTP_HOST=http_host
+            )
+            assert response["X-Cache"] == "LOCAL"
+
+        def test_project_users_see_own_tasks(
+            self,
+            api_client,
+            list_url,
+            active_project,
+            active_project_user,
+            project_membership_factory,
+            task_factory,
+            http_host,
+        ):
+            other_user = project_membership_factory(
+                project=active_project, role=active_project_user.role
+            )
+            for membership in [active_project_user, other_user]:
+                task = task_factory(project=active_project, responsible=membership.user)
+                api_client.force_authenticate(user=membership.user)
+
+                response = api_client.get(list_url, HTTP_HOST=http_host)
+                assert [t["id"] for t in response.data["results"]] == [str(task.pk)]
+
+        def test_bulk_create_invalidates_entries(
+            self, admin_client, list_url, active_project, http_host
+        ):
+            admin_client.get(list_url, HTTP_HOST=http_host)
+            bulk_create_tasks(active_project, [{"name": "new"}], user=None)
+
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response.data["count"] == 1
+
+        def test_new_comment_invalidates_counters(
+            self, admin_client, list_url, task, comment_factory, http_host
+        ):
+            admin_client.get(list_url, HTTP_HOST=http_host)
+            comment_factory(task=task)
+
+            response = admin_client.get(list_url, HTTP_HOST=http_host)
+            assert response["X-Cache"] == "MISS"
+            assert response.data["results"][0]["comment_count"] == 1
+
 
 @pytest.mark.django_db
 class TestTaskRetrieveUpdateDestroyAPIView:
@@ -509,3 +755,74 @@ class TestTaskRetrieveUpdateDestroyAPIView:
 
         # expected serializer has only one attribute 'board'
         assert set(response.data.keys()) == {"board"}
+
+    class TestNumQueries:
+
+        def test_project_lookups_are_not_repeated(
+            self, api_client, detail_url, http_host, task, django_assert_num_queries
+        ):
+            api_client.force_authenticate(user=task.project.owner)
+
+            with django_assert_num_queries(3):
+                response = api_client.get(detail_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+
+    class TestConditionalRequests:
+
+        def test_not_modified(self, admin_client, detail_url, task, http_host):
+            response = admin_client.get(detail_url, HTTP_HOST=http_host)
+            assert response.status_code == status.HTTP_200_OK
+            etag = response["ETag"]
+            assert response["Last-Modified"]
+
+            response = admin_client.get(
+                detail_url, HTTP_HOST=http_host, HTTP_IF_NONE_MATCH=etag
+            )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+
+        def test_not_modified_since(self, admin_client, detail_url, task, http_host):
+            response = admin_client.get(detail_url, HTTP_HOST=http_host)
+
+            response = admin_client.get(
+                detail_url,
+                HTTP_HOST=http_host,
+                HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+            )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        def test_policies_are_checked_first(
+            self, api_client, detail_url, task, user_factory, http_host
+        ):
+            api_client.force_authenticate(user=user_factory())
+
+            response = api_client.get(
+                detail_url, HTTP_HOST=http_host, HTTP_IF_NONE_MATCH="*"
+            )
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        def test_patch_if_match(self, admin_client, detail_url, task, http_host):
+            etag = admin_client.get(detail_url, HTTP_HOST=http_host)["ETag"]
+
+            response = admin_client.patch(
+                detail_url,
+                data={"name": "first"},
+                content_type="application/json",
+                HTTP_HOST=http_host,
+                HTTP_IF_MATCH=etag,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert response["ETag"] != etag
+
+            # stale etag
+            response = admin_client.patch(
+                detail_url,
+                data={"name": "second"},
+                content_type="application/json",
+                HTTP_HOST=http_host,
+                HTTP_IF_MATCH=etag,
+            )
+            assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+            assert response.data == {"detail": "Precondition failed."}
+            task.refresh_from_db()
+            assert task.name == "first"
@@ -0,0 +1,81 @@
+import uuid
+
+import pytest
+from django.core.management import call_command
+
+from projecthub.attachments.models import Attachment
+from projecthub.tasks.counters import reconcile_task_counters
+from projecthub.tasks.models import Task
+
+
+def get_counters(task):
+    task.refresh_from_db()
+    return task.comment_count, task.reply_count, task.attachment_count
+
+
+def attach(**kwargs):
+    return Attachment.objects.create(file=f"attachments/{uuid.uuid4()}.txt", **kwargs)
+
+
+@pytest.mark.django_db
+class TestTaskCounters:
+
+    def test_comments_are_counted(self, task, comment_factory):
+        comment = comment_factory(task=task)
+        comment_factory(task=task, parent=comment)
+        assert get_counters(task) == (2, 1, 0)
+
+    def test_replies_of_deleted_comment_are_not_replies(self, task, comment_factory):
+        comment = comment_factory(task=task)
+        comment_factory.create_batch(2, task=task, parent=comment)
+
+        comment.delete()
+
+        assert get_counters(task) == (2, 0, 0)
+
+    def test_attachments_of_task_and_comments_are_counted(self, task, comment_factory):
+        comment = comment_factory(task=task)
+        attach(task=task)
+        attach(comment=comment)
+        assert get_counters(task) == (1, 0, 2)
+
+        attach(task=task).delete()
+        assert get_counters(task) == (1, 0, 2)
+
+    def test_cascades_are_counted(self, task, comment_factory):
+        comment = comment_factory(task=task)
+        attach(comment=comment)
+
+        comment.delete()
+
+        assert get_counters(task) == (0, 0, 0)
+
+    def test_stale_instance_does_not_overwrite_counters(self, task, comment_factory):
+        comment_factory(task=task)
+
+        task.name = "renamed"
+        task.save()
+
+        assert get_counters(task) == (1, 0, 0)
+
+    def test_reconcile_repairs_drift(self, task, task_factory, comment_factory):
+        other_task = task_factory(project=task.project)
+        comment = comment_factory(task=task)
+        comment_factory(task=task, parent=comment)
+        attach(task=task)
+        Task.objects.filter(pk=task.pk).update(comment_count=10, attachment_count=0)
+
+        assert reconcile_task_counters(dry_run=True) == 1
+        assert get_counters(task) == (10, 1, 0)
+
+        assert reconcile_task_counters(chunk_size=1) == 1
+        assert get_counters(task) == (2, 1, 1)
+        assert get_counters(other_task) == (0, 0, 0)
+
+    def test_reconcile_command(self, task, capsys):
+        Task.objects.filter(pk=task.pk).update(reply_count=3)
+
+        call_command("reconcile_task_counters", project_ids=[str(task.project_id)])
+
+        assert get_counters(task) == (0, 0, 0)
+        assert "1 tasks with drifted counters repaired" in capsys.readouterr().out
@@ -2,9 +2,10 @@ from datetime import datetime
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError, transaction
+from django.db import DatabaseError, IntegrityError, transaction
 from django.utils import timezone
 
+from projecthub.notifications.models import Notification
 from projecthub.tasks.models import Task, Board
 
 
@@ -44,38 +45,73 @@ class TestTask:
         with pytest.raises(ValidationError, match="updated_by is required."):
             task.revoke(updated_by=None)
 
+    def test_save_bumps_updated_at(self, task):
+        updated_at = task.updated_at
+        task.name = "renamed"
+        task.save(update_fields=["name"])
+
+        task.refresh_from_db()
+        assert task.updated_at > updated_at
+
+    def test_save_of_deferred_task_writes_loaded_fields_only(
+        self, task, django_assert_num_queries
+    ):
+        deferred = Task.objects.only("name", "project").get(pk=task.pk)
+        Task.objects.filter(pk=task.pk).update(description="changed meanwhile")
+
+        deferred.name = "renamed"
+        with django_assert_num_queries(1):
+            deferred.save()
+
+        task.refresh_from_db()
+        assert task.name == "renamed"
+        assert task.description == "changed meanwhile"
+
+    class TestChangeTracking:
+
+        def test_loaded_task_has_no_changes(self, task):
+            task = Task.objects.get(pk=task.pk)
+            assert not task.has_changed("responsible")
+
+        def test_has_changed_after_assignment(self, task, user):
+            task = Task.objects.get(pk=task.pk)
+            original = task.responsible_id
+            task.responsible = user
+            assert task.has_changed("responsible")
+            assert task.get_original_value("responsible") == original
+
+        def test_save_resets_original_values(self, task, user):
+            task = Task.objects.get(pk=task.pk)
+            task.responsible = user
+            task.save()
+            assert not task.has_changed("responsible")
+
+        def test_unknown_original_counts_as_changed(self, task):
+            task = Task.objects.only("id").get(pk=task.pk)
+            assert task.has_changed("responsible")
+
     class TestAssignResponsible:
 
-        def test_does_not_call_celery_task_when_new_responsible_is_none(
-            self, task, mocker
-        ):
-            mock_send_task_assignment_email = mocker.patch(
-                "projecthub.tasks.tasks.send_task_assignment_email"
-            )
+        def test_does_not_notify_when_new_responsible_is_none(self, task):
+            Notification.objects.all().delete()
             task.assign_responsible(None)
-            mock_send_task_assignment_email.delay.assert_not_called()
+            assert not Notification.objects.exists()
 
-        def test_calls_celery_task_when_assigning_new_responsible(
-            self, task_factory, user, mocker
-        ):
-            mock_send_task_assignment_email = mocker.patch(
-                "projecthub.tasks.tasks.send_task_assignment_email"
-            )
+        def test_notifies_new_responsible(self, task_factory, user):
             task = task_factory(responsible=None)
             task.assign_responsible(user)
-            mock_send_task_assignment_email.delay.assert_called_once_with(
-                task_id=task.pk, user_id=user.pk
-            )
 
-        def test_does_not_call_celery_task_when_assigning_same_responsible(
-            self, task, mocker
-        ):
-            mock_send_task_assignment_email = mocker.patch(
-                "projecthub.tasks.tasks.send_task_assignment_email"
-            )
-            current_responsible = task.responsible
-            task.assign_responsible(current_responsible)
-            mock_send_task_assignment_email.delay.assert_not_called()
+            notification = Notification.objects.get()
+            assert notification.recipient == user
+            assert notification.kind == Notification.Kind.TASK_ASSIGNED
+            assert notification.payload == {"task_id": str(task.pk)}
+            assert notification.status == Notification.Status.PENDING
+
+        def test_does_not_notify_when_assigning_same_responsible(self, task):
+            Notification.objects.all().delete()
+            task = Task.objects.get(pk=task.pk)
+            task.assign_responsible(task.responsible)
+            assert not Notification.objects.exists()
 
         def test_updates_responsible_field(self, task, user):
             old_responsible = task.responsible
@@ -84,25 +120,34 @@ class TestTask:
             assert task.responsible == user
             assert task.responsible != old_responsible
 
-        def test_calls_celery_task_when_reassigning_responsible(
-            self, task, user, mocker
-        ):
-            mock_send_task_assignment_email = mocker.patch(
-                "projecthub.tasks.tasks.send_task_assignment_email"
-            )
-            task.assign_responsible(user)
-            mock_send_task_assignment_email.delay.assert_called_once_with(
-                task_id=task.pk, user_id=user.pk
+        def test_does_not_read_task_again(self, task, user, django_assert_num_queries):
+            task = Task.objects.get(pk=task.pk)
+            # savepoint, update, project stats of previous and new
+            # responsible (its counter is created and updated again),
+            # insert notification, release
+            with django_assert_num_queries(8) as context:
+                task.assign_responsible(user)
+            assert not any(
+                query["sql"].startswith("SELECT") for query in context.captured_queries
             )
 
-        def test_does_not_call_celery_task_when_removing_responsible(
-            self, task, mocker
-        ):
-            mock_send_task_assignment_email = mocker.patch(
-                "projecthub.tasks.tasks.send_task_assignment_email"
+        def test_notification_is_rolled_back_with_task(self, task, user, mocker):
+            task = Task.objects.get(pk=task.pk)
+            mocker.patch(
+                "projecthub.notifications.models.Notification.save",
+                side_effect=DatabaseError,
             )
-            task.assign_responsible(None)
-            mock_send_task_assignment_email.delay.assert_not_called()
+            with pytest.raises(DatabaseError):
+                task.assign_responsible(user)
+
+            task.refresh_from_db()
+            assert task.responsible != user
+
+        def test_notifies_on_save(self, task, user):
+            task = Task.objects.get(pk=task.pk)
+            task.responsible = user
+            task.save()
+            assert Notification.objects.filter(recipient=user).exists()
 
 
 @pytest.mark.django_db
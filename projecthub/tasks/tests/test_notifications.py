@@ -0,0 +1,54 @@
+import pytest
+from django.core import mail
+
+from projecthub.notifications.models import Notification
+from projecthub.notifications.services import dispatch_notifications
+
+
+@pytest.mark.django_db
+class TestAssignmentNotifications:
+
+    def test_sends_one_email_for_all_assignments(self, user_factory, task_factory):
+        user = user_factory()
+        task1 = task_factory(responsible=user)
+        task2 = task_factory(responsible=user)
+        task_factory(responsible=user_factory())
+
+        dispatch_notifications()
+
+        user_emails = [email for email in mail.outbox if email.to == [user.email]]
+        assert len(user_emails) == 1
+        assert task1.name in user_emails[0].body
+        assert task2.name in user_emails[0].body
+        assert not Notification.objects.filter(status=Notification.Status.PENDING)
+
+    def test_single_assignment(self, user_factory, task_factory):
+        user = user_factory()
+        task = task_factory(responsible=user)
+
+        dispatch_notifications()
+
+        assert mail.outbox[0].subject == f"Вам призначено завдання: {task.name}"
+
+    def test_task_assigned_twice_is_listed_once(self, user_factory, task_factory):
+        user, other = user_factory(), user_factory()
+        task = task_factory(responsible=user)
+        task.assign_responsible(other)
+        task.assign_responsible(user)
+
+        dispatch_notifications()
+
+        user_emails = [email for email in mail.outbox if email.to == [user.email]]
+        assert len(user_emails) == 1
+        assert user_emails[0].subject == f"Вам призначено завдання: {task.name}"
+
+    def test_skips_tasks_reassigned_before_dispatch(self, user_factory, task_factory):
+        user, other = user_factory(), user_factory()
+        task = task_factory(responsible=user)
+        task.assign_responsible(other)
+
+        dispatch_notifications()
+
+        assert [email.to for email in mail.outbox] == [[other.email]]
+        skipped = Notification.objects.get(recipient=user)
+        assert skipped.status == Notification.Status.SKIPPED
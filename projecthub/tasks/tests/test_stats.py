@@ -0,0 +1,118 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from django.utils import timezone
+
+from projecthub.tasks.models import ProjectStatsCounter, Task
+from projecthub.tasks.services import bulk_create_tasks, bulk_update_tasks
+from projecthub.tasks.stats import (
+    ProjectStats,
+    count_project_tasks,
+    get_project_stats,
+    reconcile_project_stats,
+    refresh_project_stats,
+)
+
+
+def get_counters(project):
+    counters = ProjectStatsCounter.objects.filter(project=project).exclude(count=0)
+    return {(c.dimension, c.key): c.count for c in counters}
+
+
+def assert_stats_are_actual(project):
+    assert get_counters(project) == count_project_tasks(project.pk)
+
+
+@pytest.mark.django_db
+class TestProjectStats:
+
+    @pytest.fixture
+    def tasks(self, project, task_factory, board_factory):
+        board = board_factory(project=project)
+        return task_factory.create_batch(
+            3,
+            project=project,
+            board=board,
+            end_date=timezone.now() - timedelta(days=2),
+        )
+
+    def test_created_tasks_are_counted(self, project, tasks):
+        stats = get_project_stats(project.pk)
+
+        assert stats.open_tasks == 3
+        assert stats.overdue_tasks == 3
+        assert stats.tasks_per_board == [{"board": str(tasks[0].board_id), "count": 3}]
+        assert_stats_are_actual(project)
+
+    def test_task_changes_are_counted(self, project, tasks, board_factory, user):
+        first, second, third = tasks
+        first.set_board(board_factory(project=project), updated_by=user)
+        second.revoke(updated_by=user)
+        third.assign_responsible(user)
+        third.close_date = timezone.now()
+        third.save()
+
+        stats = get_project_stats(project.pk)
+        assert (stats.open_tasks, stats.closed_tasks, stats.overdue_tasks) == (2, 1, 2)
+        assert_stats_are_actual(project)
+
+    def test_unsaved_changes_are_not_counted(self, project, tasks):
+        task = tasks[0]
+        task.close_date = timezone.now()
+        task.save(update_fields=["name"])
+
+        assert get_project_stats(project.pk).closed_tasks == 0
+        assert_stats_are_actual(project)
+
+    def test_deferred_fields_are_recounted(self, project, tasks):
+        task = Task.objects.only("pk", "project", "name").get(pk=tasks[0].pk)
+        task.close_date = timezone.now()
+        task.save()
+
+        assert get_project_stats(project.pk).closed_tasks == 1
+        assert_stats_are_actual(project)
+
+    def test_deleted_tasks_are_not_counted(self, project, tasks):
+        tasks[0].delete()
+        tasks[1].board.delete()
+
+        stats = get_project_stats(project.pk)
+        assert stats.open_tasks == 2
+        assert stats.tasks_per_board == [{"board": None, "count": 2}]
+        assert_stats_are_actual(project)
+
+    def test_bulk_changes_are_counted(self, project, tasks, user):
+        bulk_create_tasks(project, [{"name": "new"}], user=user)
+        bulk_update_tasks([(task, {"responsible": user}) for task in tasks], user)
+
+        stats = get_project_stats(project.pk)
+        assert stats.tasks_per_responsible == [
+            {"responsible": str(user.pk), "count": 3},
+            {"responsible": None, "count": 1},
+        ]
+        assert_stats_are_actual(project)
+
+    def test_refresh_repairs_drift(self, project, tasks):
+        Task.objects.filter(pk=tasks[0].pk).update(close_date=timezone.now())
+
+        assert reconcile_project_stats() == 1
+        assert get_project_stats(project.pk).closed_tasks == 1
+        assert_stats_are_actual(project)
+        assert not refresh_project_stats(project.pk)
+
+    def test_overdue_tasks_ended_before_today(self):
+        counters = {
+            ("end_date", "2026-01-01"): 2,
+            ("end_date", "2026-01-02"): 3,
+            ("end_date", "2026-01-03"): 4,
+        }
+        stats = ProjectStats(counters, today=date(2026, 1, 3))
+        assert stats.overdue_tasks == 5
+
+    def test_end_date_is_counted_by_local_day(self, project, task_factory, settings):
+        settings.TIME_ZONE = "Europe/Kyiv"
+        end_date = timezone.make_aware(datetime(2026, 1, 1, 23, 30))
+        task_factory(project=project, end_date=end_date)
+
+        assert get_counters(project)["end_date", "2026-01-01"] == 1
+        assert_stats_are_actual(project)
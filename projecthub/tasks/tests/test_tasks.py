@@ -1,7 +1,19 @@
 import pytest
 from django.core import mail
+from django.utils import timezone
 
-from projecthub.tasks.tasks import send_daily_task_reminders
+from projecthub.notifications.models import Notification
+from projecthub.notifications.services import dispatch_notifications
+from projecthub.tasks.tasks import (
+    dispatch_daily_task_reminders,
+    send_daily_task_reminders,
+    send_task_assignment_digest,
+    send_task_assignment_email,
+)
+
+
+def get_reminder_emails():
+    return [email for email in mail.outbox if email.subject == "Your Tasks for Today"]
 
 
 @pytest.mark.django_db
@@ -16,15 +28,142 @@ class TestSendDailyTaskReminders:
         task3 = task_factory(responsible=user2)
 
         send_daily_task_reminders()
+        dispatch_notifications()
 
-        assert len(mail.outbox) == 2
+        emails = get_reminder_emails()
+        assert len(emails) == 2
 
-        recipients = [email.to[0] for email in mail.outbox]
+        recipients = [email.to[0] for email in emails]
         assert {user1.email, user2.email} == set(recipients)
 
         content_user1 = next(
-            email.body for email in mail.outbox if email.to == [user1.email]
+            email.body for email in emails if email.to == [user1.email]
         )
         assert task1.name in content_user1
         assert task2.name in content_user1
         assert task3.name not in content_user1
+
+    def test_queues_reminders_to_outbox(self, user_factory, task_factory):
+        user = user_factory()
+        task = task_factory(responsible=user)
+
+        result = send_daily_task_reminders()
+
+        notification = Notification.objects.get(kind=Notification.Kind.TASK_REMINDER)
+        assert notification.recipient == user
+        assert notification.payload["tasks"][0][0] == task.name
+        assert result == "1 reminders queued"
+
+    def test_skips_closed_tasks_and_users_without_email(
+        self, user_factory, task_factory
+    ):
+        user = user_factory()
+        task_factory(responsible=user, close_date=timezone.now())
+        task_factory(responsible=user_factory(email=""))
+        task_factory(responsible=None)
+
+        send_daily_task_reminders()
+
+        assert not Notification.objects.filter(
+            kind=Notification.Kind.TASK_REMINDER
+        ).exists()
+
+    def test_task_without_deadline(self, user_factory, task_factory):
+        user = user_factory()
+        task_factory(responsible=user, start_date=None, end_date=None)
+
+        send_daily_task_reminders()
+        dispatch_notifications()
+
+        assert "(deadline: none)" in get_reminder_emails()[0].body
+
+    def test_queues_reminders_in_batches(
+        self, user_factory, task_factory, settings, django_assert_num_queries
+    ):
+        settings.TASK_REMINDERS_BATCH_SIZE = 2
+        for user in user_factory.create_batch(5):
+            task_factory.create_batch(2, responsible=user)
+
+        # select, 3 inserts
+        with django_assert_num_queries(4):
+            send_daily_task_reminders()
+
+        assert (
+            Notification.objects.filter(kind=Notification.Kind.TASK_REMINDER).count()
+            == 5
+        )
+
+    def test_filters_by_tenant(
+        self, tenant_factory, project_factory, user_factory, task_factory
+    ):
+        tenant = tenant_factory()
+        user1, user2 = user_factory(), user_factory()
+        task_factory(
+            responsible=user1, project=project_factory(tenant=tenant), board=None
+        )
+        task_factory(responsible=user2)
+
+        send_daily_task_reminders(tenant.pk)
+
+        reminders = Notification.objects.filter(kind=Notification.Kind.TASK_REMINDER)
+        assert [n.recipient for n in reminders] == [user1]
+
+    def test_reminders_of_several_tenants_are_merged(
+        self, tenant_factory, project_factory, user_factory, task_factory
+    ):
+        user = user_factory()
+        tenants = tenant_factory.create_batch(2)
+        tasks = [
+            task_factory(
+                responsible=user, project=project_factory(tenant=tenant), board=None
+            )
+            for tenant in tenants
+        ]
+
+        for tenant in tenants:
+            send_daily_task_reminders(tenant.pk)
+        dispatch_notifications()
+
+        emails = get_reminder_emails()
+        assert len(emails) == 1
+        assert all(task.name in emails[0].body for task in tasks)
+
+
+@pytest.mark.django_db
+class TestDispatchDailyTaskReminders:
+
+    def test_queues_reminders_per_tenant(self, tenant_factory, mocker):
+        tenants = tenant_factory.create_batch(2)
+        mock_send = mocker.patch(
+            "projecthub.tasks.tasks.send_daily_task_reminders.delay"
+        )
+
+        dispatch_daily_task_reminders()
+
+        assert {call.args[0] for call in mock_send.call_args_list} == {
+            str(tenant.pk) for tenant in tenants
+        }
+
+
+@pytest.mark.django_db
+class TestDeprecatedAssignmentTasks:
+
+    def test_assignment_email_is_queued_to_outbox(self, task):
+        Notification.objects.all().delete()
+
+        send_task_assignment_email(task.pk, task.responsible_id)
+        dispatch_notifications()
+
+        assert [email.to for email in mail.outbox] == [[task.responsible.email]]
+        assert task.name in mail.outbox[0].subject
+
+    def test_digest_queues_recently_assigned_tasks(self, user, task_factory):
+        tasks = task_factory.create_batch(2, responsible=user)
+        task_factory(responsible=user, close_date=timezone.now())
+        Notification.objects.all().delete()
+
+        send_task_assignment_digest(user.pk)
+
+        assert {n.payload["task_id"] for n in Notification.objects.all()} == {
+            str(task.pk) for task in tasks
+        }
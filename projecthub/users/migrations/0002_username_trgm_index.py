@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:33
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+from projecthub.core import operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        operations.CreateExtensionIfAvailable("pg_trgm"),
+        operations.ExtensionAddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("username"),
+                    name="gin_trgm_ops",
+                ),
+                name="user_username_trgm",
+            ),
+            extension="pg_trgm",
+        ),
+    ]